@@ -0,0 +1,12 @@
+import os
+
+from griptape.chunkers import TextChunker
+from griptape.drivers import LocalVectorStoreDriver, OpenAiEmbeddingDriver
+
+vector_store_driver = LocalVectorStoreDriver(
+    embedding_driver=OpenAiEmbeddingDriver(api_key=os.environ["OPENAI_API_KEY"])
+)
+
+with open("large_document.txt") as file:
+    # Chunks are read, embedded, and upserted `upsert_chunk_size` at a time
+    vector_store_driver.upsert_text_artifacts({"docs": TextChunker(max_tokens=100).iter_chunks(file)})
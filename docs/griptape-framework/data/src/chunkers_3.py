@@ -0,0 +1,7 @@
+from griptape.chunkers import TextChunker
+
+chunks = TextChunker(max_tokens=100, overlap_tokens=20).chunk("long text")
+
+for chunk in chunks:
+    # Each chunk is the source text between these offsets
+    print(chunk.meta["start"], chunk.meta["end"])
@@ -0,0 +1,8 @@
+from griptape.drivers import OpenAiEmbeddingDriver, SqliteCacheDriver
+
+embedding_driver = OpenAiEmbeddingDriver(cache_driver=SqliteCacheDriver(database="embeddings.db"))
+
+embedding_driver.embed_string("Hello Griptape!")
+embedding_driver.embed_string("Hello Griptape!")
+
+print(embedding_driver.cache_driver.hits, embedding_driver.cache_driver.misses)
@@ -0,0 +1,20 @@
+import asyncio
+
+from griptape.artifacts import TextArtifact
+from griptape.drivers import OpenAiChatPromptDriver
+
+driver = OpenAiChatPromptDriver(model="gpt-4o")
+
+
+async def main() -> None:
+    # Both prompts are in flight at the same time
+    results = await asyncio.gather(
+        driver.arun(TextArtifact("Name a color.")),
+        driver.arun(TextArtifact("Name a fruit.")),
+    )
+
+    for result in results:
+        print(result.value)
+
+
+asyncio.run(main())
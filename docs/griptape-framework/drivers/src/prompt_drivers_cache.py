@@ -0,0 +1,10 @@
+from griptape.drivers import LocalCacheDriver, OpenAiChatPromptDriver
+
+prompt_driver = OpenAiChatPromptDriver(
+    model="gpt-4o", temperature=0, cache_driver=LocalCacheDriver(max_size=100, ttl=3600)
+)
+
+prompt_driver.run("What is the capital of France?")
+prompt_driver.run("What is the capital of France?")
+
+print(prompt_driver.cache_driver.hits, prompt_driver.cache_driver.misses)
@@ -0,0 +1,18 @@
+from griptape.drivers import OpenAiChatPromptDriver
+from griptape.engines import CsvExtractionEngine
+from griptape.structures import Agent
+from griptape.tasks import ExtractionTask
+
+# Extract from every chunk of long texts concurrently, dropping duplicate rows
+csv_engine = CsvExtractionEngine(
+    prompt_driver=OpenAiChatPromptDriver(model="gpt-4o"),
+    column_names=["name", "age", "location"],
+    parallel=True,
+    deduplicate=True,
+)
+
+agent = Agent()
+# Engine settings can also be overridden per Task with `args`
+agent.add_task(ExtractionTask(extraction_engine=csv_engine, args={"deduplicate": False}))
+
+agent.run("Alice, 28, lives in New York. Bob, 35 lives in California.")
@@ -0,0 +1,31 @@
+from griptape.chunkers import TextChunker
+from griptape.drivers import LocalVectorStoreDriver, OpenAiChatPromptDriver, OpenAiEmbeddingDriver
+from griptape.engines.rag import RagEngine
+from griptape.engines.rag.modules import PromptResponseRagModule, VectorStoreRetrievalRagModule
+from griptape.engines.rag.stages import ResponseRagStage, RetrievalRagStage
+from griptape.loaders import WebLoader
+
+vector_store = LocalVectorStoreDriver(embedding_driver=OpenAiEmbeddingDriver())
+artifact = WebLoader().load("https://www.griptape.ai")
+
+vector_store.upsert_text_artifacts(TextChunker(max_tokens=500).chunk(artifact))
+
+rag_engine = RagEngine(
+    retrieval_stage=RetrievalRagStage(
+        max_chunks=5,
+        retrieval_modules=[VectorStoreRetrievalRagModule(vector_store_driver=vector_store, query_params={"count": 20})],
+    ),
+    response_stage=ResponseRagStage(
+        response_modules=[PromptResponseRagModule(prompt_driver=OpenAiChatPromptDriver(model="gpt-4o"))]
+    ),
+)
+
+queries = [
+    "What does Griptape offer?",
+    "What is Griptape Cloud?",
+    "Which languages does the Griptape Framework support?",
+]
+
+for rag_context in rag_engine.process_batch(queries, batch_size=2):
+    print(rag_context.query, rag_context.stage_timings)
+    print(rag_context.outputs[0].to_text())
@@ -0,0 +1,15 @@
+import requests
+
+from griptape.engines import PromptSummaryEngine
+from griptape.loaders import PdfLoader
+from griptape.structures import Pipeline
+from griptape.tasks import TextSummaryTask
+
+response = requests.get("https://arxiv.org/pdf/1706.03762.pdf")
+artifact = PdfLoader().parse(response.content)
+
+pipeline = Pipeline(
+    tasks=[TextSummaryTask(summary_engine=PromptSummaryEngine(strategy="map_reduce"))],
+)
+
+pipeline.run(artifact.to_text())
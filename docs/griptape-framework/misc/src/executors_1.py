@@ -0,0 +1,16 @@
+from griptape.structures import Workflow
+from griptape.tasks import PromptTask
+from griptape.utils import ExecutorRegistry
+
+ExecutorRegistry.max_workers["io"] = 64
+ExecutorRegistry.max_workers["prompts"] = 4
+
+workflow = Workflow(
+    tasks=[PromptTask(f"Write a haiku about {season}") for season in ["spring", "summer", "autumn", "winter"]],
+    create_futures_executor=lambda: ExecutorRegistry.get_executor("prompts"),
+)
+
+workflow.run()
+
+print(ExecutorRegistry.metrics()["prompts"])
+ExecutorRegistry.shutdown()
@@ -0,0 +1,10 @@
+from griptape.drivers import LocalCacheDriver
+from griptape.tokenizers import OpenAiTokenizer
+
+# A single bounded cache can be shared by every Tokenizer.
+cache_driver = LocalCacheDriver(max_size=10000)
+tokenizer = OpenAiTokenizer(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_4_MODEL, cache_driver=cache_driver)
+
+print(tokenizer.count_tokens("Hello world!"))
+print(tokenizer.count_tokens_batch(["Hello world!", "Hello Griptape!"]))
+print(cache_driver.hits, cache_driver.misses)
@@ -0,0 +1,10 @@
+from griptape.structures import Workflow
+from griptape.tasks import PromptTask
+
+# Write a haiku about each of the seasons, but never run more than two Prompt Tasks at a time.
+workflow = Workflow(
+    tasks=[PromptTask(f"Write a haiku about {season}") for season in ["spring", "summer", "autumn", "winter"]],
+    max_concurrency=2,
+)
+
+workflow.run()
@@ -0,0 +1,10 @@
+import asyncio
+
+from griptape.structures import Workflow
+from griptape.tasks import PromptTask
+
+workflow = Workflow(
+    tasks=[PromptTask(f"Write a haiku about {season}") for season in ["spring", "summer", "autumn", "winter"]],
+)
+
+asyncio.run(workflow.arun())
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import Optional
+from bisect import bisect_left
+from itertools import accumulate
+from typing import TYPE_CHECKING, Optional
 
 from attrs import Attribute, Factory, define, field
 
@@ -10,6 +12,13 @@ from griptape.artifacts.list_artifact import ListArtifact
 from griptape.chunkers import ChunkSeparator
 from griptape.tokenizers import BaseTokenizer, OpenAiTokenizer
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import TextIO
+
+    # The offset of a segment of text in the source, the segment, and the start and end index of its chunks.
+    SegmentType = tuple[int, str, list[tuple[int, int]]]
+
 
 @define
 class BaseChunker(ABC):
@@ -27,26 +36,69 @@ class BaseChunker(ABC):
         default=Factory(lambda self: self.tokenizer.max_input_tokens, takes_self=True),
         kw_only=True,
     )
+    overlap_tokens: int = field(default=0, kw_only=True)
+    stream_buffer_size: int = field(
+        default=Factory(lambda self: max(self.max_tokens, 1) * 64, takes_self=True),
+        kw_only=True,
+    )
 
     @max_tokens.validator  # pyright: ignore[reportAttributeAccessIssue]
     def validate_max_tokens(self, _: Attribute, max_tokens: int) -> None:
         if max_tokens < 0:
             raise ValueError("max_tokens must be 0 or greater.")
 
+    @overlap_tokens.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_overlap_tokens(self, _: Attribute, overlap_tokens: int) -> None:
+        if overlap_tokens < 0 or (overlap_tokens and overlap_tokens >= self.max_tokens):
+            raise ValueError("overlap_tokens must be 0 or greater and less than max_tokens.")
+
+    @stream_buffer_size.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_stream_buffer_size(self, _: Attribute, stream_buffer_size: int) -> None:
+        if stream_buffer_size < 1:
+            raise ValueError("stream_buffer_size must be greater than 0.")
+
     def chunk(self, text: TextArtifact | ListArtifact | str) -> list[TextArtifact]:
         text = text.to_text() if isinstance(text, (TextArtifact, ListArtifact)) else text
 
-        return [TextArtifact(c) for c in self._chunk_recursively(text)]
+        return list(self.__iter_text_artifacts([(0, text, self._chunk_recursively(text))]))
+
+    def iter_chunks(self, source: TextArtifact | str | TextIO | Iterable[str]) -> Iterator[TextArtifact]:
+        """Lazily chunks text from a string, a text stream, or an iterator of strings.
 
-    def _chunk_recursively(self, chunk: str, current_separator: Optional[ChunkSeparator] = None) -> list[str]:
+        At most `stream_buffer_size` characters are buffered at a time. Once the buffer is full, it is cut at the last
+        occurrence of the highest priority separator in its second half, and the text before the cut is chunked.
+
+        Args:
+            source: Text to chunk. Text streams are read `stream_buffer_size` characters at a time.
+
+        Returns:
+            An iterator of chunks, in the order they appear in the source.
+        """
+        return self.__iter_text_artifacts(self.__iter_segments(source))
+
+    def _chunk_recursively(
+        self,
+        text: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        current_separator: Optional[ChunkSeparator] = None,
+        subchunk_token_counts: Optional[dict[tuple[str, bool], dict[str, int]]] = None,
+    ) -> list[tuple[int, int]]:
+        """Splits `text[start:end]` into chunks of at most `max_tokens - overlap_tokens` tokens.
+
+        Returns:
+            The start and end index of each chunk in `text`.
+        """
+        end = len(text) if end is None else end
+        # Token counts of subchunks by separator, shared by the whole recursion. Subchunks split off by a separator
+        # are split into the same subchunks again further down, so each of them only gets tokenized once.
+        subchunk_token_counts = {} if subchunk_token_counts is None else subchunk_token_counts
+        chunk = text[start:end]
         token_count = self.tokenizer.count_tokens(chunk)
 
-        if token_count <= self.max_tokens:
-            return [chunk]
+        if token_count <= self.max_tokens - self.overlap_tokens:
+            return [(start, end)]
         else:
-            balance_index = -1
-            balance_diff = float("inf")
-            tokens_count = 0
             half_token_count = token_count // 2
 
             # If a separator is provided, only use separators after it.
@@ -57,52 +109,198 @@ class BaseChunker(ABC):
             # Loop through available separators to find the best split.
             for separator in separators:
                 # Split the chunk into subchunks using the current separator.
-                subchunks = list(filter(None, chunk.split(separator.value)))
+                subchunks, subchunk_starts = self.__split(chunk, separator)
 
                 # Check if the split resulted in more than one subchunk.
                 if len(subchunks) > 1:
-                    # Iterate through the subchunks and calculate token counts.
-                    for index, subchunk in enumerate(subchunks):
-                        if index < len(subchunks):
-                            subchunk = separator.value + subchunk if separator.is_prefix else subchunk + separator.value
+                    token_counts = subchunk_token_counts.setdefault((separator.value, separator.is_prefix), {})
+                    balance_index = self.__get_balance_index(separator, subchunks, half_token_count, token_counts)
 
-                        tokens_count += self.tokenizer.count_tokens(subchunk)
-
-                        # Update the best split if the current one is more balanced.
-                        if abs(tokens_count - half_token_count) < balance_diff:
-                            balance_index = index
-                            balance_diff = abs(tokens_count - half_token_count)
-
-                    # Create the two subchunks based on the best separator.
-                    first_subchunk, second_subchunk = self.__get_subchunks(separator, subchunks, balance_index)
+                    # Split before the separator if it's a prefix of the next subchunk, after it otherwise.
+                    split_index = start + subchunk_starts[balance_index + 1]
+                    if separator.is_prefix:
+                        split_index -= len(separator.value)
 
                     # Continue recursively chunking the subchunks.
-                    first_subchunk_rec = self._chunk_recursively(first_subchunk.strip(), separator)
-                    second_subchunk_rec = self._chunk_recursively(second_subchunk.strip(), separator)
-
-                    # Return the concatenated results of the subchunks if both are non-empty.
-                    if first_subchunk_rec and second_subchunk_rec:
-                        return first_subchunk_rec + second_subchunk_rec
-                    # If only one subchunk is non-empty, return it.
-                    elif first_subchunk_rec:
-                        return first_subchunk_rec
-                    elif second_subchunk_rec:
-                        return second_subchunk_rec
-                    else:
-                        return []
+                    return self._chunk_recursively(
+                        text, *self.__strip(text, start, split_index), separator, subchunk_token_counts
+                    ) + self._chunk_recursively(
+                        text, *self.__strip(text, split_index, end), separator, subchunk_token_counts
+                    )
             # If none of the separators result in a balanced split, split the chunk in half.
-            midpoint = len(chunk) // 2
-            return self._chunk_recursively(chunk[:midpoint]) + self._chunk_recursively(chunk[midpoint:])
-
-    def __get_subchunks(self, separator: ChunkSeparator, subchunks: list[str], balance_index: int) -> tuple[str, str]:
-        # Create the two subchunks based on the best separator.
-        if separator.is_prefix:
-            # If the separator is a prefix, append it before this subchunk.
-            first_subchunk = separator.value + separator.value.join(subchunks[: balance_index + 1])
-            second_subchunk = separator.value + separator.value.join(subchunks[balance_index + 1 :])
+            midpoint = start + len(chunk) // 2
+            return self._chunk_recursively(
+                text, start, midpoint, None, subchunk_token_counts
+            ) + self._chunk_recursively(text, midpoint, end, None, subchunk_token_counts)
+
+    def __iter_segments(self, source: TextArtifact | str | TextIO | Iterable[str]) -> Iterator[SegmentType]:
+        # Yields buffered text cut at separators, along with its offset in the source and its chunks.
+        buffer = ""
+        offset = 0
+
+        for text in self.__iter_source(source):
+            buffer += text
+
+            while len(buffer) >= self.stream_buffer_size:
+                cut_index = self.__get_cut_index(buffer)
+
+                yield self.__get_segment(offset, buffer[:cut_index])
+
+                buffer = buffer[cut_index:]
+                offset += cut_index
+
+        yield self.__get_segment(offset, buffer)
+
+    def __iter_source(self, source: TextArtifact | str | TextIO | Iterable[str]) -> Iterator[str]:
+        if isinstance(source, TextArtifact):
+            source = source.to_text()
+
+        if isinstance(source, str):
+            texts = iter((source,))
+        elif hasattr(source, "read"):
+            texts = iter(lambda: source.read(self.stream_buffer_size), "")  # pyright: ignore[reportAttributeAccessIssue]
+        else:
+            texts = iter(source)
+
+        # Slice long strings so that the buffer never holds much more than `stream_buffer_size` characters.
+        for text in texts:
+            for i in range(0, len(text), self.stream_buffer_size):
+                yield text[i : i + self.stream_buffer_size]
+
+    def __get_segment(self, offset: int, segment: str) -> SegmentType:
+        start, end = self.__strip(segment, 0, len(segment))
+
+        return offset, segment, self._chunk_recursively(segment, start, end) if start < end else []
+
+    def __get_cut_index(self, buffer: str) -> int:
+        # Cut at the highest priority separator in the second half of the buffer so that the text before the cut is
+        # long enough to be chunked on its own, and the separator hierarchy holds across buffer boundaries.
+        start = max(len(buffer) // 2, 1)
+
+        for separator in self.separators:
+            index = buffer.rfind(separator.value, start)
+
+            if index != -1:
+                return index if separator.is_prefix else index + len(separator.value)
+
+        return len(buffer)
+
+    def __iter_text_artifacts(self, segments: Iterable[SegmentType]) -> Iterator[TextArtifact]:
+        # Source text from the start of the previous chunk up to the current segment, so that overlaps can reach back
+        # into earlier segments that are no longer buffered.
+        previous_text = ""
+        previous_span = None
+
+        for offset, segment, spans in segments:
+            for start, end in spans:
+                start, end = start + offset, end + offset
+                chunk_start = start
+
+                if self.overlap_tokens and previous_span is not None:
+                    chunk_start = self.__get_overlap_start(
+                        self.__get_text(previous_text, offset, segment, *previous_span), previous_span[0], start
+                    )
+
+                yield TextArtifact(
+                    self.__get_text(previous_text, offset, segment, chunk_start, end),
+                    meta={"start": chunk_start, "end": end},
+                )
+
+                previous_span = (start, end)
+
+            if previous_span is not None:
+                previous_text = self.__get_text(previous_text, offset, segment, previous_span[0], offset + len(segment))
+
+    def __get_text(self, previous_text: str, offset: int, segment: str, start: int, end: int) -> str:
+        # Gets the source text between two indices, where `previous_text` is the text right before the segment.
+        previous_start = offset - len(previous_text)
+
+        if start >= offset:
+            return segment[start - offset : end - offset]
+        elif end <= offset:
+            return previous_text[start - previous_start : end - previous_start]
         else:
-            # If the separator is not a prefix, append it after this subchunk.
-            first_subchunk = separator.value.join(subchunks[: balance_index + 1]) + separator.value
-            second_subchunk = separator.value.join(subchunks[balance_index + 1 :])
+            return previous_text[start - previous_start :] + segment[: end - offset]
+
+    def __get_overlap_start(self, previous_chunk: str, previous_start: int, start: int) -> int:
+        # Finds the longest suffix of the previous chunk, starting after its lowest priority separator, that fits in
+        # `overlap_tokens`. Suffixes only get shorter, so the boundaries are binary searched.
+        separator = self.separators[-1] if self.separators else None
+        boundaries = [0]
+
+        if separator is not None:
+            _, subchunk_starts = self.__split(previous_chunk, separator)
+            boundaries += [
+                subchunk_start - len(separator.value) if separator.is_prefix else subchunk_start
+                for subchunk_start in subchunk_starts
+                if subchunk_start > 0
+            ]
+
+        low, high = 0, len(boundaries)
+        while low < high:
+            middle = (low + high) // 2
+
+            if self.tokenizer.count_tokens(previous_chunk[boundaries[middle] :].strip()) <= self.overlap_tokens:
+                high = middle
+            else:
+                low = middle + 1
 
-        return first_subchunk, second_subchunk
+        if low == len(boundaries):
+            return start
+        else:
+            overlap_start, _ = self.__strip(previous_chunk, boundaries[low], len(previous_chunk))
+
+            return previous_start + overlap_start
+
+    def __split(self, chunk: str, separator: ChunkSeparator) -> tuple[list[str], list[int]]:
+        # Splits the chunk into non-empty subchunks, along with their start index in the chunk.
+        subchunks = []
+        subchunk_starts = []
+        position = 0
+
+        for subchunk in chunk.split(separator.value):
+            if subchunk:
+                subchunks.append(subchunk)
+                subchunk_starts.append(position)
+            position += len(subchunk) + len(separator.value)
+
+        return subchunks, subchunk_starts
+
+    def __strip(self, text: str, start: int, end: int) -> tuple[int, int]:
+        chunk = text[start:end]
+        stripped_chunk = chunk.lstrip()
+        start += len(chunk) - len(stripped_chunk)
+
+        return start, start + len(stripped_chunk.rstrip())
+
+    def __get_balance_index(
+        self, separator: ChunkSeparator, subchunks: list[str], half_token_count: int, token_counts: dict[str, int]
+    ) -> int:
+        # Finds the first subchunk after which the running token count is closest to half of the chunk's tokens.
+        missing_subchunks = [subchunk for subchunk in dict.fromkeys(subchunks) if subchunk not in token_counts]
+
+        if missing_subchunks:
+            token_counts.update(
+                zip(
+                    missing_subchunks,
+                    self.tokenizer.count_tokens_batch(
+                        [
+                            separator.value + subchunk if separator.is_prefix else subchunk + separator.value
+                            for subchunk in missing_subchunks
+                        ]
+                    ),
+                )
+            )
+
+        # Running token counts never decrease, so the closest ones are on either side of the half. The last subchunk
+        # can't be split after, so only the running counts before it are candidates.
+        running_token_counts = list(accumulate(token_counts[subchunk] for subchunk in subchunks[:-1]))
+        index = bisect_left(running_token_counts, half_token_count)
+
+        if index == len(running_token_counts) or (
+            index > 0
+            and half_token_count - running_token_counts[index - 1] <= running_token_counts[index] - half_token_count
+        ):
+            return bisect_left(running_token_counts, running_token_counts[index - 1])
+        else:
+            return index
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import inspect
 from typing import Any, Callable, TypeVar, cast
 
 import wrapt
@@ -13,20 +14,21 @@ def observable(*dargs: Any, **dkwargs: Any) -> Callable:
         from griptape.common.observable import Observable
         from griptape.observability.observability import Observability
 
-        return cast(
-            T,
-            Observability.observe(
-                Observable.Call(
-                    func=wrapped,
-                    instance=instance,
-                    args=args,
-                    kwargs=kwargs,
-                    decorator_args=dargs,
-                    decorator_kwargs=dkwargs,
-                )
-            ),
+        call = Observable.Call(
+            func=wrapped,
+            instance=instance,
+            args=args,
+            kwargs=kwargs,
+            decorator_args=dargs,
+            decorator_kwargs=dkwargs,
         )
 
+        # Coroutine functions get a coroutine back, so that the observation lasts until it is awaited
+        if inspect.iscoroutinefunction(wrapped):
+            return cast(T, Observability.aobserve(call))
+
+        return cast(T, Observability.observe(call))
+
     # Check if it's being called as @observable or @observable(...)
     if len(dargs) == 1 and callable(dargs[0]) and not dkwargs:  # pyright: ignore[reportArgumentType]
         # Case when decorator is used without arguments
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from attrs import Factory, define, field
+
+from griptape.mixins.serializable_mixin import SerializableMixin
+
+
+@define
+class BaseCacheDriver(SerializableMixin, ABC):
+    """Base Cache Driver.
+
+    Cache Drivers store JSON-serializable values by key. A stored value of `None` is indistinguishable from a miss.
+
+    Attributes:
+        ttl: Default number of seconds before a cached value expires. Values never expire if `None`.
+        hits: Number of lookups that found a cached value.
+        misses: Number of lookups that did not find a cached value.
+        lock: Lock guarding `hits`, `misses`, and the state of the backend.
+    """
+
+    ttl: Optional[float] = field(default=None, kw_only=True, metadata={"serializable": True})
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), kw_only=True, alias="lock")
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: list[str]) -> list[Optional[Any]]:
+        values = self.try_get_many(keys) if keys else []
+        hits = sum(value is not None for value in values)
+
+        with self._lock:
+            self.hits += hits
+            self.misses += len(keys) - hits
+
+        return values
+
+    def set(self, key: str, value: Any, *, ttl: Optional[float] = None) -> None:
+        self.set_many({key: value}, ttl=ttl)
+
+    def set_many(self, values: dict[str, Any], *, ttl: Optional[float] = None) -> None:
+        if values:
+            self.try_set_many(values, ttl=self.ttl if ttl is None else ttl)
+
+    @abstractmethod
+    def try_get_many(self, keys: list[str]) -> list[Optional[Any]]: ...
+
+    @abstractmethod
+    def try_set_many(self, values: dict[str, Any], *, ttl: Optional[float]) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
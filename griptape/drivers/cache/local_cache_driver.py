@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from attrs import define, field
+
+from griptape.drivers import BaseCacheDriver
+
+
+@define
+class LocalCacheDriver(BaseCacheDriver):
+    """In-memory Cache Driver that evicts the least recently used values.
+
+    Attributes:
+        max_size: Maximum number of values to keep. Unbounded if `None`.
+    """
+
+    max_size: Optional[int] = field(default=1000, kw_only=True, metadata={"serializable": True})
+    _entries: OrderedDict[str, tuple[Any, Optional[float]]] = field(factory=OrderedDict, alias="entries")
+
+    def try_get_many(self, keys: list[str]) -> list[Optional[Any]]:
+        now = time.monotonic()
+        values = []
+
+        with self._lock:
+            for key in keys:
+                value, expires_at = self._entries.get(key, (None, None))
+
+                if expires_at is not None and expires_at <= now:
+                    del self._entries[key]
+                    value = None
+                elif value is not None:
+                    self._entries.move_to_end(key)
+
+                values.append(value)
+
+        return values
+
+    def try_set_many(self, values: dict[str, Any], *, ttl: Optional[float]) -> None:
+        expires_at = None if ttl is None else time.monotonic() + ttl
+
+        with self._lock:
+            for key, value in values.items():
+                self._entries[key] = (value, expires_at)
+                self._entries.move_to_end(key)
+
+            while self.max_size is not None and len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Optional
+
+from attrs import define, field
+
+from griptape.drivers import BaseCacheDriver
+from griptape.utils import import_optional_dependency
+from griptape.utils.decorators import lazy_property
+
+if TYPE_CHECKING:
+    from redis import Redis
+
+
+@define
+class RedisCacheDriver(BaseCacheDriver):
+    """Cache Driver for Redis.
+
+    Values are stored as JSON strings and expire using Redis key expiration.
+
+    Attributes:
+        host: The host of the Redis instance.
+        port: The port of the Redis instance.
+        db: The database of the Redis instance.
+        password: The password of the Redis instance.
+        key_prefix: Prefix added to every cache key.
+        client: Optionally provide a custom `redis.Redis` client.
+    """
+
+    host: str = field(kw_only=True, metadata={"serializable": True})
+    port: int = field(kw_only=True, metadata={"serializable": True})
+    db: int = field(kw_only=True, default=0, metadata={"serializable": True})
+    password: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": False})
+    key_prefix: str = field(default="griptape:cache:", kw_only=True, metadata={"serializable": True})
+    _client: Redis = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
+
+    @lazy_property()
+    def client(self) -> Redis:
+        return import_optional_dependency("redis").Redis(
+            host=self.host,
+            port=self.port,
+            db=self.db,
+            password=self.password,
+            decode_responses=False,
+        )
+
+    def try_get_many(self, keys: list[str]) -> list[Optional[Any]]:
+        values = self.client.mget([self.key_prefix + key for key in keys])
+
+        return [None if value is None else json.loads(value) for value in values]  # pyright: ignore[reportGeneralTypeIssues]
+
+    def try_set_many(self, values: dict[str, Any], *, ttl: Optional[float]) -> None:
+        pipeline = self.client.pipeline(transaction=False)
+
+        for key, value in values.items():
+            pipeline.set(self.key_prefix + key, json.dumps(value), px=None if ttl is None else int(ttl * 1000))
+
+        pipeline.execute()
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.key_prefix + key)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Optional
+
+from attrs import define, field
+
+from griptape.drivers import BaseCacheDriver
+from griptape.utils.decorators import lazy_property
+
+
+@define
+class SqliteCacheDriver(BaseCacheDriver):
+    """Cache Driver that persists values to a local SQLite database.
+
+    Attributes:
+        database: Path to the SQLite database file. Created if it does not exist.
+        table_name: Name of the table to store values in.
+    """
+
+    MAX_QUERY_PARAMETERS = 500
+
+    database: str = field(kw_only=True, metadata={"serializable": True})
+    table_name: str = field(default="griptape_cache", kw_only=True, metadata={"serializable": True})
+    _connection: sqlite3.Connection = field(default=None, kw_only=True, alias="connection")
+
+    @lazy_property()
+    def connection(self) -> sqlite3.Connection:
+        directory = os.path.dirname(self.database)
+
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        connection = sqlite3.connect(self.database, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table_name} (key TEXT PRIMARY KEY, value TEXT, expires_at REAL)"
+        )
+
+        return connection
+
+    def try_get_many(self, keys: list[str]) -> list[Optional[Any]]:
+        now = time.time()
+        rows = {}
+
+        with self._lock:
+            for i in range(0, len(keys), self.MAX_QUERY_PARAMETERS):
+                batch = keys[i : i + self.MAX_QUERY_PARAMETERS]
+                placeholders = ",".join("?" * len(batch))
+
+                rows.update(
+                    (key, (value, expires_at))
+                    for key, value, expires_at in self.connection.execute(
+                        f"SELECT key, value, expires_at FROM {self.table_name} WHERE key IN ({placeholders})",
+                        batch,
+                    )
+                )
+
+            expired_keys = [
+                key for key, (_, expires_at) in rows.items() if expires_at is not None and expires_at <= now
+            ]
+
+            if expired_keys:
+                self.connection.executemany(
+                    f"DELETE FROM {self.table_name} WHERE key = ?", [(key,) for key in expired_keys]
+                )
+
+        return [json.loads(rows[key][0]) if key in rows and key not in expired_keys else None for key in keys]
+
+    def try_set_many(self, values: dict[str, Any], *, ttl: Optional[float]) -> None:
+        expires_at = None if ttl is None else time.time() + ttl
+
+        with self._lock:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, value, expires_at) VALUES (?, ?, ?)",
+                [(key, json.dumps(value), expires_at) for key, value in values.items()],
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self.connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
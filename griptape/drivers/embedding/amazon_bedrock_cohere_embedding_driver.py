@@ -34,7 +34,7 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
     DEFAULT_MODEL = "cohere.embed-english-v3"
 
     model: str = field(default=DEFAULT_MODEL, kw_only=True)
-    input_type: str = field(default="search_query", kw_only=True)
+    input_type: str = field(default="search_query", kw_only=True, metadata={"serializable": True})
     session: boto3.Session = field(default=Factory(lambda: import_optional_dependency("boto3").Session()), kw_only=True)
     tokenizer: BaseTokenizer = field(
         default=Factory(lambda self: AmazonBedrockTokenizer(model=self.model), takes_self=True),
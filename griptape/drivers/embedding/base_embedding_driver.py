@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Optional
 
@@ -9,9 +10,11 @@ from attrs import define, field
 from griptape.chunkers import BaseChunker, TextChunker
 from griptape.mixins.exponential_backoff_mixin import ExponentialBackoffMixin
 from griptape.mixins.serializable_mixin import SerializableMixin
+from griptape.utils import str_to_hash
 
 if TYPE_CHECKING:
     from griptape.artifacts import TextArtifact
+    from griptape.drivers import BaseCacheDriver
     from griptape.tokenizers import BaseTokenizer
 
 
@@ -22,10 +25,19 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     Attributes:
         model: The name of the model to use.
         tokenizer: An instance of `BaseTokenizer` to use when calculating tokens.
+        max_batch_size: Maximum number of strings to embed in a single request by `embed_strings`.
+        max_batch_tokens: Optional maximum number of tokens to embed in a single request by `embed_strings`.
+            Only enforced when a `tokenizer` is set.
+        cache_driver: Optional Cache Driver for reusing embeddings. Embeddings are keyed by the Driver class, the
+            model, its serializable params, and the sha256 hash of the embedded string, so cache hits skip both
+            tokenization and the request.
     """
 
     model: str = field(kw_only=True, metadata={"serializable": True})
     tokenizer: Optional[BaseTokenizer] = field(default=None, kw_only=True)
+    max_batch_size: int = field(default=1, kw_only=True)
+    max_batch_tokens: Optional[int] = field(default=None, kw_only=True)
+    cache_driver: Optional[BaseCacheDriver] = field(default=None, kw_only=True)
     chunker: Optional[BaseChunker] = field(init=False)
 
     def __attrs_post_init__(self) -> None:
@@ -35,6 +47,61 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         return self.embed_string(artifact.to_text())
 
     def embed_string(self, string: str) -> list[float]:
+        if self.cache_driver is None:
+            return self._embed_string(string)
+
+        cache_key = self._get_cache_key(string)
+        embedding = self.cache_driver.get(cache_key)
+
+        if embedding is None:
+            embedding = self._embed_string(string)
+
+            self.cache_driver.set(cache_key, embedding)
+
+        return list(embedding)
+
+    def embed_strings(self, strings: list[str]) -> list[list[float]]:
+        """Embeds multiple strings, grouping them into as few requests as `max_batch_size` and `max_batch_tokens` allow.
+
+        Strings that exceed the tokenizer's `max_input_tokens` are embedded individually.
+
+        Args:
+            strings: Strings to embed.
+
+        Returns:
+            One embedding per string, in the same order as `strings`.
+        """
+        if self.cache_driver is None:
+            return self._embed_strings(strings)
+
+        cache_keys = self._get_cache_keys(strings)
+        embeddings = self.cache_driver.get_many(cache_keys)
+        missed_strings = {cache_keys[i]: strings[i] for i, embedding in enumerate(embeddings) if embedding is None}
+
+        missed_embeddings = {}
+
+        if missed_strings:
+            missed_embeddings = dict(zip(missed_strings.keys(), self._embed_strings(list(missed_strings.values()))))
+
+            self.cache_driver.set_many(missed_embeddings)
+
+        return [
+            list(missed_embeddings[key] if embedding is None else embedding)
+            for key, embedding in zip(cache_keys, embeddings)
+        ]
+
+    @abstractmethod
+    def try_embed_chunk(self, chunk: str) -> list[float]: ...
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        """Embeds a batch of chunks in a single request.
+
+        Drivers whose provider supports batched inputs should override this method. Defaults to embedding each chunk
+        with `try_embed_chunk`.
+        """
+        return [self.try_embed_chunk(chunk) for chunk in chunks]
+
+    def _embed_string(self, string: str) -> list[float]:
         for attempt in self.retrying():
             with attempt:
                 if self.tokenizer is not None and self.tokenizer.count_tokens(string) > self.tokenizer.max_input_tokens:
@@ -45,8 +112,58 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         else:
             raise RuntimeError("Failed to embed string.")
 
-    @abstractmethod
-    def try_embed_chunk(self, chunk: str) -> list[float]: ...
+    def _embed_strings(self, strings: list[str]) -> list[list[float]]:
+        embeddings: list[Optional[list[float]]] = [None] * len(strings)
+        batch: list[int] = []
+        batch_tokens = 0
+
+        for i, string in enumerate(strings):
+            tokens = self.tokenizer.count_tokens(string) if self.tokenizer is not None else 0
+
+            if self.tokenizer is not None and tokens > self.tokenizer.max_input_tokens:
+                embeddings[i] = self._embed_string(string)
+
+                continue
+
+            if batch and (
+                len(batch) >= self.max_batch_size
+                or (self.max_batch_tokens is not None and batch_tokens + tokens > self.max_batch_tokens)
+            ):
+                self._embed_batch(strings, batch, embeddings)
+                batch = []
+                batch_tokens = 0
+
+            batch.append(i)
+            batch_tokens += tokens
+
+        if batch:
+            self._embed_batch(strings, batch, embeddings)
+
+        return [embedding for embedding in embeddings if embedding is not None]
+
+    def _embed_batch(self, strings: list[str], batch: list[int], embeddings: list[Optional[list[float]]]) -> None:
+        for attempt in self.retrying():
+            with attempt:
+                batch_embeddings = self.try_embed_chunks([strings[i] for i in batch])
+
+                if len(batch_embeddings) != len(batch):
+                    raise ValueError(f"Expected {len(batch)} embeddings but received {len(batch_embeddings)}.")
+
+                for i, embedding in zip(batch, batch_embeddings):
+                    embeddings[i] = embedding
+
+                return
+        else:
+            raise RuntimeError("Failed to embed strings.")
+
+    def _get_cache_key(self, string: str) -> str:
+        return self._get_cache_keys([string])[0]
+
+    def _get_cache_keys(self, strings: list[str]) -> list[str]:
+        # Serializable params, such as an input type, change the embeddings, so they are part of the key.
+        params_hash = str_to_hash(json.dumps(self.to_dict(), sort_keys=True, default=str))
+
+        return [f"{self.__class__.__name__}:{self.model}:{params_hash}:{str_to_hash(string)}" for string in strings]
 
     def _embed_long_string(self, string: str) -> list[float]:
         """Embeds a string that is too long to embed in one go.
@@ -20,10 +20,14 @@ class OllamaEmbeddingDriver(BaseEmbeddingDriver):
         model: Ollama embedding model name.
         host: Optional Ollama host.
         client: Ollama `Client`.
+        max_batch_size: Maximum number of inputs per embed request. Defaults to 64.
     """
 
+    DEFAULT_MAX_BATCH_SIZE = 64
+
     model: str = field(kw_only=True, metadata={"serializable": True})
     host: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
+    max_batch_size: int = field(default=DEFAULT_MAX_BATCH_SIZE, kw_only=True)
     _client: Client = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
 
     @lazy_property()
@@ -32,3 +36,6 @@ class OllamaEmbeddingDriver(BaseEmbeddingDriver):
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
         return list(self.client.embeddings(model=self.model, prompt=chunk)["embedding"])
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        return [list(embedding) for embedding in self.client.embed(model=self.model, input=chunks)["embeddings"]]
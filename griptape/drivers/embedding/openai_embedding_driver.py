@@ -21,6 +21,8 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
         organization: OpenAI organization. Defaults to 'OPENAI_ORGANIZATION' environment variable.
         tokenizer: Optionally provide custom `OpenAiTokenizer`.
         client: Optionally provide custom `openai.OpenAI` client.
+        max_batch_size: Maximum number of inputs per embeddings request. Defaults to 2048, OpenAI's limit.
+        max_batch_tokens: Maximum number of tokens per embeddings request. Defaults to 300000, OpenAI's limit.
         azure_deployment: An Azure OpenAi deployment id.
         azure_endpoint: An Azure OpenAi endpoint.
         azure_ad_token: An optional Azure Active Directory token.
@@ -29,6 +31,8 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
     """
 
     DEFAULT_MODEL = "text-embedding-3-small"
+    DEFAULT_MAX_BATCH_SIZE = 2048
+    DEFAULT_MAX_BATCH_TOKENS = 300000
 
     model: str = field(default=DEFAULT_MODEL, kw_only=True, metadata={"serializable": True})
     base_url: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
@@ -38,6 +42,8 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
         default=Factory(lambda self: OpenAiTokenizer(model=self.model), takes_self=True),
         kw_only=True,
     )
+    max_batch_size: int = field(default=DEFAULT_MAX_BATCH_SIZE, kw_only=True)
+    max_batch_tokens: Optional[int] = field(default=DEFAULT_MAX_BATCH_TOKENS, kw_only=True)
     _client: openai.OpenAI = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
 
     @lazy_property()
@@ -51,5 +57,12 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
             chunk = chunk.replace("\n", " ")
         return self.client.embeddings.create(**self._params(chunk)).data[0].embedding
 
-    def _params(self, chunk: str) -> dict:
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        if self.model.endswith("001"):
+            chunks = [chunk.replace("\n", " ") for chunk in chunks]
+        data = self.client.embeddings.create(**self._params(chunks)).data
+
+        return [embedding.embedding for embedding in sorted(data, key=lambda embedding: embedding.index)]
+
+    def _params(self, chunk: str | list[str]) -> dict:
         return {"input": chunk, "model": self.model}
@@ -18,6 +18,8 @@ logger = logging.getLogger(__name__)
 
 @define
 class BaseEventListenerDriver(FuturesExecutorMixin, ExponentialBackoffMixin, ABC):
+    DEFAULT_FUTURES_EXECUTOR_NAME = "events"
+
     batched: bool = field(default=True, kw_only=True)
     batch_size: int = field(default=10, kw_only=True)
 
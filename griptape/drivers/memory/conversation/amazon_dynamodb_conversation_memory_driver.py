@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import json
+import time
 from typing import TYPE_CHECKING, Any, Optional
 
-from attrs import Factory, define, field
+from attrs import Attribute, Factory, define, field
 
 from griptape.drivers import BaseConversationMemoryDriver
 from griptape.utils import import_optional_dependency
@@ -18,6 +19,22 @@ if TYPE_CHECKING:
 
 @define
 class AmazonDynamoDbConversationMemoryDriver(BaseConversationMemoryDriver):
+    """A Conversation Memory Driver for Amazon DynamoDB.
+
+    Attributes:
+        session: The boto3 Session used to access DynamoDB.
+        table_name: The name of the table to store conversations in.
+        partition_key: The name of the table's partition key.
+        value_attribute_key: The name of the attribute that holds the conversation.
+        partition_key_value: The partition key value of the conversation.
+        sort_key: Optional name of the table's sort key.
+        sort_key_value: Optional sort key value of the conversation.
+        run_items: Whether to store each run as a separate item, so that adding a run and loading the most recent runs
+            do not depend on the length of the conversation. Run items share the conversation's partition key value
+            and have a sort key value of `sort_key_value` followed by `#run#` and the time the run was stored.
+            Requires a `sort_key` of type string and a `sort_key_value`.
+    """
+
     session: boto3.Session = field(default=Factory(lambda: import_optional_dependency("boto3").Session()), kw_only=True)
     table_name: str = field(kw_only=True, metadata={"serializable": True})
     partition_key: str = field(kw_only=True, metadata={"serializable": True})
@@ -25,30 +42,51 @@ class AmazonDynamoDbConversationMemoryDriver(BaseConversationMemoryDriver):
     partition_key_value: str = field(kw_only=True, metadata={"serializable": True})
     sort_key: Optional[str] = field(default=None, metadata={"serializable": True})
     sort_key_value: Optional[str | int] = field(default=None, metadata={"serializable": True})
+    run_items: bool = field(default=False, kw_only=True, metadata={"serializable": True})
     _table: Table = field(default=None, kw_only=True, alias="table", metadata={"serializable": False})
 
+    @run_items.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_run_items(self, _: Attribute, run_items: bool) -> None:  # noqa: FBT001
+        if run_items and (self.sort_key is None or self.sort_key_value is None):
+            raise ValueError(f"{self.__class__.__name__} requires a sort_key and a sort_key_value to store run items.")
+
     @lazy_property()
     def table(self) -> Table:
         return self.session.resource("dynamodb").Table(self.table_name)
 
     def store(self, runs: list[Run], metadata: dict) -> None:
-        self.table.update_item(
-            Key=self._get_key(),
-            UpdateExpression="set #attr = :value",
-            ExpressionAttributeNames={"#attr": self.value_attribute_key},
-            ExpressionAttributeValues={
-                ":value": json.dumps(self._to_params_dict(runs, metadata)),
-            },
-        )
+        if self.run_items:
+            self.__delete_run_items()
 
-    def load(self) -> tuple[list[Run], dict[str, Any]]:
-        response = self.table.get_item(Key=self._get_key())
+            sequence = time.time_ns()
 
-        if "Item" in response and self.value_attribute_key in response["Item"]:
-            memory_dict = json.loads(response["Item"][self.value_attribute_key])
-            return self._from_params_dict(memory_dict)
+            with self.table.batch_writer() as batch:
+                for i, run in enumerate(runs):
+                    batch.put_item(Item=self.__to_run_item(run, sequence + i))
+
+        self.__store_value(self._to_params_dict([] if self.run_items else runs, metadata))
+
+    def append_run(self, run: Run, runs: list[Run], metadata: dict[str, Any]) -> None:
+        # Conversations stored in the value attribute by earlier versions are migrated to run items first.
+        if not self.run_items or self.__load_value().get("runs"):
+            super().append_run(run, runs, metadata)
+            return
+
+        self.table.put_item(Item=self.__to_run_item(run, time.time_ns()))
+        self.__store_value(self._to_params_dict([], metadata))
+
+    def load(self, last_n: Optional[int] = None) -> tuple[list[Run], dict[str, Any]]:
+        from griptape.memory.structure import Run
+
+        memory_dict = self.__load_value()
+        run_items = self.__query_run_items(last_n) if self.run_items and last_n != 0 else []
+
+        if run_items:
+            runs = [Run.from_json(item[self.value_attribute_key]) for item in run_items]  # pyright: ignore[reportArgumentType]
+
+            return runs, memory_dict.get("metadata", {})
         else:
-            return [], {}
+            return self._from_params_dict(memory_dict, last_n)
 
     def _get_key(self) -> dict[str, str | int]:
         key: dict[str, str | int] = {self.partition_key: self.partition_key_value}
@@ -57,3 +95,67 @@ class AmazonDynamoDbConversationMemoryDriver(BaseConversationMemoryDriver):
             key[self.sort_key] = self.sort_key_value
 
         return key
+
+    def __load_value(self) -> dict:
+        response = self.table.get_item(Key=self._get_key())
+
+        if "Item" in response and self.value_attribute_key in response["Item"]:
+            return json.loads(response["Item"][self.value_attribute_key])  # pyright: ignore[reportArgumentType]
+        else:
+            return {}
+
+    def __store_value(self, value: dict) -> None:
+        self.table.update_item(
+            Key=self._get_key(),
+            UpdateExpression="set #attr = :value",
+            ExpressionAttributeNames={"#attr": self.value_attribute_key},
+            ExpressionAttributeValues={":value": json.dumps(value)},
+        )
+
+    def __get_run_sort_key(self) -> str:
+        # Storing run items is validated to require a sort key.
+        if self.sort_key is None:
+            raise ValueError(f"{self.__class__.__name__} requires a sort_key to store run items.")
+
+        return self.sort_key
+
+    def __run_sort_key_prefix(self) -> str:
+        return f"{self.sort_key_value}#run#"
+
+    def __to_run_item(self, run: Run, sequence: int) -> dict[str, str | int]:
+        return {
+            self.partition_key: self.partition_key_value,
+            self.__get_run_sort_key(): f"{self.__run_sort_key_prefix()}{sequence:020d}",
+            self.value_attribute_key: run.to_json(),
+        }
+
+    def __query_run_items(self, last_n: Optional[int] = None) -> list[dict]:
+        # Queries newest first, so that only the last `last_n` items are read.
+        conditions = import_optional_dependency("boto3.dynamodb.conditions")
+        params: dict[str, Any] = {
+            "KeyConditionExpression": conditions.Key(self.partition_key).eq(self.partition_key_value)
+            & conditions.Key(self.sort_key).begins_with(self.__run_sort_key_prefix()),
+            "ScanIndexForward": False,
+        }
+        items = []
+
+        while last_n is None or len(items) < last_n:
+            if last_n is not None:
+                params["Limit"] = last_n - len(items)
+
+            response = self.table.query(**params)
+            items.extend(response.get("Items", []))
+
+            if "LastEvaluatedKey" not in response:
+                break
+
+            params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+        return list(reversed(items))
+
+    def __delete_run_items(self) -> None:
+        with self.table.batch_writer() as batch:
+            for item in self.__query_run_items():
+                sort_key = self.__get_run_sort_key()
+
+                batch.delete_item(Key={self.partition_key: item[self.partition_key], sort_key: item[sort_key]})
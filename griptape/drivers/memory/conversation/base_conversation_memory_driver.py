@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from griptape.mixins.serializable_mixin import SerializableMixin
 
@@ -13,13 +13,45 @@ class BaseConversationMemoryDriver(SerializableMixin, ABC):
     @abstractmethod
     def store(self, runs: list[Run], metadata: dict[str, Any]) -> None: ...
 
+    def append_run(self, run: Run, runs: list[Run], metadata: dict[str, Any]) -> None:
+        """Persists `run`, which was just added to the conversation `runs`.
+
+        Defaults to storing the whole conversation. Drivers that store each run separately should override this to
+        write only `run` and `metadata`, so that the cost of a turn does not grow with the length of the conversation.
+
+        Args:
+            run: The run that was added.
+            runs: All runs of the conversation, ending with `run`.
+            metadata: Metadata of the conversation.
+        """
+        self.store(runs, metadata)
+
     @abstractmethod
-    def load(self) -> tuple[list[Run], dict[str, Any]]: ...
+    def load(self, last_n: Optional[int] = None) -> tuple[list[Run], dict[str, Any]]:
+        """Loads the conversation.
+
+        Args:
+            last_n: Optional number of most recent runs to load. Loads every run if `None`.
+
+        Returns:
+            The runs, oldest first, and the metadata of the conversation.
+        """
+        ...
 
     def _to_params_dict(self, runs: list[Run], metadata: dict[str, Any]) -> dict:
         return {"runs": [run.to_dict() for run in runs], "metadata": metadata}
 
-    def _from_params_dict(self, params_dict: dict[str, Any]) -> tuple[list[Run], dict[str, Any]]:
+    def _from_params_dict(
+        self, params_dict: dict[str, Any], last_n: Optional[int] = None
+    ) -> tuple[list[Run], dict[str, Any]]:
         from griptape.memory.structure import Run
 
-        return [Run.from_dict(run) for run in params_dict.get("runs", [])], params_dict.get("metadata", {})
+        run_dicts = params_dict.get("runs", [])
+
+        return [Run.from_dict(run) for run in self._last_n(run_dicts, last_n)], params_dict.get("metadata", {})
+
+    def _last_n(self, items: list, last_n: Optional[int]) -> list:
+        if last_n is None:
+            return items
+
+        return items[-last_n:] if last_n > 0 else []
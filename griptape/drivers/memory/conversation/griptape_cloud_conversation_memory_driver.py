@@ -115,7 +115,7 @@ class GriptapeCloudConversationMemoryDriver(BaseConversationMemoryDriver):
         self._call_api("patch", f"/threads/{thread_id}", body)
         self._thread = None
 
-    def load(self) -> tuple[list[Run], dict[str, Any]]:
+    def load(self, last_n: Optional[int] = None) -> tuple[list[Run], dict[str, Any]]:
         from griptape.memory.structure import Run
 
         thread_id = self.thread["thread_id"] if self.thread_id is None else self.thread_id
@@ -133,7 +133,7 @@ class GriptapeCloudConversationMemoryDriver(BaseConversationMemoryDriver):
                 input=BaseArtifact.from_json(message["input"]),
                 output=BaseArtifact.from_json(message["output"]),
             )
-            for message in messages_response.get("messages", [])
+            for message in self._last_n(messages_response.get("messages", []), last_n)
         ]
 
         return runs, thread_response.get("metadata", {})
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import json
 import os
+from collections import deque
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Literal, Optional
 
 from attrs import define, field
 
@@ -15,21 +16,76 @@ if TYPE_CHECKING:
 
 @define(kw_only=True)
 class LocalConversationMemoryDriver(BaseConversationMemoryDriver):
+    """Conversation Memory Driver that persists conversations to a local file.
+
+    Attributes:
+        persist_file: Optional path to persist the conversation to.
+        persist_format: Format of `persist_file`. `json` rewrites the whole conversation as a single JSON document on
+            each run. `jsonl` appends each run, and the metadata whenever it changes, to a JSON Lines file.
+    """
+
     persist_file: Optional[str] = field(default=None, metadata={"serializable": True})
+    persist_format: Literal["json", "jsonl"] = field(default="json", metadata={"serializable": True})
+    _metadata: Optional[dict[str, Any]] = field(default=None, init=False, alias="metadata")
 
     def store(self, runs: list[Run], metadata: dict[str, Any]) -> None:
-        if self.persist_file is not None:
+        if self.persist_file is None:
+            return
+
+        if self.persist_format == "jsonl":
+            lines = [self.__to_run_line(run) for run in runs] + [self.__to_metadata_line(metadata)]
+
+            Path(self.persist_file).write_text("".join(lines))
+        else:
             Path(self.persist_file).write_text(json.dumps(self._to_params_dict(runs, metadata)))
 
-    def load(self) -> tuple[list[Run], dict[str, Any]]:
-        if (
-            self.persist_file is not None
-            and os.path.exists(self.persist_file)
-            and (loaded_str := Path(self.persist_file).read_text()) is not None
-        ):
-            try:
-                return self._from_params_dict(json.loads(loaded_str))
-            except Exception as e:
-                raise ValueError(f"Unable to load data from {self.persist_file}") from e
-
-        return [], {}
+    def append_run(self, run: Run, runs: list[Run], metadata: dict[str, Any]) -> None:
+        if self.persist_file is None or self.persist_format != "jsonl":
+            super().append_run(run, runs, metadata)
+            return
+
+        with open(self.persist_file, "a") as file:
+            file.write(self.__to_run_line(run))
+
+            if metadata != self._metadata:
+                file.write(self.__to_metadata_line(metadata))
+
+    def load(self, last_n: Optional[int] = None) -> tuple[list[Run], dict[str, Any]]:
+        if self.persist_file is None or not os.path.exists(self.persist_file):
+            return [], {}
+
+        try:
+            if self.persist_format == "jsonl":
+                return self.__load_jsonl(self.persist_file, last_n)
+            else:
+                return self._from_params_dict(json.loads(Path(self.persist_file).read_text()), last_n)
+        except Exception as e:
+            raise ValueError(f"Unable to load data from {self.persist_file}") from e
+
+    def __load_jsonl(self, persist_file: str, last_n: Optional[int]) -> tuple[list[Run], dict[str, Any]]:
+        from griptape.memory.structure import Run
+
+        # Only the runs that are returned and the latest metadata get parsed.
+        run_lines = deque(maxlen=last_n)
+        metadata_line = None
+
+        with open(persist_file) as file:
+            for line in file:
+                if line.startswith('{"run": '):
+                    run_lines.append(line)
+                elif line.strip():
+                    metadata_line = line
+
+        runs = [Run.from_dict(json.loads(line)["run"]) for line in run_lines]
+        metadata: dict[str, Any] = {} if metadata_line is None else json.loads(metadata_line)["metadata"]
+        self._metadata = metadata
+
+        return runs, dict(metadata)
+
+    def __to_run_line(self, run: Run) -> str:
+        return json.dumps({"run": run.to_dict()}) + "\n"
+
+    def __to_metadata_line(self, metadata: dict[str, Any]) -> str:
+        self._metadata = json.loads(json.dumps(metadata))
+
+        return json.dumps({"metadata": metadata}) + "\n"
@@ -23,6 +23,10 @@ class RedisConversationMemoryDriver(BaseConversationMemoryDriver):
     retrieve, and query conversations in a structured manner.
     Proper setup of the Redis instance and RediSearch is necessary for the driver to function correctly.
 
+    Each run is pushed to a Redis list, so that adding a run and loading the most recent runs do not depend on the
+    length of the conversation. The metadata is stored in the `index` hash. Conversations stored as a single JSON
+    document in the hash by earlier versions are still loaded.
+
     Attributes:
         host: The host of the Redis instance.
         port: The port of the Redis instance.
@@ -52,11 +56,48 @@ class RedisConversationMemoryDriver(BaseConversationMemoryDriver):
         ),
     )
 
+    @property
+    def runs_key(self) -> str:
+        return f"{self.index}:{self.conversation_id}:runs"
+
     def store(self, runs: list[Run], metadata: dict[str, Any]) -> None:
-        self.client.hset(self.index, self.conversation_id, json.dumps(self._to_params_dict(runs, metadata)))
+        self.client.delete(self.runs_key)
+
+        if runs:
+            self.client.rpush(self.runs_key, *(run.to_json() for run in runs))
+
+        self.client.hset(self.index, self.conversation_id, json.dumps(self._to_params_dict([], metadata)))
+
+    def append_run(self, run: Run, runs: list[Run], metadata: dict[str, Any]) -> None:
+        # Conversations stored in the hash by earlier versions are migrated to the runs list first.
+        if not self.client.exists(self.runs_key) and self.__load_params_dict().get("runs"):
+            self.store(runs, metadata)
+            return
+
+        self.client.rpush(self.runs_key, run.to_json())
+        self.client.hset(self.index, self.conversation_id, json.dumps(self._to_params_dict([], metadata)))
+
+    def load(self, last_n: Optional[int] = None) -> tuple[list[Run], dict[str, Any]]:
+        from griptape.memory.structure import Run
 
-    def load(self) -> tuple[list[Run], dict[str, Any]]:
+        params_dict = self.__load_params_dict()
+
+        if last_n == 0:
+            return [], params_dict.get("metadata", {})
+
+        run_jsons = self.client.lrange(self.runs_key, 0 if last_n is None else -last_n, -1)
+
+        if run_jsons:
+            runs = [
+                Run.from_json(run_json.decode() if isinstance(run_json, bytes) else run_json)
+                for run_json in run_jsons  # pyright: ignore[reportGeneralTypeIssues] https://github.com/redis/redis-py/issues/2399
+            ]
+
+            return runs, params_dict.get("metadata", {})
+        else:
+            return self._from_params_dict(params_dict, last_n)
+
+    def __load_params_dict(self) -> dict:
         memory_json = self.client.hget(self.index, self.conversation_id)
-        if memory_json is not None:
-            return self._from_params_dict(json.loads(memory_json))  # pyright: ignore[reportArgumentType] https://github.com/redis/redis-py/issues/2399
-        return [], {}
+
+        return {} if memory_json is None else json.loads(memory_json)  # pyright: ignore[reportArgumentType] https://github.com/redis/redis-py/issues/2399
@@ -27,5 +27,13 @@ class BaseObservabilityDriver(ABC):
     @abstractmethod
     def observe(self, call: Observable.Call) -> Any: ...
 
+    async def aobserve(self, call: Observable.Call) -> Any:
+        """Observes a call to a coroutine function.
+
+        Defaults to observing the call that creates the coroutine, and awaiting the coroutine afterwards. Override to
+        observe the coroutine until it finishes.
+        """
+        return await self.observe(call)
+
     @abstractmethod
     def get_span_id(self) -> Optional[str]: ...
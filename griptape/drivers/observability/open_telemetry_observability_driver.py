@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Optional
 
 from attrs import Factory, define, field
@@ -8,10 +9,11 @@ from griptape.drivers import BaseObservabilityDriver
 from griptape.utils.import_utils import import_optional_dependency
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from types import TracebackType
 
     from opentelemetry.sdk.trace import SpanProcessor, TracerProvider
-    from opentelemetry.trace import Tracer
+    from opentelemetry.trace import Span, Tracer
 
     from griptape.common import Observable
 
@@ -80,16 +82,8 @@ class OpenTelemetryObservabilityDriver(BaseObservabilityDriver):
 
     def observe(self, call: Observable.Call) -> Any:
         open_telemetry_trace = import_optional_dependency("opentelemetry.trace")
-        func = call.func
-        instance = call.instance
-        tags = call.tags
-
-        class_name = f"{instance.__class__.__name__}." if instance else ""
-        span_name = f"{class_name}{func.__name__}()"
-        with self._tracer.start_as_current_span(span_name) as span:  # pyright: ignore[reportCallIssue]
-            if tags is not None:
-                span.set_attribute("tags", tags)
 
+        with self.__start_span(call) as span:
             try:
                 result = call()
                 span.set_status(open_telemetry_trace.Status(open_telemetry_trace.StatusCode.OK))
@@ -99,9 +93,33 @@ class OpenTelemetryObservabilityDriver(BaseObservabilityDriver):
                 span.record_exception(e)
                 raise e
 
+    async def aobserve(self, call: Observable.Call) -> Any:
+        open_telemetry_trace = import_optional_dependency("opentelemetry.trace")
+
+        with self.__start_span(call) as span:
+            try:
+                result = await call()
+                span.set_status(open_telemetry_trace.Status(open_telemetry_trace.StatusCode.OK))
+                return result
+            except Exception as e:
+                span.set_status(open_telemetry_trace.Status(open_telemetry_trace.StatusCode.ERROR))
+                span.record_exception(e)
+                raise e
+
     def get_span_id(self) -> Optional[str]:
         opentelemetry_trace = import_optional_dependency("opentelemetry.trace")
         span = opentelemetry_trace.get_current_span()
         if span is opentelemetry_trace.INVALID_SPAN:
             return None
         return opentelemetry_trace.format_span_id(span.get_span_context().span_id)
+
+    @contextmanager
+    def __start_span(self, call: Observable.Call) -> Iterator[Span]:
+        class_name = f"{call.instance.__class__.__name__}." if call.instance else ""
+        span_name = f"{class_name}{call.func.__name__}()"
+
+        with self._tracer.start_as_current_span(span_name) as span:  # pyright: ignore[reportCallIssue]
+            if call.tags is not None:
+                span.set_attribute("tags", call.tags)
+
+            yield span
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import json
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Optional
 
 from attrs import Factory, define, field
 
 from griptape.artifacts.base_artifact import BaseArtifact
+from griptape.artifacts.list_artifact import ListArtifact
 from griptape.common import (
     ActionCallDeltaMessageContent,
     ActionCallMessageContent,
@@ -26,10 +29,14 @@ from griptape.events import (
 )
 from griptape.mixins.exponential_backoff_mixin import ExponentialBackoffMixin
 from griptape.mixins.serializable_mixin import SerializableMixin
+from griptape.utils import str_to_hash
+from griptape.utils.contextvars_utils import with_contextvars
+from griptape.utils.executor_registry import ExecutorRegistry
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
+    from griptape.drivers import BaseCacheDriver
     from griptape.tokenizers import BaseTokenizer
 
 
@@ -47,6 +54,10 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         stream: Whether to stream the completion or not. `CompletionChunkEvent`s will be published to the `Structure` if one is provided.
         use_native_tools: Whether to use LLM's native function calling capabilities. Must be supported by the model.
         extra_params: Extra parameters to pass to the model.
+        cache_driver: Optional Cache Driver for reusing responses. Only used when `temperature` is 0, since other
+            responses are not reproducible. Responses are keyed by the Driver class, the model, the serializable
+            Driver parameters, the Prompt Stack messages, and the Prompt Stack tool schemas. Cached responses of
+            streaming Drivers are replayed as chunk events.
     """
 
     temperature: float = field(default=0.1, metadata={"serializable": True})
@@ -57,6 +68,7 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     stream: bool = field(default=False, kw_only=True, metadata={"serializable": True})
     use_native_tools: bool = field(default=False, kw_only=True, metadata={"serializable": True})
     extra_params: dict = field(factory=dict, kw_only=True, metadata={"serializable": True})
+    cache_driver: Optional[BaseCacheDriver] = field(default=None, kw_only=True)
 
     def before_run(self, prompt_stack: PromptStack) -> None:
         EventBus.publish_event(StartPromptEvent(model=self.model, prompt_stack=prompt_stack))
@@ -82,7 +94,41 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
             with attempt:
                 self.before_run(prompt_stack)
 
-                result = self.__process_stream(prompt_stack) if self.stream else self.__process_run(prompt_stack)
+                cache_key = self._get_cache_key(prompt_stack)
+                result = self.__get_cached_result(cache_key)
+
+                if result is None:
+                    result = self.__process_stream(prompt_stack) if self.stream else self.__process_run(prompt_stack)
+
+                    self.__set_cached_result(cache_key, result)
+
+                self.after_run(result)
+
+                return result
+        else:
+            raise Exception("prompt driver failed after all retry attempts")
+
+    @observable(tags=["PromptDriver.arun()"])
+    async def arun(self, prompt_input: PromptStack | BaseArtifact) -> Message:
+        """Same as `run`, but awaits `atry_run` or `atry_stream`, so that many prompts can be in flight at once."""
+        if isinstance(prompt_input, BaseArtifact):
+            prompt_stack = PromptStack.from_artifact(prompt_input)
+        else:
+            prompt_stack = prompt_input
+
+        async for attempt in self.aretrying():
+            with attempt:
+                self.before_run(prompt_stack)
+
+                cache_key = self._get_cache_key(prompt_stack)
+                result = self.__get_cached_result(cache_key)
+
+                if result is None:
+                    result = await (
+                        self.__aprocess_stream(prompt_stack) if self.stream else self.atry_run(prompt_stack)
+                    )
+
+                    self.__set_cached_result(cache_key, result)
 
                 self.after_run(result)
 
@@ -122,6 +168,104 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     @abstractmethod
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]: ...
 
+    async def atry_run(self, prompt_stack: PromptStack) -> Message:
+        """Awaitable version of `try_run`.
+
+        Defaults to running `try_run` on the ExecutorRegistry's default executor. Drivers with an async client should
+        override this.
+        """
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(ExecutorRegistry.get_executor(), with_contextvars(self.try_run), prompt_stack)
+
+    async def atry_stream(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        """Asynchronous iterator version of `try_stream`.
+
+        Defaults to pulling each Delta Message from `try_stream` on the ExecutorRegistry's default executor. Drivers
+        with an async client should override this.
+        """
+        loop = asyncio.get_running_loop()
+        executor = ExecutorRegistry.get_executor()
+        message_deltas = self.try_stream(prompt_stack)
+        end = object()
+
+        while (
+            message_delta := await loop.run_in_executor(executor, with_contextvars(next), message_deltas, end)
+        ) is not end:
+            yield message_delta
+
+    def _get_cache_key(self, prompt_stack: PromptStack) -> Optional[str]:
+        if self.cache_driver is None or self.temperature != 0:
+            return None
+
+        # Artifact ids are random and usage does not affect the response, so neither is part of the key.
+        params = {key: value for key, value in self.to_dict().items() if key != "stream"}
+        messages = [
+            {
+                "role": message.role,
+                "content": [
+                    {**content.to_dict(), "artifact": self.__artifact_to_cache_dict(content.artifact)}
+                    for content in message.content
+                ],
+            }
+            for message in prompt_stack.messages
+        ]
+        tools = [tool.schema() for tool in prompt_stack.tools]
+        payload = json.dumps({"params": params, "messages": messages, "tools": tools}, sort_keys=True, default=str)
+
+        return f"{self.__class__.__name__}:{self.model}:{str_to_hash(payload)}"
+
+    def __get_cached_result(self, cache_key: Optional[str]) -> Optional[Message]:
+        if self.cache_driver is None or cache_key is None:
+            return None
+
+        value = self.cache_driver.get(cache_key)
+
+        if value is None:
+            return None
+
+        result = Message.from_dict(value)
+
+        if self.stream:
+            self.__replay_stream(result)
+
+        return result
+
+    def __set_cached_result(self, cache_key: Optional[str], result: Message) -> None:
+        if self.cache_driver is not None and cache_key is not None:
+            self.cache_driver.set(cache_key, result.to_dict())
+
+    def __replay_stream(self, result: Message) -> None:
+        for index, content in enumerate(result.content):
+            if isinstance(content, TextMessageContent):
+                EventBus.publish_event(TextChunkEvent(token=content.artifact.value, index=index))
+            elif isinstance(content, ActionCallMessageContent):
+                action = content.artifact.value
+
+                EventBus.publish_event(
+                    ActionChunkEvent(
+                        partial_input=json.dumps(action.input),
+                        tag=action.tag,
+                        name=action.name,
+                        path=action.path,
+                        index=index,
+                    ),
+                )
+
+    def __artifact_to_cache_dict(self, artifact: BaseArtifact) -> dict:
+        # Only the Artifact's own id, and its name when it defaults to the id, are dropped. Values and meta are kept
+        # as is, even if they contain keys named `id`.
+        artifact_dict = {
+            key: value
+            for key, value in artifact.to_dict().items()
+            if key != "id" and not (key == "name" and value == artifact.id)
+        }
+
+        if isinstance(artifact, ListArtifact):
+            artifact_dict["value"] = [self.__artifact_to_cache_dict(item) for item in artifact.value]
+
+        return artifact_dict
+
     def __process_run(self, prompt_stack: PromptStack) -> Message:
         return self.try_run(prompt_stack)
 
@@ -132,30 +276,45 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         # Aggregate all content deltas from the stream
         message_deltas = self.try_stream(prompt_stack)
         for message_delta in message_deltas:
-            usage += message_delta.usage
-            content = message_delta.content
-
-            if content is not None:
-                if content.index in delta_contents:
-                    delta_contents[content.index].append(content)
-                else:
-                    delta_contents[content.index] = [content]
-                if isinstance(content, TextDeltaMessageContent):
-                    EventBus.publish_event(TextChunkEvent(token=content.text, index=content.index))
-                elif isinstance(content, ActionCallDeltaMessageContent):
-                    EventBus.publish_event(
-                        ActionChunkEvent(
-                            partial_input=content.partial_input,
-                            tag=content.tag,
-                            name=content.name,
-                            path=content.path,
-                            index=content.index,
-                        ),
-                    )
+            usage += self.__process_message_delta(message_delta, delta_contents)
 
         # Build a complete content from the content deltas
         return self.__build_message(list(delta_contents.values()), usage)
 
+    async def __aprocess_stream(self, prompt_stack: PromptStack) -> Message:
+        delta_contents: dict[int, list[BaseDeltaMessageContent]] = {}
+        usage = DeltaMessage.Usage()
+
+        async for message_delta in self.atry_stream(prompt_stack):
+            usage += self.__process_message_delta(message_delta, delta_contents)
+
+        return self.__build_message(list(delta_contents.values()), usage)
+
+    def __process_message_delta(
+        self, message_delta: DeltaMessage, delta_contents: dict[int, list[BaseDeltaMessageContent]]
+    ) -> DeltaMessage.Usage:
+        content = message_delta.content
+
+        if content is not None:
+            if content.index in delta_contents:
+                delta_contents[content.index].append(content)
+            else:
+                delta_contents[content.index] = [content]
+            if isinstance(content, TextDeltaMessageContent):
+                EventBus.publish_event(TextChunkEvent(token=content.text, index=content.index))
+            elif isinstance(content, ActionCallDeltaMessageContent):
+                EventBus.publish_event(
+                    ActionChunkEvent(
+                        partial_input=content.partial_input,
+                        tag=content.tag,
+                        name=content.name,
+                        path=content.path,
+                        index=content.index,
+                    ),
+                )
+
+        return message_delta.usage
+
     def __build_message(
         self, delta_contents: list[list[BaseDeltaMessageContent]], usage: DeltaMessage.Usage
     ) -> Message:
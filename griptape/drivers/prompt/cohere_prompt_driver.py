@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from attrs import Factory, define, field
 
@@ -28,9 +28,9 @@ from griptape.utils import import_optional_dependency
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
-    from cohere import Client
+    from cohere import AsyncClient, Client
     from cohere.types import NonStreamedChatResponse
 
     from griptape.tools import BaseTool
@@ -46,6 +46,7 @@ class CoherePromptDriver(BasePromptDriver):
         api_key: Cohere API key.
         model: 	Cohere model name.
         client: Custom `cohere.Client`.
+        async_client: Custom `cohere.AsyncClient`, used by `arun`.
     """
 
     api_key: str = field(metadata={"serializable": False})
@@ -53,6 +54,9 @@ class CoherePromptDriver(BasePromptDriver):
     force_single_step: bool = field(default=False, kw_only=True, metadata={"serializable": True})
     use_native_tools: bool = field(default=True, kw_only=True, metadata={"serializable": True})
     _client: Client = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
+    _async_client: AsyncClient = field(
+        default=None, kw_only=True, alias="async_client", metadata={"serializable": False}
+    )
     tokenizer: BaseTokenizer = field(
         default=Factory(lambda self: CohereTokenizer(model=self.model, client=self.client), takes_self=True),
     )
@@ -61,20 +65,18 @@ class CoherePromptDriver(BasePromptDriver):
     def client(self) -> Client:
         return import_optional_dependency("cohere").Client(self.api_key)
 
+    @lazy_property()
+    def async_client(self) -> AsyncClient:
+        return import_optional_dependency("cohere").AsyncClient(self.api_key)
+
     @observable
     def try_run(self, prompt_stack: PromptStack) -> Message:
         params = self._base_params(prompt_stack)
         logger.debug(params)
 
         result = self.client.chat(**params)
-        logger.debug(result.model_dump())
-        usage = result.meta.tokens
 
-        return Message(
-            content=self.__to_prompt_stack_message_content(result),
-            role=Message.ASSISTANT_ROLE,
-            usage=Message.Usage(input_tokens=usage.input_tokens, output_tokens=usage.output_tokens),
-        )
+        return self.__to_prompt_stack_message(result)
 
     @observable
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]:
@@ -83,15 +85,26 @@ class CoherePromptDriver(BasePromptDriver):
         result = self.client.chat_stream(**params)
 
         for event in result:
-            logger.debug(event.model_dump())
-            if event.event_type == "stream-end":
-                usage = event.response.meta.tokens
+            if (message_delta := self.__to_delta_message(event)) is not None:
+                yield message_delta
 
-                yield DeltaMessage(
-                    usage=DeltaMessage.Usage(input_tokens=usage.input_tokens, output_tokens=usage.output_tokens),
-                )
-            elif event.event_type == "text-generation" or event.event_type == "tool-calls-chunk":
-                yield DeltaMessage(content=self.__to_prompt_stack_delta_message_content(event))
+    @observable
+    async def atry_run(self, prompt_stack: PromptStack) -> Message:
+        params = self._base_params(prompt_stack)
+        logger.debug(params)
+
+        result = await self.async_client.chat(**params)
+
+        return self.__to_prompt_stack_message(result)
+
+    @observable
+    async def atry_stream(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        params = self._base_params(prompt_stack)
+        logger.debug(params)
+
+        async for event in self.async_client.chat_stream(**params):
+            if (message_delta := self.__to_delta_message(event)) is not None:
+                yield message_delta
 
     def _base_params(self, prompt_stack: PromptStack) -> dict:
         # Current message
@@ -131,6 +144,31 @@ class CoherePromptDriver(BasePromptDriver):
             **self.extra_params,
         }
 
+    def __to_prompt_stack_message(self, result: NonStreamedChatResponse) -> Message:
+        logger.debug(result.model_dump())
+        usage = None if result.meta is None else result.meta.tokens
+
+        return Message(
+            content=self.__to_prompt_stack_message_content(result),
+            role=Message.ASSISTANT_ROLE,
+            usage=Message.Usage()
+            if usage is None
+            else Message.Usage(input_tokens=usage.input_tokens, output_tokens=usage.output_tokens),
+        )
+
+    def __to_delta_message(self, event: Any) -> Optional[DeltaMessage]:
+        logger.debug(event.model_dump())
+        if event.event_type == "stream-end":
+            usage = event.response.meta.tokens
+
+            return DeltaMessage(
+                usage=DeltaMessage.Usage(input_tokens=usage.input_tokens, output_tokens=usage.output_tokens),
+            )
+        elif event.event_type == "text-generation" or event.event_type == "tool-calls-chunk":
+            return DeltaMessage(content=self.__to_prompt_stack_delta_message_content(event))
+        else:
+            return None
+
     def __to_cohere_messages(self, messages: list[Message]) -> list[dict]:
         cohere_messages = []
 
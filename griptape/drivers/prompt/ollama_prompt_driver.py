@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
 from typing import TYPE_CHECKING, Any, Optional
 
 from attrs import Factory, define, field
@@ -29,7 +29,7 @@ from griptape.utils.decorators import lazy_property
 logger = logging.getLogger(Defaults.logging_config.logger_name)
 
 if TYPE_CHECKING:
-    from ollama import ChatResponse, Client
+    from ollama import AsyncClient, ChatResponse, Client
 
     from griptape.tokenizers.base_tokenizer import BaseTokenizer
     from griptape.tools import BaseTool
@@ -69,22 +69,25 @@ class OllamaPromptDriver(BasePromptDriver):
     )
     use_native_tools: bool = field(default=True, kw_only=True, metadata={"serializable": True})
     _client: Client = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
+    _async_client: AsyncClient = field(
+        default=None, kw_only=True, alias="async_client", metadata={"serializable": False}
+    )
 
     @lazy_property()
     def client(self) -> Client:
         return import_optional_dependency("ollama").Client(host=self.host)
 
+    @lazy_property()
+    def async_client(self) -> AsyncClient:
+        return import_optional_dependency("ollama").AsyncClient(host=self.host)
+
     @observable
     def try_run(self, prompt_stack: PromptStack) -> Message:
         params = self._base_params(prompt_stack)
         logger.debug(params)
         response = self.client.chat(**params)
-        logger.debug(response)
 
-        return Message(
-            content=self.__to_prompt_stack_message_content(response),
-            role=Message.ASSISTANT_ROLE,
-        )
+        return self.__to_prompt_stack_message(response)
 
     @observable
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]:
@@ -94,8 +97,27 @@ class OllamaPromptDriver(BasePromptDriver):
 
         if isinstance(stream, Iterator):
             for chunk in stream:
-                logger.debug(chunk)
-                yield DeltaMessage(content=TextDeltaMessageContent(chunk["message"]["content"]))
+                yield self.__to_delta_message(chunk)
+        else:
+            raise Exception("invalid model response")
+
+    @observable
+    async def atry_run(self, prompt_stack: PromptStack) -> Message:
+        params = self._base_params(prompt_stack)
+        logger.debug(params)
+        response = await self.async_client.chat(**params)
+
+        return self.__to_prompt_stack_message(response)
+
+    @observable
+    async def atry_stream(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        params = {**self._base_params(prompt_stack), "stream": True}
+        logger.debug(params)
+        stream = await self.async_client.chat(**params)
+
+        if isinstance(stream, AsyncIterator):
+            async for chunk in stream:
+                yield self.__to_delta_message(chunk)
         else:
             raise Exception("invalid model response")
 
@@ -210,6 +232,19 @@ class OllamaPromptDriver(BasePromptDriver):
             else:
                 return "user"
 
+    def __to_prompt_stack_message(self, response: ChatResponse) -> Message:
+        logger.debug(response)
+
+        return Message(
+            content=self.__to_prompt_stack_message_content(response),
+            role=Message.ASSISTANT_ROLE,
+        )
+
+    def __to_delta_message(self, chunk: ChatResponse) -> DeltaMessage:
+        logger.debug(chunk)
+
+        return DeltaMessage(content=TextDeltaMessageContent(chunk["message"]["content"]))
+
     def __to_prompt_stack_message_content(self, response: ChatResponse) -> list[BaseMessageContent]:
         content = []
         message = response["message"]
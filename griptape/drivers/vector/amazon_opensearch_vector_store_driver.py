@@ -58,3 +58,10 @@ class AmazonOpenSearchVectorStoreDriver(OpenSearchVectorStoreDriver):
             response = self.client.index(index=self.index_name, id=vector_id, body=doc)
 
         return response["_id"]
+
+    def _bulk_index_action(self, vector_id: str) -> dict:
+        # OpenSearch Serverless vector collections don't support custom document IDs
+        if self.service == "aoss":
+            return {"index": {"_index": self.index_name}}
+        else:
+            return super()._bulk_index_action(vector_id)
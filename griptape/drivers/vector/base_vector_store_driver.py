@@ -3,7 +3,8 @@ from __future__ import annotations
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Optional
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Optional, cast
 
 from attrs import define, field
 
@@ -14,12 +15,15 @@ from griptape.mixins.serializable_mixin import SerializableMixin
 from griptape.utils import with_contextvars
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from griptape.drivers import BaseEmbeddingDriver
 
 
 @define
 class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
     DEFAULT_QUERY_COUNT = 5
+    DEFAULT_UPSERT_CHUNK_SIZE = 100
 
     @dataclass
     class Entry:
@@ -37,38 +41,50 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
             return BaseArtifact.from_json(self.meta["artifact"])  # pyright: ignore[reportOptionalSubscript]
 
     embedding_driver: BaseEmbeddingDriver = field(kw_only=True, metadata={"serializable": True})
+    upsert_chunk_size: int = field(default=DEFAULT_UPSERT_CHUNK_SIZE, kw_only=True)
 
     def upsert_text_artifacts(
         self,
-        artifacts: list[TextArtifact] | dict[str, list[TextArtifact]],
+        artifacts: Iterable[TextArtifact] | dict[str, Iterable[TextArtifact]],
         *,
         meta: Optional[dict] = None,
         **kwargs,
     ) -> list[str] | dict[str, list[str]]:
-        if isinstance(artifacts, list):
-            return utils.execute_futures_list(
-                [
-                    self.futures_executor.submit(
-                        with_contextvars(self.upsert_text_artifact), a, namespace=None, meta=meta, **kwargs
-                    )
-                    for a in artifacts
-                ],
-            )
-        else:
-            futures_dict = {}
+        """Upserts Text Artifacts, embedding the ones that don't exist yet.
+
+        Lists of Artifacts are embedded together. Any other iterable, such as the output of
+        `BaseChunker.iter_chunks`, is consumed lazily, `upsert_chunk_size` Artifacts at a time.
 
-            for namespace, artifact_list in artifacts.items():
-                for a in artifact_list:
-                    if not futures_dict.get(namespace):
-                        futures_dict[namespace] = []
+        Args:
+            artifacts: Artifacts to upsert, or Artifacts to upsert by namespace.
+            meta: Metadata to store with every Artifact.
+            kwargs: Additional arguments passed to the backend.
 
-                    futures_dict[namespace].append(
-                        self.futures_executor.submit(
-                            with_contextvars(self.upsert_text_artifact), a, namespace=namespace, meta=meta, **kwargs
-                        )
-                    )
+        Returns:
+            The vector ids of the Artifacts, or the vector ids by namespace.
+        """
+        if isinstance(artifacts, dict):
+            # Narrowing by isinstance can't tell a dict of namespaces apart from an Iterable that is also a dict
+            artifacts_by_namespace = cast("dict[str, Iterable[TextArtifact]]", artifacts)
+            namespaced_artifacts: Iterator[tuple[Optional[str], TextArtifact]] = (
+                (namespace, a) for namespace, artifact_list in artifacts_by_namespace.items() for a in artifact_list
+            )
+            lazy = not all(isinstance(artifact_list, list) for artifact_list in artifacts_by_namespace.values())
+            vector_ids = {}
+
+            for namespace, vector_id in self.__upsert_namespaced_text_artifacts_batches(
+                namespaced_artifacts, lazy=lazy, meta=meta, **kwargs
+            ):
+                vector_ids.setdefault(namespace, []).append(vector_id)
 
-            return utils.execute_futures_list_dict(futures_dict)
+            return vector_ids
+        else:
+            return [
+                vector_id
+                for _, vector_id in self.__upsert_namespaced_text_artifacts_batches(
+                    ((None, a) for a in artifacts), lazy=not isinstance(artifacts, list), meta=meta, **kwargs
+                )
+            ]
 
     def upsert_text_artifact(
         self,
@@ -82,8 +98,7 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         meta = {} if meta is None else meta
 
         if vector_id is None:
-            value = artifact.to_text() if artifact.reference is None else artifact.to_text() + str(artifact.reference)
-            vector_id = self._get_default_vector_id(value)
+            vector_id = self._get_text_artifact_vector_id(artifact)
 
         if self.does_entry_exist(vector_id, namespace=namespace):
             return vector_id
@@ -107,6 +122,30 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
             TextArtifact(string), vector_id=vector_id, namespace=namespace, meta=meta, **kwargs
         )
 
+    def upsert_vectors(self, entries: list[Entry], *, chunk_size: Optional[int] = None, **kwargs) -> list[str]:
+        """Upserts Entries in chunks, using the backend's bulk write where one is available.
+
+        Args:
+            entries: Entries to upsert. `id`, `namespace`, and `meta` are optional on each Entry.
+            chunk_size: Maximum number of Entries written per request. Defaults to `upsert_chunk_size`.
+            kwargs: Additional arguments passed to the backend with every chunk.
+
+        Returns:
+            The IDs of the upserted vectors, in the same order as `entries`.
+        """
+        chunk_size = self.upsert_chunk_size if chunk_size is None else chunk_size
+
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be greater than 0.")
+        if any(entry.vector is None for entry in entries):
+            raise ValueError("Every Entry must have a vector to be upserted.")
+
+        return [
+            vector_id
+            for i in range(0, len(entries), chunk_size)
+            for vector_id in self._upsert_vectors_chunk(entries[i : i + chunk_size], **kwargs)
+        ]
+
     def does_entry_exist(self, vector_id: str, *, namespace: Optional[str] = None) -> bool:
         try:
             return self.load_entry(vector_id, namespace=namespace) is not None
@@ -122,6 +161,11 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
     @abstractmethod
     def delete_vector(self, vector_id: str) -> None: ...
 
+    def delete_namespace(self, namespace: str) -> None:
+        """Deletes every Entry in the namespace, one `delete_vector` call per Entry unless overridden."""
+        for entry in self.load_entries(namespace=namespace):
+            self.delete_vector(entry.id)
+
     @abstractmethod
     def upsert_vector(
         self,
@@ -139,7 +183,6 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
     @abstractmethod
     def load_entries(self, *, namespace: Optional[str] = None) -> list[Entry]: ...
 
-    @abstractmethod
     def query(
         self,
         query: str,
@@ -148,7 +191,144 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         namespace: Optional[str] = None,
         include_vectors: bool = False,
         **kwargs,
-    ) -> list[Entry]: ...
+    ) -> list[Entry]:
+        """Queries for the Entries closest to the query string, embedded with the `embedding_driver`.
+
+        Drivers that embed queries server-side override this instead of `query_vector`.
+        """
+        return self.query_vector(
+            self.embedding_driver.embed_string(query),
+            count=count,
+            namespace=namespace,
+            include_vectors=include_vectors,
+            **kwargs,
+        )
+
+    def query_vector(
+        self,
+        vector: list[float],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[Entry]:
+        """Queries for the Entries closest to an already embedded query."""
+        raise NotImplementedError(f"{self.__class__.__name__} does not support querying by vector.")
+
+    def query_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[list[Entry]]:
+        """Queries for the Entries closest to each of several already embedded queries.
+
+        Runs `query_vector` concurrently for every vector by default. Drivers that can score several queries at once
+        override this.
+
+        Returns:
+            One list of Entries per vector, in the same order as `vectors`.
+        """
+        return utils.execute_futures_list(
+            [
+                self.futures_executor.submit(
+                    with_contextvars(self.query_vector),
+                    vector,
+                    count=count,
+                    namespace=namespace,
+                    include_vectors=include_vectors,
+                    **kwargs,
+                )
+                for vector in vectors
+            ]
+        )
+
+    @property
+    def supports_query_vector(self) -> bool:
+        return type(self).query_vector is not BaseVectorStoreDriver.query_vector
+
+    def _upsert_namespaced_text_artifacts(
+        self,
+        namespaced_artifacts: list[tuple[Optional[str], TextArtifact]],
+        *,
+        meta: Optional[dict] = None,
+        **kwargs,
+    ) -> list[str]:
+        """Upserts Artifacts that don't exist yet, embedding them with a single call to `embed_strings`."""
+        vector_ids = [self._get_text_artifact_vector_id(a) for _, a in namespaced_artifacts]
+        exists = utils.execute_futures_list(
+            [
+                self.futures_executor.submit(with_contextvars(self.does_entry_exist), vector_id, namespace=namespace)
+                for vector_id, (namespace, _) in zip(vector_ids, namespaced_artifacts)
+            ]
+        )
+        pending = [i for i, entry_exists in enumerate(exists) if not entry_exists]
+        unembedded_artifacts = [namespaced_artifacts[i][1] for i in pending if not namespaced_artifacts[i][1].embedding]
+        embeddings = self.embedding_driver.embed_strings([str(a.value) for a in unembedded_artifacts])
+
+        for artifact, embedding in zip(unembedded_artifacts, embeddings):
+            artifact.embedding = embedding
+
+        upserted_vector_ids = self.upsert_vectors(
+            [
+                self.Entry(
+                    id=vector_ids[i],
+                    vector=namespaced_artifacts[i][1].embedding,
+                    namespace=namespaced_artifacts[i][0],
+                    meta={**(meta or {}), "artifact": namespaced_artifacts[i][1].to_json()},
+                )
+                for i in pending
+            ],
+            **kwargs,
+        )
+
+        for i, vector_id in zip(pending, upserted_vector_ids):
+            vector_ids[i] = vector_id
+
+        return vector_ids
+
+    def __upsert_namespaced_text_artifacts_batches(
+        self,
+        namespaced_artifacts: Iterator[tuple[Optional[str], TextArtifact]],
+        *,
+        lazy: bool,
+        meta: Optional[dict] = None,
+        **kwargs,
+    ) -> Iterator[tuple[Optional[str], str]]:
+        batch_size = self.upsert_chunk_size if lazy else None
+
+        while batch := list(islice(namespaced_artifacts, batch_size)):
+            vector_ids = self._upsert_namespaced_text_artifacts(batch, meta=meta, **kwargs)
+
+            yield from ((namespace, vector_id) for (namespace, _), vector_id in zip(batch, vector_ids))
+
+    def _upsert_vectors_chunk(self, entries: list[Entry], **kwargs) -> list[str]:
+        """Upserts a single chunk of Entries.
+
+        Drivers with a native bulk write override this, by default each Entry is upserted concurrently.
+        """
+        return utils.execute_futures_list(
+            [
+                self.futures_executor.submit(
+                    with_contextvars(self.upsert_vector),
+                    entry.vector,
+                    vector_id=entry.id,
+                    namespace=entry.namespace,
+                    meta=entry.meta,
+                    **kwargs,
+                )
+                for entry in entries
+            ]
+        )
+
+    def _get_text_artifact_vector_id(self, artifact: TextArtifact) -> str:
+        value = artifact.to_text() if artifact.reference is None else artifact.to_text() + str(artifact.reference)
+
+        return self._get_default_vector_id(value)
 
     def _get_default_vector_id(self, value: str) -> str:
         return str(uuid.uuid5(uuid.NAMESPACE_OID, value))
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import heapq
+import math
+import random
+from typing import Optional
+
+import numpy as np
+from attrs import Factory, define, field
+from numpy.linalg import norm
+
+
+@define(kw_only=True)
+class LocalVectorIndex:
+    """Contiguous float32 matrix of the vectors in a single namespace with their norms precomputed.
+
+    Attributes:
+        dimensions: Length of every vector stored in the index.
+        keys: Namespaced entry keys, one per matrix row.
+        sequences: Insertion sequence of each row, used to break score ties in insertion order.
+    """
+
+    INITIAL_CAPACITY = 64
+
+    dimensions: int = field()
+    keys: list[str] = field(factory=list)
+    sequences: np.ndarray = field(
+        default=Factory(lambda self: np.empty(self.INITIAL_CAPACITY, dtype=np.int64), takes_self=True)
+    )
+    matrix: np.ndarray = field(
+        default=Factory(
+            lambda self: np.empty((self.INITIAL_CAPACITY, self.dimensions), dtype=np.float32), takes_self=True
+        )
+    )
+    norms: np.ndarray = field(
+        default=Factory(lambda self: np.empty(self.INITIAL_CAPACITY, dtype=np.float32), takes_self=True)
+    )
+    _rows: dict[str, int] = field(factory=dict, alias="rows")
+
+    @property
+    def size(self) -> int:
+        return len(self.keys)
+
+    def upsert(self, key: str, vector: list[float], sequence: int) -> None:
+        if len(vector) != self.dimensions:
+            raise ValueError(f"Vector has {len(vector)} dimensions but the index expects {self.dimensions}.")
+
+        row = self._rows.get(key)
+
+        if row is None:
+            row = self.size
+
+            if row == len(self.matrix):
+                self.__grow()
+
+            self._rows[key] = row
+            self.keys.append(key)
+            self.sequences[row] = sequence
+
+        self.matrix[row] = vector
+        self.norms[row] = norm(self.matrix[row])
+
+    def scores(self, vector: np.ndarray, vector_norm: float) -> np.ndarray:
+        size = self.size
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (self.matrix[:size] @ vector).astype(np.float64) / (
+                self.norms[:size].astype(np.float64) * vector_norm
+            )
+
+    def batch_scores(self, vectors: np.ndarray, vector_norms: np.ndarray) -> np.ndarray:
+        """Scores every row against several query vectors with a single matrix product, one row of scores per query."""
+        size = self.size
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (vectors @ self.matrix[:size].T).astype(np.float64) / (
+                vector_norms[:, np.newaxis] * self.norms[:size].astype(np.float64)
+            )
+
+    def __grow(self) -> None:
+        capacity = len(self.matrix) * 2
+
+        self.matrix = np.resize(self.matrix, (capacity, self.dimensions))
+        self.norms = np.resize(self.norms, capacity)
+        self.sequences = np.resize(self.sequences, capacity)
+
+
+@define(kw_only=True)
+class LocalHnswVectorIndex(LocalVectorIndex):
+    """LocalVectorIndex with a Hierarchical Navigable Small World graph over its rows for approximate search.
+
+    Rows are linked to their nearest neighbors by cosine similarity on every layer up to a layer drawn from the row's
+    key, so the same entries always produce the same graph. Searches descend greedily from the top layer and finish
+    with a beam search of width `ef` on the bottom layer.
+
+    Attributes:
+        m: Number of links kept per row on the upper layers, twice as many are kept on the bottom layer.
+        ef_construction: Beam width used to find the links of an inserted row.
+        entry_point: Row that searches start from.
+        levels: Topmost layer of each row.
+        links: Links of each row, one dictionary per layer.
+        units: Unit length copy of `matrix`, so that similarities are plain dot products.
+    """
+
+    m: int = field(default=16)
+    ef_construction: int = field(default=200)
+    entry_point: Optional[int] = field(default=None)
+    levels: list[int] = field(factory=list)
+    links: list[dict[int, list[int]]] = field(factory=list)
+    units: np.ndarray = field(
+        default=Factory(
+            lambda self: np.empty((self.INITIAL_CAPACITY, self.dimensions), dtype=np.float32), takes_self=True
+        )
+    )
+
+    def upsert(self, key: str, vector: list[float], sequence: int) -> None:
+        row = self._rows.get(key)
+
+        self.__upsert_unit(key, vector, sequence)
+
+        if row is None:
+            self.__insert(self._rows[key])
+        elif self.entry_point is not None:
+            self.__connect(row, self.levels[row], self.entry_point)
+
+    def restore(
+        self,
+        keys: list[str],
+        vectors: list[list[float]],
+        sequences: list[int],
+        *,
+        entry_point: Optional[int],
+        levels: list[int],
+        links: list[dict[int, list[int]]],
+    ) -> None:
+        """Loads rows together with a previously built graph over them, without relinking."""
+        for key, vector, sequence in zip(keys, vectors, sequences):
+            self.__upsert_unit(key, vector, sequence)
+
+        self.entry_point = entry_point
+        self.levels = levels
+        self.links = links
+
+    def search(self, vector: np.ndarray, vector_norm: float, *, count: int, ef: int) -> tuple[np.ndarray, np.ndarray]:
+        """Finds the approximate nearest rows to `vector`.
+
+        Returns:
+            Up to `count` rows and their scores, best first.
+        """
+        if self.entry_point is None or vector_norm == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        query = (vector / vector_norm).astype(np.float32)
+        nearest = self.__descend(query, self.entry_point, to_level=0)
+        nearest = self.__search_level(query, nearest, max(ef, count), 0)[:count]
+
+        return np.array([row for _, row in nearest], dtype=np.int64), -np.array([d for d, _ in nearest])
+
+    def __upsert_unit(self, key: str, vector: list[float], sequence: int) -> None:
+        super().upsert(key, vector, sequence)
+
+        row = self._rows[key]
+
+        if len(self.units) < len(self.matrix):
+            self.units = np.resize(self.units, self.matrix.shape)
+
+        # Zero vectors get a zero unit vector, which scores 0 against everything instead of NaN.
+        self.units[row] = self.matrix[row] / self.norms[row] if self.norms[row] > 0 else 0
+
+    def __insert(self, row: int) -> None:
+        level = self.__random_level(self.keys[row])
+
+        self.levels.append(level)
+
+        while len(self.links) <= level:
+            self.links.append({})
+
+        for layer in range(level + 1):
+            self.links[layer][row] = []
+
+        if self.entry_point is None:
+            self.entry_point = row
+        else:
+            self.__connect(row, level, self.entry_point)
+
+            if level > self.levels[self.entry_point]:
+                self.entry_point = row
+
+    def __connect(self, row: int, level: int, entry_point: int) -> None:
+        query = self.units[row]
+        nearest = self.__descend(query, entry_point, to_level=level)
+
+        for layer in range(min(level, self.levels[entry_point]), -1, -1):
+            nearest = self.__search_level(query, nearest, self.ef_construction, layer)
+            max_links = self.m * 2 if layer == 0 else self.m
+            neighbors = self.__select_neighbors([(d, r) for d, r in nearest if r != row], self.m)
+
+            self.links[layer][row] = neighbors
+
+            for neighbor in neighbors:
+                neighbor_links = self.links[layer][neighbor]
+
+                if row not in neighbor_links:
+                    neighbor_links.append(row)
+
+                if len(neighbor_links) > max_links:
+                    distances = self.__distances(self.units[neighbor], neighbor_links).tolist()
+
+                    self.links[layer][neighbor] = self.__select_neighbors(
+                        sorted(zip(distances, neighbor_links)), max_links
+                    )
+
+    def __descend(self, query: np.ndarray, entry_point: int, *, to_level: int) -> list[tuple[float, int]]:
+        # Greedily walks the layers above `to_level`, returning the closest row found as the next entry point.
+        nearest = [(float(self.__distances(query, [entry_point])[0]), entry_point)]
+
+        for layer in range(self.levels[entry_point], to_level, -1):
+            nearest = self.__search_level(query, nearest, 1, layer)
+
+        return nearest
+
+    def __search_level(
+        self, query: np.ndarray, entry: list[tuple[float, int]], ef: int, layer: int
+    ) -> list[tuple[float, int]]:
+        links = self.links[layer]
+        visited = {row for _, row in entry}
+        candidates = list(entry)
+        nearest = [(-distance, row) for distance, row in entry]
+
+        heapq.heapify(candidates)
+        heapq.heapify(nearest)
+
+        while candidates:
+            distance, row = heapq.heappop(candidates)
+
+            if distance > -nearest[0][0]:
+                break
+
+            unvisited = [neighbor for neighbor in links.get(row, ()) if neighbor not in visited]
+
+            if not unvisited:
+                continue
+
+            visited.update(unvisited)
+
+            for neighbor_distance, neighbor in zip(self.__distances(query, unvisited).tolist(), unvisited):
+                if len(nearest) < ef or neighbor_distance < -nearest[0][0]:
+                    heapq.heappush(candidates, (neighbor_distance, neighbor))
+                    heapq.heappush(nearest, (-neighbor_distance, neighbor))
+
+                    if len(nearest) > ef:
+                        heapq.heappop(nearest)
+
+        return sorted((-distance, row) for distance, row in nearest)
+
+    def __select_neighbors(self, candidates: list[tuple[float, int]], count: int) -> list[int]:
+        # Prefers candidates that are closer to the query than to any neighbor selected so far, which keeps links
+        # spread out across clusters. Skipped candidates fill any remaining slots.
+        if len(candidates) <= count:
+            return [row for _, row in candidates]
+
+        selected = []
+        selected_units = np.empty((count, self.dimensions), dtype=np.float32)
+        skipped = []
+
+        for distance, row in candidates:
+            if len(selected) == count:
+                break
+
+            unit = self.units[row]
+
+            if selected and -float((selected_units[: len(selected)] @ unit).max()) < distance:
+                skipped.append(row)
+            else:
+                selected_units[len(selected)] = unit
+                selected.append(row)
+
+        return selected + skipped[: count - len(selected)]
+
+    def __distances(self, query: np.ndarray, rows: list[int]) -> np.ndarray:
+        return -(self.units[rows] @ query).astype(np.float64)
+
+    def __random_level(self, key: str) -> int:
+        return int(-math.log(1.0 - random.Random(key).random()) / math.log(self.m))
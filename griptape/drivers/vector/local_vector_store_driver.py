@@ -4,23 +4,71 @@ import json
 import operator
 import os
 import threading
-from dataclasses import asdict
-from typing import Callable, NoReturn, Optional, TextIO
+from dataclasses import asdict, replace
+from typing import Any, Callable, Literal, NoReturn, Optional, TextIO, cast
 
+import numpy as np
 from attrs import Factory, define, field
 from numpy import dot
 from numpy.linalg import norm
 
 from griptape import utils
 from griptape.drivers import BaseVectorStoreDriver
+from griptape.drivers.vector.local_vector_index import LocalHnswVectorIndex, LocalVectorIndex
+
+
+def cosine_relatedness(x: list[float], y: list[float]) -> float:
+    return dot(x, y) / (norm(x) * norm(y))
 
 
 @define(kw_only=True)
 class LocalVectorStoreDriver(BaseVectorStoreDriver):
+    """Vector Store Driver that keeps entries in memory, optionally persisting them to `persist_file`.
+
+    Attributes:
+        entries: Entries keyed by their namespaced vector id.
+        persist_file: Optional path to persist entries to.
+        persist_format: Format of `persist_file`. `json` rewrites every entry as a single JSON document on each upsert.
+            `log` appends each upsert to a JSON Lines log and stores vectors in a binary sidecar file that is
+            memory-mapped on startup. Entries loaded from the sidecar hold read-only views of it in `entries`, and
+            their vectors are only copied into lists when they are returned.
+        log_compaction_threshold: Number of superseded log records after which the log is compacted.
+        index_type: Index used to answer queries. `exact` scores every entry, `hnsw` searches a Hierarchical
+            Navigable Small World graph for approximate nearest neighbors. Since saving rewrites the whole graph, it is
+            only saved to `index_file` by calling `save_index()` and when the log is compacted. Entries upserted after
+            it was saved are inserted into the graph when it is loaded.
+        hnsw_m: Number of links per entry in the HNSW graph. Higher values improve recall at the cost of memory and
+            insert time.
+        hnsw_ef_construction: Beam width used when inserting into the HNSW graph.
+        hnsw_ef_search: Beam width used when querying the HNSW graph, raised to the query `count` if lower.
+        calculate_relatedness: Function used to score entries against a query vector.
+    """
+
+    LOG_FORMAT_VERSION = 1
+    LOG_VECTOR_DTYPE = np.dtype("<f8")
+    INDEX_FORMAT_VERSION = 1
+
     entries: dict[str, BaseVectorStoreDriver.Entry] = field(factory=dict)
     persist_file: Optional[str] = field(default=None)
-    calculate_relatedness: Callable = field(default=lambda x, y: dot(x, y) / (norm(x) * norm(y)))
+    persist_format: Literal["json", "log"] = field(default="json")
+    log_compaction_threshold: int = field(default=1000)
+    index_type: Literal["exact", "hnsw"] = field(default="exact")
+    hnsw_m: int = field(default=16)
+    hnsw_ef_construction: int = field(default=200)
+    hnsw_ef_search: int = field(default=50)
+    calculate_relatedness: Callable = field(default=cosine_relatedness)
     thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()))
+    _indexes: dict[Optional[str], LocalVectorIndex] = field(factory=dict, alias="indexes")
+    _indexed_entries: Optional[dict[str, BaseVectorStoreDriver.Entry]] = field(default=None, alias="indexed_entries")
+    _sequences: dict[str, int] = field(factory=dict, alias="sequences")
+    _next_sequence: int = field(default=0, alias="next_sequence")
+    _vectors_file: Optional[str] = field(default=None, alias="vectors_file")
+    _stale_log_records: int = field(default=0, alias="stale_log_records")
+    _saved_indexes: dict[Optional[str], dict[str, Any]] = field(factory=dict, alias="saved_indexes")
+
+    @property
+    def index_file(self) -> Optional[str]:
+        return None if self.persist_file is None else f"{self.persist_file}.hnsw"
 
     def __attrs_post_init__(self) -> None:
         if self.persist_file is not None:
@@ -29,15 +77,21 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
             if directory and not os.path.exists(directory):
                 os.makedirs(directory)
 
-            if not os.path.isfile(self.persist_file):
-                with open(self.persist_file, "w") as file:
-                    self.__save_entries_to_file(file)
+            if self.index_type == "hnsw":
+                self.__load_hnsw_indexes()
 
-            with open(self.persist_file, "r+") as file:
-                if os.path.getsize(self.persist_file) > 0:
-                    self.entries = self.load_entries_from_file(file)
-                else:
-                    self.__save_entries_to_file(file)
+            if self.persist_format == "log":
+                self.__load_log()
+            else:
+                if not os.path.isfile(self.persist_file):
+                    with open(self.persist_file, "w") as file:
+                        self.__save_entries_to_file(file)
+
+                with open(self.persist_file, "r+") as file:
+                    if os.path.getsize(self.persist_file) > 0:
+                        self.entries = self.load_entries_from_file(file)
+                    else:
+                        self.__save_entries_to_file(file)
 
     def load_entries_from_file(self, json_file: TextIO) -> dict[str, BaseVectorStoreDriver.Entry]:
         with self.thread_lock:
@@ -54,67 +108,582 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
         meta: Optional[dict] = None,
         **kwargs,
     ) -> str:
-        vector_id = vector_id or utils.str_to_hash(str(vector))
-
-        with self.thread_lock:
-            self.entries[self.__namespaced_vector_id(vector_id, namespace=namespace)] = self.Entry(
-                id=vector_id,
-                vector=vector,
-                meta=meta,
-                namespace=namespace,
-            )
-
-        if self.persist_file is not None:
-            # TODO: optimize later since it reserializes all entries from memory and stores them in the JSON file
-            #  every time a new vector is inserted
-            with open(self.persist_file, "w") as file:
-                self.__save_entries_to_file(file)
+        # An empty id is replaced with a hash of the vector, like in upsert_vectors.
+        entry = self.Entry(id=vector_id or "", vector=vector, meta=meta, namespace=namespace)
 
-        return vector_id
+        return self._upsert_vectors_chunk([entry])[0]
 
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
-        return self.entries.get(self.__namespaced_vector_id(vector_id, namespace=namespace), None)
+        entry = self.entries.get(self.__namespaced_vector_id(vector_id, namespace=namespace), None)
+
+        return None if entry is None else self.__with_list_vector(entry)
 
     def load_entries(self, *, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
-        return [entry for key, entry in self.entries.items() if namespace is None or entry.namespace == namespace]
+        return [
+            self.__with_list_vector(entry)
+            for entry in self.entries.values()
+            if namespace is None or entry.namespace == namespace
+        ]
 
-    def query(
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         *,
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
-        query_embedding = self.embedding_driver.embed_string(query)
+        if self.calculate_relatedness is not cosine_relatedness:
+            entries = [entry for entry in list(self.entries.values()) if not namespace or entry.namespace == namespace]
+            entries_and_relatednesses = [(entry, self.calculate_relatedness(vector, entry.vector)) for entry in entries]
 
-        if namespace:
-            entries = {k: v for (k, v) in self.entries.items() if k.startswith(f"{namespace}-")}
+            entries_and_relatednesses.sort(key=operator.itemgetter(1), reverse=True)
+        elif self.index_type == "hnsw" and count is not None:
+            entries_and_relatednesses = self.__query_hnsw_indexes(vector, count=count, namespace=namespace)
         else:
+            entries_and_relatednesses = self.__query_indexes(vector, count=count, namespace=namespace)
+
+        return self.__to_query_result(entries_and_relatednesses, count=count, include_vectors=include_vectors)
+
+    def query_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[list[BaseVectorStoreDriver.Entry]]:
+        """Scores all queries against the exact index with a single matrix product per namespace."""
+        if self.calculate_relatedness is not cosine_relatedness or (self.index_type == "hnsw" and count is not None):
+            return super().query_vectors(
+                vectors, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+            )
+
+        return [
+            self.__to_query_result(entries_and_relatednesses, count=count, include_vectors=include_vectors)
+            for entries_and_relatednesses in self.__query_indexes_batch(vectors, count=count, namespace=namespace)
+        ]
+
+    def delete_vector(self, vector_id: str) -> NoReturn:
+        raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
+
+    def delete_namespace(self, namespace: str) -> None:
+        """Deletes every Entry in the namespace along with its index, rewriting `persist_file` if there is one."""
+        with self.thread_lock:
+            self.__sync_indexes()
+
+            keys = [key for key, entry in self.entries.items() if entry.namespace == namespace]
+
+            if not keys:
+                return
+
+            for key in keys:
+                del self.entries[key]
+                del self._sequences[key]
+
+            self._indexes.pop(namespace, None)
+
+            if self.persist_file is not None and self.persist_format == "log":
+                self.__compact_log()
+
+        if self.persist_file is not None and self.persist_format == "json":
+            with open(self.persist_file, "w") as file:
+                self.__save_entries_to_file(file)
+
+    def _upsert_vectors_chunk(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        upserted = []
+
+        with self.thread_lock:
+            self.__sync_indexes()
+
+            try:
+                for entry in entries:
+                    vector_id = entry.id or utils.str_to_hash(str(entry.vector))
+                    key = self.__namespaced_vector_id(vector_id, namespace=entry.namespace)
+                    entry = self.Entry(id=vector_id, vector=entry.vector, meta=entry.meta, namespace=entry.namespace)
+
+                    self.__index_entry(key, entry)
+
+                    if key in self.entries:
+                        self._stale_log_records += 1
+
+                    self.entries[key] = entry
+                    upserted.append((key, entry))
+            finally:
+                # Entries upserted before a failing one are kept, so they have to be persisted as well
+                if upserted and self.persist_file is not None and self.persist_format == "log":
+                    self.__append_to_log(upserted)
+
+                    if self._stale_log_records >= self.log_compaction_threshold:
+                        self.__compact_log()
+
+        if self.persist_file is not None and self.persist_format == "json":
+            # The JSON format reserializes all entries every time vectors are upserted, use the log format for
+            #  append-only writes
+            with open(self.persist_file, "w") as file:
+                self.__save_entries_to_file(file)
+
+        return [entry.id for _, entry in upserted]
+
+    def compact_log(self) -> None:
+        """Rewrites the log and vectors sidecar so that they only contain the latest version of each entry."""
+        if self.persist_file is None or self.persist_format != "log":
+            raise ValueError("Log compaction requires a persist_file with the log persist_format.")
+
+        with self.thread_lock:
+            self.__compact_log()
+
+    def save_index(self) -> None:
+        """Writes the HNSW graph of every namespace to `index_file`."""
+        if self.index_file is None or self.index_type != "hnsw":
+            raise ValueError("Saving the index requires a persist_file with the hnsw index_type.")
+
+        with self.thread_lock:
+            self.__save_hnsw_indexes()
+
+    def __query_indexes(
+        self, vector: list[float], *, count: Optional[int], namespace: Optional[str]
+    ) -> list[tuple[BaseVectorStoreDriver.Entry, float]]:
+        query_vector = np.asarray(vector, dtype=np.float32)
+        query_norm = float(norm(np.asarray(vector, dtype=np.float64)))
+
+        with self.thread_lock:
+            self.__sync_indexes()
+
+            if namespace:
+                indexes = [self._indexes[namespace]] if namespace in self._indexes else []
+            else:
+                indexes = list(self._indexes.values())
+
+            if not indexes:
+                return []
+
+            scores = np.concatenate([index.scores(query_vector, query_norm) for index in indexes])
+            sequences = np.concatenate([index.sequences[: index.size] for index in indexes])
+            keys = [key for index in indexes for key in index.keys]
             entries = self.entries
 
-        entries_and_relatednesses = [
-            (entry, self.calculate_relatedness(query_embedding, entry.vector)) for entry in list(entries.values())
+        return self.__rank(scores, sequences, keys, entries, count=count)
+
+    def __query_indexes_batch(
+        self, vectors: list[list[float]], *, count: Optional[int], namespace: Optional[str]
+    ) -> list[list[tuple[BaseVectorStoreDriver.Entry, float]]]:
+        if not vectors:
+            return []
+
+        query_vectors = np.asarray(vectors, dtype=np.float32)
+        query_norms = norm(np.asarray(vectors, dtype=np.float64), axis=1)
+
+        with self.thread_lock:
+            self.__sync_indexes()
+
+            if namespace:
+                indexes = [self._indexes[namespace]] if namespace in self._indexes else []
+            else:
+                indexes = list(self._indexes.values())
+
+            if not indexes:
+                return [[] for _ in vectors]
+
+            scores = np.concatenate([index.batch_scores(query_vectors, query_norms) for index in indexes], axis=1)
+            sequences = np.concatenate([index.sequences[: index.size] for index in indexes])
+            keys = [key for index in indexes for key in index.keys]
+            entries = self.entries
+
+        return [self.__rank(query_scores, sequences, keys, entries, count=count) for query_scores in scores]
+
+    def __rank(
+        self,
+        scores: np.ndarray,
+        sequences: np.ndarray,
+        keys: list[str],
+        entries: dict[str, BaseVectorStoreDriver.Entry],
+        *,
+        count: Optional[int],
+    ) -> list[tuple[BaseVectorStoreDriver.Entry, float]]:
+        if count is not None and 0 < count < len(scores):
+            # Keep every row tied with the k-th best score so that ties are resolved in insertion order below.
+            kth_score = np.partition(-scores, count - 1)[count - 1]
+            candidates = np.flatnonzero(-scores <= kth_score)
+        else:
+            candidates = np.arange(len(scores))
+
+        order = candidates[np.lexsort((sequences[candidates], -scores[candidates]))]
+
+        return [(entries[keys[i]], float(scores[i])) for i in order]
+
+    def __to_query_result(
+        self,
+        entries_and_relatednesses: list[tuple[BaseVectorStoreDriver.Entry, float]],
+        *,
+        count: Optional[int],
+        include_vectors: bool,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        return [
+            BaseVectorStoreDriver.Entry(
+                id=entry.id,
+                vector=self.__with_list_vector(entry).vector if include_vectors else [],
+                score=score,
+                meta=entry.meta,
+                namespace=entry.namespace,
+            )
+            for entry, score in entries_and_relatednesses[:count]
         ]
 
-        entries_and_relatednesses.sort(key=operator.itemgetter(1), reverse=True)
+    def __with_list_vector(self, entry: BaseVectorStoreDriver.Entry) -> BaseVectorStoreDriver.Entry:
+        # Entries loaded from the log hold views of the memory-mapped vectors sidecar.
+        if isinstance(entry.vector, np.ndarray):
+            return replace(entry, vector=entry.vector.tolist())
+        else:
+            return entry
+
+    def __query_hnsw_indexes(
+        self, vector: list[float], *, count: int, namespace: Optional[str]
+    ) -> list[tuple[BaseVectorStoreDriver.Entry, float]]:
+        query_vector = np.asarray(vector, dtype=np.float32)
+        query_norm = float(norm(np.asarray(vector, dtype=np.float64)))
+        results = []
+
+        with self.thread_lock:
+            self.__sync_indexes()
+
+            if namespace:
+                indexes = [self._indexes[namespace]] if namespace in self._indexes else []
+            else:
+                indexes = list(self._indexes.values())
+
+            for index in indexes:
+                if not isinstance(index, LocalHnswVectorIndex):
+                    continue
+
+                rows, scores = index.search(query_vector, query_norm, count=count, ef=self.hnsw_ef_search)
+
+                results.extend(
+                    (float(score), int(index.sequences[row]), self.entries[index.keys[row]])
+                    for row, score in zip(rows, scores)
+                )
+
+        results.sort(key=lambda result: (-result[0], result[1]))
+
+        return [(entry, score) for score, _, entry in results[:count]]
+
+    def __index_entry(self, key: str, entry: BaseVectorStoreDriver.Entry) -> None:
+        if key not in self._sequences:
+            self._sequences[key] = self._next_sequence
+            self._next_sequence += 1
+
+        sequence = self._sequences[key]
 
-        result = [
-            BaseVectorStoreDriver.Entry(id=er[0].id, vector=er[0].vector, score=er[1], meta=er[0].meta)
-            for er in entries_and_relatednesses
-        ][:count]
+        if entry.vector is None:
+            return
 
-        if include_vectors:
-            return result
+        index = self._indexes.get(entry.namespace)
+
+        if index is None:
+            index = self.__create_index(len(entry.vector))
+            self._indexes[entry.namespace] = index
+
+        index.upsert(key, entry.vector, sequence)
+
+    def __sync_indexes(self) -> None:
+        # Rebuilds the indexes if the entries were replaced or modified outside of upsert_vector.
+        if self._indexed_entries is self.entries and len(self._sequences) == len(self.entries):
+            return
+
+        self._indexes = {}
+        self._sequences = {key: sequence for sequence, key in enumerate(self.entries)}
+        self._next_sequence = len(self._sequences)
+        self._indexed_entries = self.entries
+        restored_keys = self.__restore_hnsw_indexes()
+
+        for key, entry in self.entries.items():
+            if key not in restored_keys:
+                self.__index_entry(key, entry)
+
+    def __create_index(self, dimensions: int) -> LocalVectorIndex:
+        if self.index_type == "hnsw":
+            return self.__create_hnsw_index(dimensions)
         else:
-            return [
-                BaseVectorStoreDriver.Entry(id=r.id, vector=[], score=r.score, meta=r.meta, namespace=r.namespace)
-                for r in result
+            return LocalVectorIndex(dimensions=dimensions)
+
+    def __create_hnsw_index(self, dimensions: int) -> LocalHnswVectorIndex:
+        return LocalHnswVectorIndex(dimensions=dimensions, m=self.hnsw_m, ef_construction=self.hnsw_ef_construction)
+
+    def __restore_hnsw_indexes(self) -> set[str]:
+        # Saved graphs are only reused if every entry they cover still belongs to the same namespace. Entries that
+        # were upserted after the graph was saved are inserted into it incrementally by the caller.
+        restored_keys = set()
+
+        for namespace, saved_index in self._saved_indexes.items():
+            keys = saved_index["keys"]
+            entries = [self.entries.get(key) for key in keys]
+            vectors = [
+                entry.vector
+                for entry in entries
+                if entry is not None and entry.namespace == namespace and entry.vector is not None
             ]
 
-    def delete_vector(self, vector_id: str) -> NoReturn:
-        raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
+            if not keys or len(vectors) != len(keys):
+                continue
+
+            index = self.__create_hnsw_index(len(vectors[0]))
+
+            try:
+                index.restore(
+                    keys,
+                    vectors,
+                    [self._sequences[key] for key in keys],
+                    entry_point=saved_index["entry_point"],
+                    levels=saved_index["levels"],
+                    links=saved_index["links"],
+                )
+            except ValueError:
+                continue
+
+            self._indexes[namespace] = index
+            restored_keys.update(keys)
+
+        self._saved_indexes = {}
+
+        return restored_keys
+
+    def __load_log(self) -> None:
+        # Replays the log on top of the memory-mapped vectors sidecar. Records that were only partially written
+        # before a crash are truncated away, along with any vector bytes they reference.
+        log_file = str(self.persist_file)
+
+        if not os.path.isfile(log_file) or os.path.getsize(log_file) == 0:
+            self.__write_log(log_file, f"{os.path.basename(log_file)}.0.vectors", {})
+
+            return
+
+        records = {}
+        record_count = 0
+        log_end = 0
+        vectors_end = 0
+
+        with open(log_file, "rb") as file:
+            header = json.loads(file.readline())
+            log_end = file.tell()
+            self._vectors_file = os.path.join(os.path.dirname(log_file), header["vectors_file"])
+            vectors_size = os.path.getsize(self._vectors_file) if os.path.isfile(self._vectors_file) else 0
+
+            for line in file:
+                record = self.__parse_log_record(line)
+
+                if record is None:
+                    break
+
+                record_end = record["offset"] + record["dimensions"] * self.LOG_VECTOR_DTYPE.itemsize
+
+                if record_end > vectors_size:
+                    break
+
+                records[record["key"]] = record
+                record_count += 1
+                log_end += len(line)
+                vectors_end = max(vectors_end, record_end)
+
+        if log_end < os.path.getsize(log_file):
+            os.truncate(log_file, log_end)
+
+        if vectors_end < vectors_size:
+            os.truncate(self._vectors_file, vectors_end)
+
+        # Entries keep read-only views of the sidecar instead of lists, so vectors are only paged in when they are
+        # indexed, and only copied into lists when an Entry is returned.
+        vectors = np.memmap(self._vectors_file, dtype=np.uint8, mode="r") if vectors_end > 0 else None
+
+        self.entries = {
+            key: BaseVectorStoreDriver.Entry(
+                id=record["id"],
+                vector=self.__load_log_vector(vectors, record),
+                meta=record["meta"],
+                namespace=record["namespace"],
+            )
+            for key, record in records.items()
+        }
+        self._stale_log_records = record_count - len(records)
+        self.__remove_orphaned_vectors_files()
+
+        if self._stale_log_records >= self.log_compaction_threshold:
+            self.__compact_log()
+
+    def __load_log_vector(self, vectors: Optional[np.memmap], record: dict) -> list[float]:
+        if vectors is None:
+            return []
+
+        vector = np.frombuffer(
+            vectors, dtype=self.LOG_VECTOR_DTYPE, count=record["dimensions"], offset=record["offset"]
+        )
+
+        return cast("list[float]", vector)
+
+    def __append_to_log(self, upserted: list[tuple[str, BaseVectorStoreDriver.Entry]]) -> None:
+        records = []
+
+        with open(str(self._vectors_file), "ab") as file:
+            for key, entry in upserted:
+                vector = np.asarray(entry.vector, dtype=self.LOG_VECTOR_DTYPE)
+                offset = file.tell()
+                file.write(vector.tobytes())
+                records.append(self.__log_record(key, entry, offset=offset, dimensions=len(vector)))
+
+        with open(str(self.persist_file), "a") as file:
+            file.write("".join(records))
+
+    def __compact_log(self) -> None:
+        log_file = str(self.persist_file)
+        old_vectors_file = self._vectors_file
+        generation = int(str(old_vectors_file).split(".")[-2]) + 1 if old_vectors_file else 0
+
+        self.__write_log(log_file, f"{os.path.basename(log_file)}.{generation}.vectors", self.entries)
+
+        if old_vectors_file is not None and os.path.isfile(old_vectors_file):
+            os.remove(old_vectors_file)
+
+        self._stale_log_records = 0
+
+        if self.index_type == "hnsw":
+            self.__save_hnsw_indexes()
+
+    def __write_log(
+        self, log_file: str, vectors_file_name: str, entries: dict[str, BaseVectorStoreDriver.Entry]
+    ) -> None:
+        # The log is swapped in atomically only after the new sidecar is on disk, so a crash at any point leaves
+        # either the old or the new generation intact.
+        vectors_file = os.path.join(os.path.dirname(log_file), vectors_file_name)
+        temp_log_file = f"{log_file}.tmp"
+
+        with open(vectors_file, "wb") as vectors, open(temp_log_file, "w") as log:
+            log.write(json.dumps({"version": self.LOG_FORMAT_VERSION, "vectors_file": vectors_file_name}) + "\n")
+
+            for key, entry in entries.items():
+                vector = np.asarray(entry.vector, dtype=self.LOG_VECTOR_DTYPE)
+
+                log.write(self.__log_record(key, entry, offset=vectors.tell(), dimensions=len(vector)))
+                vectors.write(vector.tobytes())
+
+            vectors.flush()
+            os.fsync(vectors.fileno())
+            log.flush()
+            os.fsync(log.fileno())
+
+        os.replace(temp_log_file, log_file)
+
+        self._vectors_file = vectors_file
+
+    def __remove_orphaned_vectors_files(self) -> None:
+        directory = os.path.dirname(str(self.persist_file)) or "."
+        prefix = f"{os.path.basename(str(self.persist_file))}."
+
+        for file_name in os.listdir(directory):
+            path = os.path.join(directory, file_name)
+
+            if file_name.startswith(prefix) and file_name.endswith(".vectors") and path != self._vectors_file:
+                os.remove(path)
+
+    def __load_hnsw_indexes(self) -> None:
+        index_file = str(self.index_file)
+
+        if not os.path.isfile(index_file):
+            return
+
+        with np.load(index_file, allow_pickle=False) as data:
+            header = json.loads(str(data["header"]))
+
+            if (
+                header["version"] != self.INDEX_FORMAT_VERSION
+                or header["m"] != self.hnsw_m
+                or header["ef_construction"] != self.hnsw_ef_construction
+            ):
+                return
+
+            for i, namespace in enumerate(header["namespaces"]):
+                levels = data[f"{i}.levels"].tolist()
+                links = []
+
+                for layer in range(header["layers"][i]):
+                    layer_links = data[f"{i}.links.{layer}"]
+
+                    links.append(
+                        {
+                            row: [int(link) for link in row_links if link >= 0]
+                            for row, row_links in enumerate(layer_links)
+                            if levels[row] >= layer
+                        }
+                    )
+
+                self._saved_indexes[namespace] = {
+                    "keys": data[f"{i}.keys"].tolist(),
+                    "entry_point": int(data[f"{i}.entry_point"]),
+                    "levels": levels,
+                    "links": links,
+                }
+
+    def __save_hnsw_indexes(self) -> None:
+        # Links are stored as one padded row per entry and layer, with -1 marking unused slots.
+        self.__sync_indexes()
+
+        indexes = [
+            (namespace, index)
+            for namespace, index in self._indexes.items()
+            if isinstance(index, LocalHnswVectorIndex) and index.size > 0
+        ]
+        arrays = {}
+
+        for i, (_, index) in enumerate(indexes):
+            arrays[f"{i}.keys"] = np.array(index.keys, dtype=str)
+            arrays[f"{i}.entry_point"] = np.array(index.entry_point, dtype=np.int64)
+            arrays[f"{i}.levels"] = np.array(index.levels, dtype=np.int32)
+
+            for layer, layer_links in enumerate(index.links):
+                width = max((len(row_links) for row_links in layer_links.values()), default=0)
+                padded = np.full((index.size, width), -1, dtype=np.int32)
+
+                for row, row_links in layer_links.items():
+                    padded[row, : len(row_links)] = row_links
+
+                arrays[f"{i}.links.{layer}"] = padded
+
+        header = {
+            "version": self.INDEX_FORMAT_VERSION,
+            "m": self.hnsw_m,
+            "ef_construction": self.hnsw_ef_construction,
+            "namespaces": [namespace for namespace, _ in indexes],
+            "layers": [len(index.links) for _, index in indexes],
+        }
+        temp_index_file = f"{self.index_file}.tmp"
+
+        with open(temp_index_file, "wb") as file:
+            np.savez(file, header=np.array(json.dumps(header)), **arrays)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_index_file, str(self.index_file))
+
+    def __parse_log_record(self, line: bytes) -> Optional[dict]:
+        if not line.endswith(b"\n"):
+            return None
+
+        try:
+            return json.loads(line)
+        except ValueError:
+            return None
+
+    def __log_record(self, key: str, entry: BaseVectorStoreDriver.Entry, *, offset: int, dimensions: int) -> str:
+        record: dict[str, Any] = {
+            "key": key,
+            "id": entry.id,
+            "namespace": entry.namespace,
+            "meta": entry.meta,
+            "offset": offset,
+            "dimensions": dimensions,
+        }
+
+        return json.dumps(record) + "\n"
 
     def __save_entries_to_file(self, json_file: TextIO) -> None:
         with self.thread_lock:
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, NoReturn, Optional
+from typing import TYPE_CHECKING, Any, NoReturn, Optional, cast
 
 from attrs import define, field
 
 from griptape import utils
 from griptape.drivers import BaseVectorStoreDriver
-from griptape.utils import import_optional_dependency
+from griptape.utils import import_optional_dependency, with_contextvars
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     import marqo
 
     from griptape.artifacts import TextArtifact
@@ -70,6 +72,44 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         else:
             raise ValueError(f"Failed to upsert text: {response}")
 
+    def upsert_text_artifacts(
+        self,
+        artifacts: Iterable[TextArtifact] | dict[str, Iterable[TextArtifact]],
+        *,
+        meta: Optional[dict] = None,
+        **kwargs,
+    ) -> list[str] | dict[str, list[str]]:
+        """Upsert text artifacts into the Marqo index.
+
+        Marqo generates embeddings server-side, so each artifact is upserted with `upsert_text_artifact` instead of
+        being embedded in batches by the Embedding Driver.
+        """
+        if not isinstance(artifacts, dict):
+            return utils.execute_futures_list(
+                [
+                    self.futures_executor.submit(
+                        with_contextvars(self.upsert_text_artifact), a, namespace=None, meta=meta, **kwargs
+                    )
+                    for a in artifacts
+                ],
+            )
+        else:
+            # Narrowing by isinstance can't tell a dict of namespaces apart from an Iterable that is also a dict
+            namespaced_artifacts = cast("dict[str, Iterable[TextArtifact]]", artifacts)
+
+            return utils.execute_futures_list_dict(
+                {
+                    namespace: [
+                        self.futures_executor.submit(
+                            with_contextvars(self.upsert_text_artifact), a, namespace=namespace, meta=meta, **kwargs
+                        )
+                        for a in artifact_list
+                    ]
+                    for namespace, artifact_list in namespaced_artifacts.items()
+                    if artifact_list
+                }
+            )
+
     def upsert_text_artifact(
         self,
         artifact: TextArtifact,
@@ -74,6 +74,29 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
             )
         return vector_id
 
+    def _upsert_vectors_chunk(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Upserts a chunk of Entries with a single `bulk_write` request."""
+        pymongo = import_optional_dependency("pymongo")
+        object_id = import_optional_dependency("bson").ObjectId
+        vector_ids = []
+        operations = []
+
+        for entry in entries:
+            document = {self.vector_path: entry.vector, "namespace": entry.namespace, "meta": entry.meta}
+
+            if entry.id is None:
+                document["_id"] = object_id()
+
+                operations.append(pymongo.InsertOne(document))
+                vector_ids.append(str(document["_id"]))
+            else:
+                operations.append(pymongo.ReplaceOne({"_id": entry.id}, document, upsert=True))
+                vector_ids.append(entry.id)
+
+        self.get_collection().bulk_write(operations)
+
+        return vector_ids
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Loads a document entry from the MongoDB collection based on the vector ID.
 
@@ -114,9 +137,9 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
             for doc in cursor
         ]
 
-    def query(
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         *,
         count: Optional[int] = None,
         namespace: Optional[str] = None,
@@ -124,15 +147,12 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
         offset: Optional[int] = None,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
-        """Queries the MongoDB collection for documents that match the provided query string.
+        """Queries the MongoDB collection for documents that match the provided query vector.
 
         Results can be customized based on parameters like count, namespace, inclusion of vectors, offset, and index.
         """
         collection = self.get_collection()
 
-        # Using the embedding driver to convert the query string into a vector
-        vector = self.embedding_driver.embed_string(query)
-
         count = count or BaseVectorStoreDriver.DEFAULT_QUERY_COUNT
         offset = offset or 0
 
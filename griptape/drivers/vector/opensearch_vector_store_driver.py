@@ -68,6 +68,27 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
 
         return response["_id"]
 
+    def _upsert_vectors_chunk(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Upserts a chunk of Entries with a single `_bulk` request."""
+        actions = []
+
+        for entry in entries:
+            vector_id = entry.id or utils.str_to_hash(str(entry.vector))
+            doc = {"vector": entry.vector, "namespace": entry.namespace, "metadata": entry.meta}
+            doc.update(kwargs)
+
+            actions.extend([self._bulk_index_action(vector_id), doc])
+
+        response = self.client.bulk(body=actions)
+        items = [item["index"] for item in response["items"]]
+
+        if response["errors"]:
+            errors = [item["error"] for item in items if "error" in item]
+
+            raise RuntimeError(f"Failed to upsert {len(errors)} of {len(items)} vectors: {errors[0]}")
+
+        return [item["_id"] for item in items]
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Retrieves a specific vector entry from OpenSearch based on its identifier and optional namespace.
 
@@ -119,9 +140,9 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
             for hit in response["hits"]["hits"]
         ]
 
-    def query(
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         *,
         count: Optional[int] = None,
         namespace: Optional[str] = None,
@@ -130,7 +151,7 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
         field_name: str = "vector",
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
-        """Performs a nearest neighbor search on OpenSearch to find vectors similar to the provided query string.
+        """Performs a nearest neighbor search on OpenSearch to find vectors similar to the provided query vector.
 
         Results can be limited using the count parameter and optionally filtered by a namespace.
 
@@ -138,7 +159,6 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
             A list of BaseVectorStoreDriver.Entry objects, each encapsulating the retrieved vector, its similarity score, metadata, and namespace.
         """
         count = count or BaseVectorStoreDriver.DEFAULT_QUERY_COUNT
-        vector = self.embedding_driver.embed_string(query)
         # Base k-NN query
         query_body = {"size": count, "query": {"knn": {field_name: {"vector": vector, "k": count}}}}
 
@@ -165,5 +185,8 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
             for hit in response["hits"]["hits"]
         ]
 
+    def _bulk_index_action(self, vector_id: str) -> dict:
+        return {"index": {"_index": self.index_name, "_id": vector_id}}
+
     def delete_vector(self, vector_id: str) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
@@ -92,6 +92,30 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
 
             return str(getattr(obj, "id"))
 
+    def _upsert_vectors_chunk(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Upserts a chunk of Entries with a single multi-row `INSERT ... ON CONFLICT DO UPDATE` statement."""
+        sqlalchemy_dialects_postgresql = import_optional_dependency("sqlalchemy.dialects.postgresql")
+        sqlalchemy_orm = import_optional_dependency("sqlalchemy.orm")
+
+        vector_ids = [entry.id or str(uuid.uuid4()) for entry in entries]
+        # Later Entries win when a chunk repeats an ID, Postgres rejects rows that conflict within one statement
+        rows = {
+            vector_id: {"id": vector_id, "vector": entry.vector, "namespace": entry.namespace, "meta": entry.meta}
+            | kwargs
+            for vector_id, entry in zip(vector_ids, entries)
+        }
+        statement = sqlalchemy_dialects_postgresql.insert(self._model).values(list(rows.values()))
+        statement = statement.on_conflict_do_update(
+            index_elements=["id"],
+            set_={column: statement.excluded[column] for column in rows[next(iter(rows))] if column != "id"},
+        )
+
+        with sqlalchemy_orm.Session(self.engine) as session:
+            session.execute(statement)
+            session.commit()
+
+        return [str(vector_id) for vector_id in vector_ids]
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> BaseVectorStoreDriver.Entry:
         """Retrieves a specific vector entry from the collection based on its identifier and optional namespace."""
         sqlalchemy_orm = import_optional_dependency("sqlalchemy.orm")
@@ -134,6 +158,17 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
         count: Optional[int] = BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
+        **kwargs,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        return super().query(query, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs)
+
+    def query_vector(
+        self,
+        vector: list[float],
+        *,
+        count: Optional[int] = BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
         distance_metric: str = "cosine_distance",
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
@@ -152,8 +187,6 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
         op = distance_metrics[distance_metric]
 
         with sqlalchemy_orm.Session(self.engine) as session:
-            vector = self.embedding_driver.embed_string(query)
-
             # The query should return both the vector and the distance metric score.
             query_result = session.query(self._model, op(vector).label("score")).order_by(op(vector))  # pyright: ignore[reportOptionalCall]
 
@@ -49,6 +49,21 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
 
         return vector_id
 
+    def _upsert_vectors_chunk(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        vector_ids = [entry.id or str_to_hash(str(entry.vector)) for entry in entries]
+        namespaced_vectors: dict[Optional[str], list[tuple]] = {}
+
+        for vector_id, entry in zip(vector_ids, entries):
+            namespaced_vectors.setdefault(entry.namespace, []).append((vector_id, entry.vector, entry.meta))
+
+        # Pinecone scopes upserts to a single namespace, so each namespace in the chunk is sent as its own batch
+        for namespace, vectors in namespaced_vectors.items():
+            params: dict[str, Any] = {"namespace": namespace} | kwargs
+
+            self.index.upsert(vectors=vectors, **params)
+
+        return vector_ids
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         result = self.index.fetch(ids=[vector_id], namespace=namespace).to_dict()
         vectors = list(result["vectors"].values())
@@ -87,9 +102,9 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
             for r in results["matches"]
         ]
 
-    def query(
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         *,
         count: Optional[int] = None,
         namespace: Optional[str] = None,
@@ -97,8 +112,6 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
         include_metadata: bool = True,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
-        vector = self.embedding_driver.embed_string(query)
-
         params = {
             "top_k": count or BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
             "namespace": namespace,
@@ -93,9 +93,9 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
         if deletion_response.status == import_optional_dependency("qdrant_client.http.models").UpdateStatus.COMPLETED:
             logging.info("ID %s is successfully deleted", vector_id)
 
-    def query(
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         *,
         count: Optional[int] = None,
         namespace: Optional[str] = None,
@@ -105,7 +105,7 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
         """Query the Qdrant collection based on a query vector.
 
         Parameters:
-            query (str): Query string.
+            vector (list[float]): Query vector.
             count (Optional[int]): Optional number of results to return.
             namespace (Optional[str]): Optional namespace of the vectors.
             include_vectors (bool): Whether to include vectors in the results.
@@ -113,10 +113,8 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
         Returns:
             list[BaseVectorStoreDriver.Entry]: List of Entry objects.
         """
-        query_vector = self.embedding_driver.embed_string(query)
-
         # Create a search request
-        request = {"collection_name": self.collection_name, "query_vector": query_vector, "limit": count}
+        request = {"collection_name": self.collection_name, "query_vector": vector, "limit": count}
         request = {k: v for k, v in request.items() if v is not None}
         results = self.client.search(**request)
 
@@ -171,6 +169,27 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
         self.client.upsert(collection_name=self.collection_name, points=points)
         return vector_id
 
+    def _upsert_vectors_chunk(
+        self, entries: list[BaseVectorStoreDriver.Entry], *, content: Optional[str] = None, **kwargs
+    ) -> list[str]:
+        if kwargs:
+            raise ValueError(f"Unsupported upsert arguments for {self.__class__.__name__}: {', '.join(kwargs)}.")
+
+        vector_ids = [entry.id or str(uuid.uuid5(uuid.NAMESPACE_DNS, str(entry.vector))) for entry in entries]
+        payloads = [
+            {**(entry.meta or {}), self.content_payload_key: content} if content else entry.meta or {}
+            for entry in entries
+        ]
+
+        points = import_optional_dependency("qdrant_client.http.models").Batch(
+            ids=vector_ids,
+            vectors=[entry.vector for entry in entries],
+            payloads=payloads if any(payloads) else None,
+        )
+
+        self.client.upsert(collection_name=self.collection_name, points=points)
+        return vector_ids
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Load a vector entry from the Qdrant collection based on its ID.
 
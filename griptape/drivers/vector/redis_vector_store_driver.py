@@ -60,22 +60,24 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         Metadata associated with the vector can also be provided.
         """
         vector_id = vector_id or str_to_hash(str(vector))
-        key = self._generate_key(vector_id, namespace)
-        bytes_vector = json.dumps(vector).encode("utf-8")
 
-        mapping = {}
-        mapping["vector"] = np.array(vector, dtype=np.float32).tobytes()
-        mapping["vec_string"] = bytes_vector
+        self.client.hset(self._generate_key(vector_id, namespace), mapping=self._build_mapping(vector, namespace, meta))
 
-        if namespace:
-            mapping["namespace"] = namespace
+        return vector_id
 
-        if meta:
-            mapping["metadata"] = json.dumps(meta)
+    def _upsert_vectors_chunk(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        vector_ids = [entry.id or str_to_hash(str(entry.vector)) for entry in entries]
+        pipeline = self.client.pipeline(transaction=False)
+
+        for vector_id, entry in zip(vector_ids, entries):
+            pipeline.hset(
+                self._generate_key(vector_id, entry.namespace),
+                mapping=self._build_mapping(entry.vector, entry.namespace, entry.meta),  # pyright: ignore[reportArgumentType]
+            )
 
-        self.client.hset(key, mapping=mapping)
+        pipeline.execute()
 
-        return vector_id
+        return vector_ids
 
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Retrieves a specific vector entry from Redis based on its identifier and optional namespace.
@@ -107,9 +109,9 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
 
         return entries
 
-    def query(
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         *,
         count: Optional[int] = None,
         namespace: Optional[str] = None,
@@ -125,8 +127,6 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         """
         search_query = import_optional_dependency("redis.commands.search.query")
 
-        vector = self.embedding_driver.embed_string(query)
-
         filter_expression = f"(@namespace:{{{namespace}}})" if namespace else "*"
         query_expression = (
             search_query.Query(f"{filter_expression}=>[KNN {count or 10} @vector $vector as score]")
@@ -161,6 +161,20 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         """Generates a Redis key using the provided vector ID and optionally a namespace."""
         return f"{namespace}:{vector_id}" if namespace else vector_id
 
+    def _build_mapping(self, vector: list[float], namespace: Optional[str], meta: Optional[dict]) -> dict:
+        """Builds the Redis hash fields stored for a vector."""
+        mapping = {}
+        mapping["vector"] = np.array(vector, dtype=np.float32).tobytes()
+        mapping["vec_string"] = json.dumps(vector).encode("utf-8")
+
+        if namespace:
+            mapping["namespace"] = namespace
+
+        if meta:
+            mapping["metadata"] = json.dumps(meta)
+
+        return mapping
+
     def _get_doc_prefix(self, namespace: Optional[str] = None) -> str:
         """Get the document prefix based on the provided namespace."""
         return f"{namespace}:" if namespace else ""
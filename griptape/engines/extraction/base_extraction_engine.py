@@ -1,23 +1,47 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional, TypeVar
 
 from attrs import Attribute, Factory, define, field
 
-from griptape.artifacts import ListArtifact, TextArtifact
+from griptape.artifacts import BaseArtifact, ListArtifact, TextArtifact
 from griptape.chunkers import BaseChunker, TextChunker
+from griptape.common import Message, PromptStack
 from griptape.configs import Defaults
+from griptape.mixins.futures_executor_mixin import FuturesExecutorMixin
+from griptape.utils import execute_futures_list, with_contextvars
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from griptape.drivers import BasePromptDriver
     from griptape.rules import Ruleset
+    from griptape.utils import J2
+
+A = TypeVar("A", bound=BaseArtifact)
 
 
 @define
-class BaseExtractionEngine(ABC):
+class BaseExtractionEngine(FuturesExecutorMixin, ABC):
+    """Extracts structured data from text with a Prompt Driver.
+
+    Attributes:
+        max_token_multiplier: Fraction of the Prompt Driver's max input tokens to chunk text to.
+        chunk_joiner: Joins Artifacts before they are chunked.
+        parallel: Whether to chunk text that doesn't fit in one prompt once and extract from all chunks concurrently,
+            with the `futures_executor`, instead of one chunk after another. Can be overridden per call with the
+            `parallel` keyword argument of `extract_artifacts`.
+        deduplicate: Whether to drop extracted Artifacts with the same text as an earlier one. Can be overridden per
+            call with the `deduplicate` keyword argument of `extract_artifacts`.
+        prompt_driver: Prompt Driver used to extract.
+        chunker: Chunker used to split text that doesn't fit in one prompt.
+    """
+
     max_token_multiplier: float = field(default=0.5, kw_only=True)
     chunk_joiner: str = field(default="\n\n", kw_only=True)
+    parallel: bool = field(default=False, kw_only=True)
+    deduplicate: bool = field(default=False, kw_only=True)
     prompt_driver: BasePromptDriver = field(
         default=Factory(lambda: Defaults.drivers_config.prompt_driver), kw_only=True
     )
@@ -64,3 +88,57 @@ class BaseExtractionEngine(ABC):
         rulesets: Optional[list[Ruleset]] = None,
         **kwargs,
     ) -> ListArtifact: ...
+
+    def _extract_parallel(
+        self,
+        artifacts: list[TextArtifact],
+        *,
+        system_prompt: str,
+        user_template: J2,
+        parse: Callable[[str], Sequence[A]],
+    ) -> list[A]:
+        """Chunks the Artifacts once and extracts from every chunk concurrently.
+
+        Returns:
+            The extracted Artifacts, in chunk order.
+        """
+        artifacts_text = self.chunk_joiner.join([a.value for a in artifacts])
+        user_prompt = user_template.render(text=artifacts_text)
+
+        if self._fits(system_prompt, user_prompt):
+            user_prompts = [user_prompt]
+        else:
+            user_prompts = [user_template.render(text=chunk.value) for chunk in self.chunker.chunk(artifacts_text)]
+
+        outputs = execute_futures_list(
+            [
+                self.futures_executor.submit(with_contextvars(self._run_prompt), system_prompt, user_prompt)
+                for user_prompt in user_prompts
+            ]
+        )
+
+        return [artifact for output in outputs for artifact in parse(output)]
+
+    def _deduplicate(self, artifacts: list[A]) -> list[A]:
+        unique_artifacts = {}
+
+        for artifact in artifacts:
+            unique_artifacts.setdefault(artifact.to_text(), artifact)
+
+        return list(unique_artifacts.values())
+
+    def _fits(self, system_prompt: str, user_prompt: str) -> bool:
+        return (
+            self.prompt_driver.tokenizer.count_input_tokens_left(system_prompt + user_prompt)
+            >= self.min_response_tokens
+        )
+
+    def _run_prompt(self, system_prompt: str, user_prompt: str) -> str:
+        return self.prompt_driver.run(
+            PromptStack(
+                messages=[
+                    Message(system_prompt, role=Message.SYSTEM_ROLE),
+                    Message(user_prompt, role=Message.USER_ROLE),
+                ]
+            )
+        ).value
@@ -7,7 +7,6 @@ from typing import TYPE_CHECKING, Callable, Optional, cast
 from attrs import Factory, define, field
 
 from griptape.artifacts import ListArtifact, TextArtifact
-from griptape.common import Message, PromptStack
 from griptape.engines import BaseExtractionEngine
 from griptape.utils import J2
 
@@ -28,16 +27,24 @@ class CsvExtractionEngine(BaseExtractionEngine):
         artifacts: ListArtifact[TextArtifact],
         *,
         rulesets: Optional[list[Ruleset]] = None,
+        parallel: Optional[bool] = None,
+        deduplicate: Optional[bool] = None,
         **kwargs,
     ) -> ListArtifact[TextArtifact]:
-        return ListArtifact(
-            self._extract_rec(
+        if self.parallel if parallel is None else parallel:
+            rows = self._extract_parallel(
                 cast(list[TextArtifact], artifacts.value),
-                [TextArtifact(self.format_header(self.column_names))],
-                rulesets=rulesets,
-            ),
-            item_separator="\n",
-        )
+                system_prompt=self.__render_system_prompt(rulesets),
+                user_template=self.generate_user_template,
+                parse=self.text_to_csv_rows,
+            )
+        else:
+            rows = self._extract_rec(cast(list[TextArtifact], artifacts.value), [], rulesets=rulesets)
+
+        if self.deduplicate if deduplicate is None else deduplicate:
+            rows = self._deduplicate(rows)
+
+        return ListArtifact([TextArtifact(self.format_header(self.column_names)), *rows], item_separator="\n")
 
     def text_to_csv_rows(self, text: str) -> list[TextArtifact]:
         rows = []
@@ -56,30 +63,13 @@ class CsvExtractionEngine(BaseExtractionEngine):
         rulesets: Optional[list[Ruleset]] = None,
     ) -> list[TextArtifact]:
         artifacts_text = self.chunk_joiner.join([a.value for a in artifacts])
-        system_prompt = self.generate_system_template.render(
-            column_names=self.column_names,
-            rulesets=J2("rulesets/rulesets.j2").render(rulesets=rulesets),
-        )
+        system_prompt = self.__render_system_prompt(rulesets)
         user_prompt = self.generate_user_template.render(
             text=artifacts_text,
         )
 
-        if (
-            self.prompt_driver.tokenizer.count_input_tokens_left(system_prompt + user_prompt)
-            >= self.min_response_tokens
-        ):
-            rows.extend(
-                self.text_to_csv_rows(
-                    self.prompt_driver.run(
-                        PromptStack(
-                            messages=[
-                                Message(system_prompt, role=Message.SYSTEM_ROLE),
-                                Message(user_prompt, role=Message.USER_ROLE),
-                            ]
-                        )
-                    ).value,
-                ),
-            )
+        if self._fits(system_prompt, user_prompt):
+            rows.extend(self.text_to_csv_rows(self._run_prompt(system_prompt, user_prompt)))
 
             return rows
         else:
@@ -88,17 +78,12 @@ class CsvExtractionEngine(BaseExtractionEngine):
                 text=chunks[0].value,
             )
 
-            rows.extend(
-                self.text_to_csv_rows(
-                    self.prompt_driver.run(
-                        PromptStack(
-                            messages=[
-                                Message(system_prompt, role=Message.SYSTEM_ROLE),
-                                Message(partial_text, role=Message.USER_ROLE),
-                            ]
-                        )
-                    ).value,
-                ),
-            )
+            rows.extend(self.text_to_csv_rows(self._run_prompt(system_prompt, partial_text)))
 
             return self._extract_rec(chunks[1:], rows, rulesets=rulesets)
+
+    def __render_system_prompt(self, rulesets: Optional[list[Ruleset]]) -> str:
+        return self.generate_system_template.render(
+            column_names=self.column_names,
+            rulesets=J2("rulesets/rulesets.j2").render(rulesets=rulesets),
+        )
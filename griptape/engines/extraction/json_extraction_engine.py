@@ -7,8 +7,6 @@ from typing import TYPE_CHECKING, Optional, cast
 from attrs import Factory, define, field
 
 from griptape.artifacts import JsonArtifact, ListArtifact, TextArtifact
-from griptape.common import PromptStack
-from griptape.common.prompt_stack.messages.message import Message
 from griptape.engines import BaseExtractionEngine
 from griptape.utils import J2
 
@@ -29,12 +27,24 @@ class JsonExtractionEngine(BaseExtractionEngine):
         artifacts: ListArtifact[TextArtifact],
         *,
         rulesets: Optional[list[Ruleset]] = None,
+        parallel: Optional[bool] = None,
+        deduplicate: Optional[bool] = None,
         **kwargs,
     ) -> ListArtifact[JsonArtifact]:
-        return ListArtifact(
-            self._extract_rec(cast(list[TextArtifact], artifacts.value), [], rulesets=rulesets),
-            item_separator="\n",
-        )
+        if self.parallel if parallel is None else parallel:
+            extractions = self._extract_parallel(
+                cast(list[TextArtifact], artifacts.value),
+                system_prompt=self.__render_system_prompt(rulesets),
+                user_template=self.generate_user_template,
+                parse=self.json_to_text_artifacts,
+            )
+        else:
+            extractions = self._extract_rec(cast(list[TextArtifact], artifacts.value), [], rulesets=rulesets)
+
+        if self.deduplicate if deduplicate is None else deduplicate:
+            extractions = self._deduplicate(extractions)
+
+        return ListArtifact(extractions, item_separator="\n")
 
     def json_to_text_artifacts(self, json_input: str) -> list[JsonArtifact]:
         json_matches = re.findall(self.JSON_PATTERN, json_input, re.DOTALL)
@@ -52,30 +62,13 @@ class JsonExtractionEngine(BaseExtractionEngine):
         rulesets: Optional[list[Ruleset]] = None,
     ) -> list[JsonArtifact]:
         artifacts_text = self.chunk_joiner.join([a.value for a in artifacts])
-        system_prompt = self.generate_system_template.render(
-            json_template_schema=json.dumps(self.template_schema),
-            rulesets=J2("rulesets/rulesets.j2").render(rulesets=rulesets),
-        )
+        system_prompt = self.__render_system_prompt(rulesets)
         user_prompt = self.generate_user_template.render(
             text=artifacts_text,
         )
 
-        if (
-            self.prompt_driver.tokenizer.count_input_tokens_left(user_prompt + system_prompt)
-            >= self.min_response_tokens
-        ):
-            extractions.extend(
-                self.json_to_text_artifacts(
-                    self.prompt_driver.run(
-                        PromptStack(
-                            messages=[
-                                Message(system_prompt, role=Message.SYSTEM_ROLE),
-                                Message(user_prompt, role=Message.USER_ROLE),
-                            ]
-                        )
-                    ).value
-                ),
-            )
+        if self._fits(system_prompt, user_prompt):
+            extractions.extend(self.json_to_text_artifacts(self._run_prompt(system_prompt, user_prompt)))
 
             return extractions
         else:
@@ -84,17 +77,12 @@ class JsonExtractionEngine(BaseExtractionEngine):
                 text=chunks[0].value,
             )
 
-            extractions.extend(
-                self.json_to_text_artifacts(
-                    self.prompt_driver.run(
-                        PromptStack(
-                            messages=[
-                                Message(system_prompt, role=Message.SYSTEM_ROLE),
-                                Message(partial_text, role=Message.USER_ROLE),
-                            ]
-                        )
-                    ).value,
-                ),
-            )
+            extractions.extend(self.json_to_text_artifacts(self._run_prompt(system_prompt, partial_text)))
 
             return self._extract_rec(chunks[1:], extractions, rulesets=rulesets)
+
+    def __render_system_prompt(self, rulesets: Optional[list[Ruleset]]) -> str:
+        return self.generate_system_template.render(
+            json_template_schema=json.dumps(self.template_schema),
+            rulesets=J2("rulesets/rulesets.j2").render(rulesets=rulesets),
+        )
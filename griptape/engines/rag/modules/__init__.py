@@ -5,7 +5,7 @@ from .retrieval.base_retrieval_rag_module import BaseRetrievalRagModule
 from .retrieval.base_rerank_rag_module import BaseRerankRagModule
 from .retrieval.text_chunks_rerank_rag_module import TextChunksRerankRagModule
 from .retrieval.vector_store_retrieval_rag_module import VectorStoreRetrievalRagModule
-from .retrieval.text_loader_retrieval_rag_module import TextLoaderRetrievalRagModule
+from .retrieval.text_loader_retrieval_rag_module import IngestionCacheStats, TextLoaderRetrievalRagModule
 from .response.base_before_response_rag_module import BaseBeforeResponseRagModule
 from .response.base_after_response_rag_module import BaseAfterResponseRagModule
 from .response.base_response_rag_module import BaseResponseRagModule
@@ -22,6 +22,7 @@ __all__ = [
     "TextChunksRerankRagModule",
     "VectorStoreRetrievalRagModule",
     "TextLoaderRetrievalRagModule",
+    "IngestionCacheStats",
     "BaseBeforeResponseRagModule",
     "BaseAfterResponseRagModule",
     "BaseResponseRagModule",
@@ -27,31 +27,54 @@ class PromptResponseRagModule(BaseResponseRagModule, RuleMixin):
 
     def run(self, context: RagContext) -> BaseArtifact:
         query = context.query
-        tokenizer = self.prompt_driver.tokenizer
-        included_chunks = []
-        system_prompt = self.generate_system_template(context, included_chunks)
+        system_prompt, dropped_chunks = self.__pack_text_chunks(context)
+
+        output = self.prompt_driver.run(self.generate_prompt_stack(system_prompt, query)).to_artifact()
+
+        if isinstance(output, TextArtifact):
+            output.meta["dropped_chunk_ids"] = [chunk.id for chunk in dropped_chunks]
 
-        for artifact in context.text_chunks:
-            included_chunks.append(artifact)
+            return output
+        else:
+            raise ValueError("Prompt driver did not return a TextArtifact")
 
-            system_prompt = self.generate_system_template(context, included_chunks)
-            message_token_count = self.prompt_driver.tokenizer.count_tokens(
-                self.prompt_driver.prompt_stack_to_string(self.generate_prompt_stack(system_prompt, query)),
+    def __pack_text_chunks(self, context: RagContext) -> tuple[str, list[TextArtifact]]:
+        # Fills the token budget with the highest ranked chunks that fit. Each chunk's cost is the number of tokens it
+        # adds to the system prompt on its own, so the template is rendered and tokenized once per chunk.
+        tokenizer = self.prompt_driver.tokenizer
+        max_tokens = tokenizer.max_input_tokens - self.answer_token_offset
+        empty_system_prompt = self.generate_system_template(context, [])
+        empty_system_prompt_tokens = tokenizer.count_tokens(empty_system_prompt)
+        chunk_costs = [
+            token_count - empty_system_prompt_tokens
+            for token_count in tokenizer.count_tokens_batch(
+                [self.generate_system_template(context, [chunk]) for chunk in context.text_chunks]
             )
+        ]
+        tokens_left = max_tokens - self.__count_prompt_tokens(empty_system_prompt, context.query)
+        included_indices = []
 
-            if message_token_count + self.answer_token_offset >= tokenizer.max_input_tokens:
-                included_chunks.pop()
+        for i, cost in enumerate(chunk_costs):
+            if cost < tokens_left:
+                included_indices.append(i)
+                tokens_left -= cost
 
-                system_prompt = self.generate_system_template(context, included_chunks)
+        system_prompt = self.generate_system_template(context, [context.text_chunks[i] for i in included_indices])
 
-                break
+        # Costs measured one chunk at a time can be a few tokens short of the full prompt's, e.g. when the template
+        # has a header for the first chunk. In that case the lowest ranked chunks are dropped until the prompt fits.
+        while included_indices and self.__count_prompt_tokens(system_prompt, context.query) >= max_tokens:
+            included_indices.pop()
+            system_prompt = self.generate_system_template(context, [context.text_chunks[i] for i in included_indices])
 
-        output = self.prompt_driver.run(self.generate_prompt_stack(system_prompt, query)).to_artifact()
+        included = set(included_indices)
 
-        if isinstance(output, TextArtifact):
-            return output
-        else:
-            raise ValueError("Prompt driver did not return a TextArtifact")
+        return system_prompt, [chunk for i, chunk in enumerate(context.text_chunks) if i not in included]
+
+    def __count_prompt_tokens(self, system_prompt: str, query: str) -> int:
+        return self.prompt_driver.tokenizer.count_tokens(
+            self.prompt_driver.prompt_stack_to_string(self.generate_prompt_stack(system_prompt, query))
+        )
 
     def default_generate_system_template(self, context: RagContext, artifacts: list[TextArtifact]) -> str:
         params: dict[str, Any] = {"text_chunks": [c.to_text() for c in artifacts]}
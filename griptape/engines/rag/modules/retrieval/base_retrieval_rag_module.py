@@ -1,14 +1,68 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from typing import TYPE_CHECKING
 
 from attrs import define
 
-from griptape.artifacts import BaseArtifact
+from griptape import utils
 from griptape.engines.rag import RagContext
 from griptape.engines.rag.modules import BaseRagModule
+from griptape.utils import with_contextvars
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from griptape.artifacts import BaseArtifact
+    from griptape.drivers import BaseVectorStoreDriver
 
 
 @define(kw_only=True)
 class BaseRetrievalRagModule(BaseRagModule, ABC):
     @abstractmethod
     def run(self, context: RagContext) -> Sequence[BaseArtifact]: ...
+
+    def run_batch(self, contexts: Sequence[RagContext]) -> Sequence[Sequence[BaseArtifact]]:
+        """Runs the module for several contexts, one result per context.
+
+        Runs `run` concurrently for every context by default. Modules that can retrieve for several queries at once
+        override this.
+        """
+        return utils.execute_futures_list(
+            [self.futures_executor.submit(with_contextvars(self.run), context) for context in contexts]
+        )
+
+    def query_vector_store(
+        self, context: RagContext, vector_store_driver: BaseVectorStoreDriver, **kwargs
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        """Queries the Vector Store Driver with the context's query.
+
+        Queries are embedded once per Embedding Driver model and RagContext, and shared by all modules. Drivers that
+        embed queries server-side are queried with the query string.
+        """
+        if vector_store_driver.supports_query_vector:
+            return vector_store_driver.query_vector(
+                context.get_query_embedding(vector_store_driver.embedding_driver), **kwargs
+            )
+        else:
+            return vector_store_driver.query(context.query, **kwargs)
+
+    def query_vector_store_batch(
+        self, contexts: Sequence[RagContext], vector_store_driver: BaseVectorStoreDriver, **kwargs
+    ) -> list[list[BaseVectorStoreDriver.Entry]]:
+        """Queries the Vector Store Driver with the queries of several contexts, one result per context.
+
+        Queries are embedded with a single call to `embed_strings` and the Vector Store Driver is queried with
+        `query_vectors`. Drivers that embed queries server-side are queried with each query string.
+        """
+        if vector_store_driver.supports_query_vector:
+            return vector_store_driver.query_vectors(
+                RagContext.get_query_embeddings(contexts, vector_store_driver.embedding_driver), **kwargs
+            )
+        else:
+            return utils.execute_futures_list(
+                [
+                    self.futures_executor.submit(with_contextvars(vector_store_driver.query), context.query, **kwargs)
+                    for context in contexts
+                ]
+            )
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-import uuid
-from typing import TYPE_CHECKING, Any, Callable
+import logging
+import threading
+import time
+from collections import OrderedDict
+from itertools import takewhile
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
-from attrs import Factory, define, field
+from attrs import Attribute, Factory, define, field
 
 from griptape import utils
 from griptape.chunkers import TextChunker
@@ -18,8 +22,43 @@ if TYPE_CHECKING:
     from griptape.loaders import TextLoader
 
 
+@define(frozen=True, kw_only=True)
+class IngestionCacheStats:
+    """Point in time statistics of the sources ingested by a TextLoaderRetrievalRagModule.
+
+    Attributes:
+        hits: Number of runs that reused an ingested source.
+        misses: Number of runs that ingested their source.
+        evictions: Number of ingested sources deleted from the Vector Store Driver.
+        size: Number of ingested sources.
+    """
+
+    hits: int = field()
+    misses: int = field()
+    evictions: int = field()
+    size: int = field()
+
+
 @define(kw_only=True)
 class TextLoaderRetrievalRagModule(BaseRetrievalRagModule):
+    """Retrieves text chunks from a source that is loaded, chunked, and upserted into the Vector Store Driver.
+
+    Each source is upserted into a namespace named after a hash of its loaded content and the chunker settings, so that
+    runs on unchanged content query the existing namespace instead of embedding the source again. Namespaces are
+    deleted from the Vector Store Driver once they expire or exceed `max_ingested_sources`, least recently used first.
+    Namespaces that are being queried are only deleted once their queries finish.
+
+    Attributes:
+        loader: Loader used to load the source.
+        chunker: Chunker used to split the loaded source.
+        vector_store_driver: Vector Store Driver the chunks are upserted into and queried from.
+        source: Source to load, unless overridden by the `source` context param.
+        query_params: Parameters passed to the Vector Store Driver query.
+        process_query_output: Converts the queried Entries into text chunks.
+        ingestion_ttl: Seconds after an ingested source was last used before it is evicted. Never if `None`.
+        max_ingested_sources: Maximum number of ingested sources to keep. Unbounded if `None`.
+    """
+
     loader: TextLoader = field()
     chunker: TextChunker = field(default=Factory(lambda: TextChunker()))
     vector_store_driver: BaseVectorStoreDriver = field()
@@ -28,19 +67,189 @@ class TextLoaderRetrievalRagModule(BaseRetrievalRagModule):
     process_query_output: Callable[[list[BaseVectorStoreDriver.Entry]], Sequence[TextArtifact]] = field(
         default=Factory(lambda: lambda es: [e.to_artifact() for e in es]),
     )
+    ingestion_ttl: Optional[float] = field(default=None)
+    max_ingested_sources: Optional[int] = field(default=100)
+    _ingested_namespaces: OrderedDict[str, float] = field(factory=OrderedDict, alias="ingested_namespaces")
+    _pending_namespaces: dict[str, threading.Event] = field(factory=dict, alias="pending_namespaces")
+    _queried_namespaces: dict[str, int] = field(factory=dict, alias="queried_namespaces")
+    _ingestion_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), alias="ingestion_lock")
+    _hits: int = field(default=0, alias="hits")
+    _misses: int = field(default=0, alias="misses")
+    _evictions: int = field(default=0, alias="evictions")
+
+    @max_ingested_sources.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_max_ingested_sources(self, _: Attribute, max_ingested_sources: Optional[int]) -> None:
+        if max_ingested_sources is not None and max_ingested_sources < 1:
+            raise ValueError("max_ingested_sources must be at least 1.")
+
+    @property
+    def ingestion_stats(self) -> IngestionCacheStats:
+        with self._ingestion_lock:
+            return IngestionCacheStats(
+                hits=self._hits, misses=self._misses, evictions=self._evictions, size=len(self._ingested_namespaces)
+            )
 
     def run(self, context: RagContext) -> Sequence[TextArtifact]:
-        namespace = uuid.uuid4().hex
         context_source = self.get_context_param(context, "source")
         source = self.source if context_source is None else context_source
 
         query_params = utils.dict_merge(self.query_params, self.get_context_param(context, "query_params"))
 
-        query_params["namespace"] = namespace
+        query_params["namespace"] = self.__ingest(source, query=True)
+
+        try:
+            return self.process_query_output(self.query_vector_store(context, self.vector_store_driver, **query_params))
+        finally:
+            self.__release_namespace(query_params["namespace"])
+
+    def ingest(self, source: Any) -> str:
+        """Loads the source and upserts its chunks, unless its content was already ingested.
+
+        Returns:
+            The namespace the chunks were upserted into.
+        """
+        return self.__ingest(source, query=False)
 
+    def evict_ingested_sources(self) -> None:
+        """Deletes every ingested source that isn't being queried from the Vector Store Driver."""
+        with self._ingestion_lock:
+            evicted_namespaces = [
+                namespace for namespace in list(self._ingested_namespaces) if self.__evict_namespace(namespace)
+            ]
+
+        self.__delete_namespaces(evicted_namespaces)
+
+    def __ingest(self, source: Any, *, query: bool) -> str:
         loader_output = self.loader.load(source)
-        chunks = self.chunker.chunk(loader_output)
+        namespace = self.__get_namespace(loader_output)
+
+        # The lock only guards the bookkeeping. Upserts and deletions run outside of it, and runs on a namespace that
+        # is being upserted or deleted wait for that to finish first.
+        upserted = threading.Event()
+
+        while True:
+            with self._ingestion_lock:
+                evicted_namespaces = self.__evict_expired_namespaces()
+                pending = self._pending_namespaces.get(namespace)
+                ingested = pending is None and namespace in self._ingested_namespaces
+
+                if ingested:
+                    self._hits += 1
+                    evicted_namespaces += self.__use_namespace(namespace, query=query)
+                elif pending is None:
+                    self._misses += 1
+                    self._pending_namespaces[namespace] = upserted
+
+            self.__delete_namespaces(evicted_namespaces)
+
+            if ingested:
+                return namespace
+            elif pending is None:
+                break
+            else:
+                pending.wait()
+
+        try:
+            self.vector_store_driver.upsert_text_artifacts({namespace: self.chunker.iter_chunks(loader_output)})
+        except Exception:
+            with self._ingestion_lock:
+                del self._pending_namespaces[namespace]
+
+            upserted.set()
+
+            raise
+
+        with self._ingestion_lock:
+            del self._pending_namespaces[namespace]
+            evicted_namespaces = self.__use_namespace(namespace, query=query)
+
+        upserted.set()
+        self.__delete_namespaces(evicted_namespaces)
+
+        return namespace
+
+    def __get_namespace(self, loader_output: TextArtifact) -> str:
+        chunker_settings = f"{self.chunker.__class__.__name__}-{self.chunker.max_tokens}-{self.chunker.overlap_tokens}"
+
+        return utils.str_to_hash(f"{chunker_settings}\n{loader_output.to_text()}")
+
+    def __use_namespace(self, namespace: str, *, query: bool) -> list[str]:
+        self._ingested_namespaces[namespace] = time.monotonic()
+        self._ingested_namespaces.move_to_end(namespace)
+
+        if query:
+            self._queried_namespaces[namespace] = self._queried_namespaces.get(namespace, 0) + 1
+
+        return self.__evict_excess_namespaces()
+
+    def __release_namespace(self, namespace: str) -> None:
+        with self._ingestion_lock:
+            self._queried_namespaces[namespace] -= 1
+
+            if self._queried_namespaces[namespace] == 0:
+                del self._queried_namespaces[namespace]
+
+            # Namespaces that were kept while being queried are evicted once released.
+            evicted_namespaces = self.__evict_expired_namespaces() + self.__evict_excess_namespaces()
+
+        self.__delete_namespaces(evicted_namespaces)
+
+    def __evict_expired_namespaces(self) -> list[str]:
+        if self.ingestion_ttl is None:
+            return []
+
+        expires_before = time.monotonic() - self.ingestion_ttl
+
+        # Namespaces are kept in order of last use, so expired ones are at the front.
+        expired_namespaces = [
+            namespace
+            for namespace, _ in takewhile(
+                lambda item: item[1] <= expires_before, list(self._ingested_namespaces.items())
+            )
+        ]
+
+        return [namespace for namespace in expired_namespaces if self.__evict_namespace(namespace)]
+
+    def __evict_excess_namespaces(self) -> list[str]:
+        if self.max_ingested_sources is None:
+            return []
+
+        evicted_namespaces = []
+
+        # The most recently used namespace is kept even if the others are being queried.
+        for namespace in list(self._ingested_namespaces)[:-1]:
+            if len(self._ingested_namespaces) <= self.max_ingested_sources:
+                break
+
+            if self.__evict_namespace(namespace):
+                evicted_namespaces.append(namespace)
+
+        return evicted_namespaces
+
+    def __evict_namespace(self, namespace: str) -> bool:
+        # Namespaces being queried are kept until they are released.
+        if namespace in self._queried_namespaces:
+            return False
+
+        del self._ingested_namespaces[namespace]
+        self._pending_namespaces[namespace] = threading.Event()
+        self._evictions += 1
+
+        return True
 
-        self.vector_store_driver.upsert_text_artifacts({namespace: chunks})
+    def __delete_namespaces(self, namespaces: list[str]) -> None:
+        for namespace in namespaces:
+            try:
+                self.vector_store_driver.delete_namespace(namespace)
+            except NotImplementedError:
+                logging.warning(
+                    "%s: %s does not support deletion, evicted namespace %s is kept in the vector store",
+                    self.__class__.__name__,
+                    self.vector_store_driver.__class__.__name__,
+                    namespace,
+                )
+            finally:
+                with self._ingestion_lock:
+                    pending = self._pending_namespaces.pop(namespace)
 
-        return self.process_query_output(self.vector_store_driver.query(context.query, **query_params))
+                pending.set()
@@ -29,4 +29,29 @@ class VectorStoreRetrievalRagModule(BaseRetrievalRagModule):
     def run(self, context: RagContext) -> Sequence[TextArtifact]:
         query_params = utils.dict_merge(self.query_params, self.get_context_param(context, "query_params"))
 
-        return self.process_query_output(self.vector_store_driver.query(context.query, **query_params))
+        return self.process_query_output(self.query_vector_store(context, self.vector_store_driver, **query_params))
+
+    def run_batch(self, contexts: Sequence[RagContext]) -> list[Sequence[TextArtifact]]:
+        """Queries the Vector Store Driver once for every group of contexts that share the same query params."""
+        groups: list[tuple[dict[str, Any], list[int]]] = []
+
+        for i, context in enumerate(contexts):
+            query_params = utils.dict_merge(self.query_params, self.get_context_param(context, "query_params"))
+            group = next((g for g in groups if g[0] == query_params), None)
+
+            if group is None:
+                groups.append((query_params, [i]))
+            else:
+                group[1].append(i)
+
+        results: list[Sequence[TextArtifact]] = [[] for _ in contexts]
+
+        for query_params, indexes in groups:
+            entries = self.query_vector_store_batch(
+                [contexts[i] for i in indexes], self.vector_store_driver, **query_params
+            )
+
+            for i, context_entries in zip(indexes, entries):
+                results[i] = self.process_query_output(context_entries)
+
+        return results
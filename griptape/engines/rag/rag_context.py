@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING
 
-from attrs import define, field
+from attrs import Factory, define, field
 
 from griptape import utils
 from griptape.mixins.serializable_mixin import SerializableMixin
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from griptape.artifacts import BaseArtifact, TextArtifact
     from griptape.common import Reference
+    from griptape.drivers import BaseEmbeddingDriver
 
 
 @define(kw_only=True)
@@ -23,6 +27,10 @@ class RagContext(SerializableMixin):
         after_query: An optional list of strings to add after the query in response modules.
         text_chunks: A list of text chunks to pass around from the retrieval stage to the response stage.
         outputs: List of outputs from the response stage.
+        query_embeddings: Embeddings of queries by the Embedding Driver's cache key for the query, so that retrieval
+            modules embed each query once per Embedding Driver configuration.
+        stage_timings: Seconds spent in each stage that ran, keyed by `query`, `retrieval`, and `response`. Stages that
+            `RagEngine.process_batch` runs for several queries at once record the duration of the whole batch.
     """
 
     query: str = field(metadata={"serializable": True})
@@ -31,6 +39,55 @@ class RagContext(SerializableMixin):
     after_query: list[str] = field(factory=list, metadata={"serializable": True})
     text_chunks: list[TextArtifact] = field(factory=list, metadata={"serializable": True})
     outputs: list[BaseArtifact] = field(factory=list, metadata={"serializable": True})
+    query_embeddings: dict[str, list[float]] = field(factory=dict)
+    stage_timings: dict[str, float] = field(factory=dict, metadata={"serializable": True})
+    _query_embeddings_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
+    _query_embedding_locks: dict[str, threading.Lock] = field(factory=dict, init=False)
 
     def get_references(self) -> list[Reference]:
         return utils.references_from_artifacts(self.text_chunks)
+
+    def get_query_embedding(self, embedding_driver: BaseEmbeddingDriver) -> list[float]:
+        """Embeds the query with the Embedding Driver, unless it was already embedded with the same configuration."""
+        key = embedding_driver._get_cache_key(self.query)
+
+        # Only modules sharing an Embedding Driver configuration wait for each other to embed the query.
+        with self.__get_query_embedding_lock(key):
+            if key not in self.query_embeddings:
+                self.query_embeddings[key] = embedding_driver.embed_string(self.query)
+
+            return self.query_embeddings[key]
+
+    @classmethod
+    def get_query_embeddings(
+        cls, contexts: Sequence[RagContext], embedding_driver: BaseEmbeddingDriver
+    ) -> list[list[float]]:
+        """Embeds the queries of several contexts with a single call to `embed_strings`.
+
+        Queries that were already embedded with the same configuration are not embedded again, and duplicate queries are
+        embedded once.
+
+        Returns:
+            One embedding per context, in the same order as `contexts`.
+        """
+        # The Embedding Driver's params are only serialized once for the whole batch.
+        keys = embedding_driver._get_cache_keys([context.query for context in contexts])
+        queries = list(
+            dict.fromkeys(context.query for context, key in zip(contexts, keys) if key not in context.query_embeddings)
+        )
+        embeddings = dict(zip(queries, embedding_driver.embed_strings(queries))) if queries else {}
+
+        results = []
+
+        for context, key in zip(contexts, keys):
+            with context.__get_query_embedding_lock(key):
+                if key not in context.query_embeddings:
+                    context.query_embeddings[key] = embeddings[context.query]
+
+                results.append(context.query_embeddings[key])
+
+        return results
+
+    def __get_query_embedding_lock(self, key: str) -> threading.Lock:
+        with self._query_embeddings_lock:
+            return self._query_embedding_locks.setdefault(key, threading.Lock())
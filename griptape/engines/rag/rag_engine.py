@@ -1,17 +1,33 @@
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, Optional
 
 from attrs import define, field
 
+from griptape import utils
 from griptape.engines.rag import RagContext
+from griptape.mixins.futures_executor_mixin import FuturesExecutorMixin
+from griptape.utils import with_contextvars
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from griptape.engines.rag.stages import QueryRagStage, ResponseRagStage, RetrievalRagStage
 
 
 @define(kw_only=True)
-class RagEngine:
+class RagEngine(FuturesExecutorMixin):
+    """Runs queries through the query, retrieval, and response stages.
+
+    Attributes:
+        query_stage: Optional stage that transforms the query.
+        retrieval_stage: Optional stage that retrieves text chunks for the query.
+        response_stage: Optional stage that generates outputs from the query and text chunks.
+    """
+
+    DEFAULT_BATCH_SIZE = 32
+
     query_stage: Optional[QueryRagStage] = field(default=None)
     retrieval_stage: Optional[RetrievalRagStage] = field(default=None)
     response_stage: Optional[ResponseRagStage] = field(default=None)
@@ -38,12 +54,76 @@ class RagEngine:
 
     def process(self, context: RagContext) -> RagContext:
         if self.query_stage:
+            start = time.perf_counter()
             context = self.query_stage.run(context)
+            self.__record_stage_timing("query", [context], start)
 
         if self.retrieval_stage:
+            start = time.perf_counter()
             context = self.retrieval_stage.run(context)
+            self.__record_stage_timing("retrieval", [context], start)
 
         if self.response_stage:
-            context = self.response_stage.run(context)
+            context = self.__run_response_stage(context)
 
         return context
+
+    def process_batch(self, queries: Sequence[str], *, batch_size: int = DEFAULT_BATCH_SIZE) -> list[RagContext]:
+        """Processes several queries, returning one RagContext per query in the same order as `queries`.
+
+        Queries are processed in batches of `batch_size`. The query and retrieval stages run for a whole batch at once,
+        so that retrieval modules can embed all of its queries in a single request and search the vector store for all
+        of them together. Each query's response stage is submitted to the `futures_executor` as soon as its batch is
+        retrieved, and runs while the next batch is being retrieved.
+
+        Args:
+            queries: Queries to process.
+            batch_size: Number of queries to retrieve for at once.
+
+        Returns:
+            One RagContext per query.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+
+        contexts = [RagContext(query=query) for query in queries]
+        response_futures = []
+
+        for i in range(0, len(contexts), batch_size):
+            batch = contexts[i : i + batch_size]
+
+            if self.query_stage:
+                start = time.perf_counter()
+                batch = self.query_stage.run_batch(batch)
+                self.__record_stage_timing("query", batch, start)
+
+            if self.retrieval_stage:
+                start = time.perf_counter()
+                batch = self.retrieval_stage.run_batch(batch)
+                self.__record_stage_timing("retrieval", batch, start)
+
+            if self.response_stage:
+                response_futures.extend(
+                    self.futures_executor.submit(with_contextvars(self.__run_response_stage), context)
+                    for context in batch
+                )
+
+            contexts[i : i + batch_size] = batch
+
+        if response_futures:
+            contexts = utils.execute_futures_list(response_futures)
+
+        return contexts
+
+    def __run_response_stage(self, context: RagContext) -> RagContext:
+        start = time.perf_counter()
+        context = self.response_stage.run(context)  # pyright: ignore[reportOptionalMemberAccess]
+        self.__record_stage_timing("response", [context], start)
+
+        return context
+
+    def __record_stage_timing(self, stage: str, contexts: Sequence[RagContext], start: float) -> None:
+        duration = time.perf_counter() - start
+
+        for context in contexts:
+            context.stage_timings[stage] = duration
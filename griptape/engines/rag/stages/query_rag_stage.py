@@ -5,7 +5,9 @@ from typing import TYPE_CHECKING
 
 from attrs import define, field
 
+from griptape import utils
 from griptape.engines.rag.stages import BaseRagStage
+from griptape.utils import with_contextvars
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -28,3 +30,9 @@ class QueryRagStage(BaseRagStage):
         [qm.run(context) for qm in self.query_modules]
 
         return context
+
+    def run_batch(self, contexts: Sequence[RagContext]) -> list[RagContext]:
+        """Runs the stage for several contexts concurrently."""
+        return utils.execute_futures_list(
+            [self.futures_executor.submit(with_contextvars(self.run), context) for context in contexts]
+        )
@@ -12,6 +12,9 @@ from griptape.engines.rag.stages import BaseRagStage
 from griptape.utils import with_contextvars
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from griptape.artifacts import BaseArtifact
     from griptape.engines.rag import RagContext
     from griptape.engines.rag.modules import BaseRagModule, BaseRerankRagModule, BaseRetrievalRagModule
 
@@ -40,8 +43,32 @@ class RetrievalRagStage(BaseRagStage):
             [self.futures_executor.submit(with_contextvars(r.run), context) for r in self.retrieval_modules]
         )
 
+        return self.__process_results(context, results)
+
+    def run_batch(self, contexts: Sequence[RagContext]) -> list[RagContext]:
+        """Runs the stage for several contexts, letting each retrieval module retrieve for all of them at once."""
+        logging.info(
+            "RetrievalRagStage: running %s retrieval modules in parallel for %s queries",
+            len(self.retrieval_modules),
+            len(contexts),
+        )
+
+        module_results = utils.execute_futures_list(
+            [self.futures_executor.submit(with_contextvars(r.run_batch), contexts) for r in self.retrieval_modules]
+        )
+
+        return utils.execute_futures_list(
+            [
+                self.futures_executor.submit(
+                    with_contextvars(self.__process_results), context, [results[i] for results in module_results]
+                )
+                for i, context in enumerate(contexts)
+            ]
+        )
+
+    def __process_results(self, context: RagContext, module_results: list[Sequence[BaseArtifact]]) -> RagContext:
         # flatten the list of lists
-        results = list(itertools.chain.from_iterable(results))
+        results = list(itertools.chain.from_iterable(module_results))
 
         # deduplicate the list
         chunks_before_dedup = len(results)
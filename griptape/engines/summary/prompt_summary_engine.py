@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, cast
+from typing import TYPE_CHECKING, Literal, Optional, cast
 
 from attrs import Attribute, Factory, define, field
 
@@ -9,7 +9,8 @@ from griptape.chunkers import BaseChunker, TextChunker
 from griptape.common import Message, PromptStack
 from griptape.configs import Defaults
 from griptape.engines import BaseSummaryEngine
-from griptape.utils import J2
+from griptape.mixins.futures_executor_mixin import FuturesExecutorMixin
+from griptape.utils import J2, execute_futures_list, with_contextvars
 
 if TYPE_CHECKING:
     from griptape.drivers import BasePromptDriver
@@ -17,9 +18,24 @@ if TYPE_CHECKING:
 
 
 @define
-class PromptSummaryEngine(BaseSummaryEngine):
+class PromptSummaryEngine(BaseSummaryEngine, FuturesExecutorMixin):
+    """Summarizes text with a Prompt Driver.
+
+    Attributes:
+        chunk_joiner: Joins Artifacts, and partial summaries in the `map_reduce` strategy.
+        max_token_multiplier: Fraction of the Prompt Driver's max input tokens to chunk text to.
+        strategy: How text that doesn't fit in one prompt is summarized. `refine` summarizes one chunk after another,
+            passing along the summary so far. `map_reduce` summarizes all chunks concurrently, with the
+            `futures_executor`, then summarizes groups of partial summaries concurrently until they fit in one prompt.
+        generate_system_template: Template for the system prompt.
+        generate_user_template: Template for the user prompt.
+        prompt_driver: Prompt Driver used to summarize.
+        chunker: Chunker used to split text that doesn't fit in one prompt.
+    """
+
     chunk_joiner: str = field(default="\n\n", kw_only=True)
     max_token_multiplier: float = field(default=0.5, kw_only=True)
+    strategy: Literal["refine", "map_reduce"] = field(default="refine", kw_only=True)
     generate_system_template: J2 = field(default=Factory(lambda: J2("engines/summary/system.j2")), kw_only=True)
     generate_user_template: J2 = field(default=Factory(lambda: J2("engines/summary/user.j2")), kw_only=True)
     prompt_driver: BasePromptDriver = field(
@@ -52,7 +68,10 @@ class PromptSummaryEngine(BaseSummaryEngine):
         )
 
     def summarize_artifacts(self, artifacts: ListArtifact, *, rulesets: Optional[list[Ruleset]] = None) -> TextArtifact:
-        return self.summarize_artifacts_rec(cast(list[TextArtifact], artifacts.value), None, rulesets=rulesets)
+        if self.strategy == "map_reduce":
+            return self.summarize_artifacts_map_reduce(cast(list[TextArtifact], artifacts.value), rulesets=rulesets)
+        else:
+            return self.summarize_artifacts_rec(cast(list[TextArtifact], artifacts.value), None, rulesets=rulesets)
 
     def summarize_artifacts_rec(
         self,
@@ -67,30 +86,12 @@ class PromptSummaryEngine(BaseSummaryEngine):
 
         artifacts_text = self.chunk_joiner.join([a.to_text() for a in artifacts])
 
-        system_prompt = self.generate_system_template.render(
-            summary=summary,
-            rulesets=J2("rulesets/rulesets.j2").render(rulesets=rulesets),
-        )
+        system_prompt = self.__render_system_prompt(summary, rulesets)
 
         user_prompt = self.generate_user_template.render(text=artifacts_text)
 
-        if (
-            self.prompt_driver.tokenizer.count_input_tokens_left(user_prompt + system_prompt)
-            >= self.min_response_tokens
-        ):
-            result = self.prompt_driver.run(
-                PromptStack(
-                    messages=[
-                        Message(system_prompt, role=Message.SYSTEM_ROLE),
-                        Message(user_prompt, role=Message.USER_ROLE),
-                    ],
-                ),
-            ).to_artifact()
-
-            if isinstance(result, TextArtifact):
-                return result
-            else:
-                raise ValueError("Prompt driver did not return a TextArtifact")
+        if self.__fits(system_prompt, user_prompt):
+            return self.__run_prompt(system_prompt, user_prompt)
         else:
             chunks = self.chunker.chunk(artifacts_text)
 
@@ -98,13 +99,73 @@ class PromptSummaryEngine(BaseSummaryEngine):
 
             return self.summarize_artifacts_rec(
                 chunks[1:],
-                self.prompt_driver.run(
-                    PromptStack(
-                        messages=[
-                            Message(system_prompt, role=Message.SYSTEM_ROLE),
-                            Message(partial_text, role=Message.USER_ROLE),
-                        ],
-                    ),
-                ).value,
+                self.__run_prompt(system_prompt, partial_text).value,
                 rulesets=rulesets,
             )
+
+    def summarize_artifacts_map_reduce(
+        self,
+        artifacts: list[TextArtifact],
+        rulesets: Optional[list[Ruleset]] = None,
+    ) -> TextArtifact:
+        if not artifacts:
+            raise ValueError("No artifacts to summarize")
+
+        system_prompt = self.__render_system_prompt(None, rulesets)
+        texts = [a.to_text() for a in artifacts]
+        chunk_count = None
+
+        while True:
+            text = self.chunk_joiner.join(texts)
+            user_prompt = self.generate_user_template.render(text=text)
+
+            if self.__fits(system_prompt, user_prompt):
+                return self.__run_prompt(system_prompt, user_prompt)
+
+            chunks = self.chunker.chunk(text)
+
+            # Partial summaries that don't get shorter are summarized one after another instead, which always ends.
+            if chunk_count is not None and len(chunks) >= chunk_count:
+                return self.summarize_artifacts_rec(chunks, None, rulesets=rulesets)
+
+            chunk_count = len(chunks)
+            texts = [
+                summary.value
+                for summary in execute_futures_list(
+                    [
+                        self.futures_executor.submit(
+                            with_contextvars(self.__run_prompt),
+                            system_prompt,
+                            self.generate_user_template.render(text=chunk.value),
+                        )
+                        for chunk in chunks
+                    ]
+                )
+            ]
+
+    def __render_system_prompt(self, summary: Optional[str], rulesets: Optional[list[Ruleset]]) -> str:
+        return self.generate_system_template.render(
+            summary=summary,
+            rulesets=J2("rulesets/rulesets.j2").render(rulesets=rulesets),
+        )
+
+    def __fits(self, system_prompt: str, user_prompt: str) -> bool:
+        return (
+            self.prompt_driver.tokenizer.count_input_tokens_left(user_prompt + system_prompt)
+            >= self.min_response_tokens
+        )
+
+    def __run_prompt(self, system_prompt: str, user_prompt: str) -> TextArtifact:
+        result = self.prompt_driver.run(
+            PromptStack(
+                messages=[
+                    Message(system_prompt, role=Message.SYSTEM_ROLE),
+                    Message(user_prompt, role=Message.USER_ROLE),
+                ],
+            ),
+        ).to_artifact()
+
+        if isinstance(result, TextArtifact):
+            return result
+        else:
+            raise ValueError("Prompt driver did not return a TextArtifact")
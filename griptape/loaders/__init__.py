@@ -1,20 +1,41 @@
-from .base_loader import BaseLoader
-from .base_file_loader import BaseFileLoader
+from __future__ import annotations
 
-from .text_loader import TextLoader
-from .json_loader import JsonLoader
-from .pdf_loader import PdfLoader
-from .web_loader import WebLoader
-from .sql_loader import SqlLoader
-from .csv_loader import CsvLoader
-from .email_loader import EmailLoader
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from .blob_loader import BlobLoader
+if TYPE_CHECKING:
+    from .base_loader import BaseLoader
+    from .base_file_loader import BaseFileLoader
 
-from .image_loader import ImageLoader
+    from .text_loader import TextLoader
+    from .json_loader import JsonLoader
+    from .pdf_loader import PdfLoader
+    from .web_loader import WebLoader
+    from .sql_loader import SqlLoader
+    from .csv_loader import CsvLoader
+    from .email_loader import EmailLoader
 
-from .audio_loader import AudioLoader
+    from .blob_loader import BlobLoader
 
+    from .image_loader import ImageLoader
+
+    from .audio_loader import AudioLoader
+
+# Loaders are imported on first access, so that importing this package does not import the dependencies of every Loader.
+_LAZY_IMPORTS = {
+    "BaseLoader": ".base_loader",
+    "BaseFileLoader": ".base_file_loader",
+    "TextLoader": ".text_loader",
+    "JsonLoader": ".json_loader",
+    "PdfLoader": ".pdf_loader",
+    "WebLoader": ".web_loader",
+    "SqlLoader": ".sql_loader",
+    "CsvLoader": ".csv_loader",
+    "EmailLoader": ".email_loader",
+    "BlobLoader": ".blob_loader",
+    "ImageLoader": ".image_loader",
+    "AudioLoader": ".audio_loader",
+}
 
 __all__ = [
     "BaseLoader",
@@ -30,3 +51,17 @@ __all__ = [
     "AudioLoader",
     "BlobLoader",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any, Optional
 
 from attrs import Factory, define, field
 
-from griptape.common import PromptStack
+from griptape.common import Message, PromptStack
 from griptape.configs import Defaults
 from griptape.mixins.serializable_mixin import SerializableMixin
 from griptape.utils import dict_merge
@@ -25,6 +25,7 @@ class BaseConversationMemory(SerializableMixin, ABC):
     autoload: bool = field(default=True, kw_only=True)
     autoprune: bool = field(default=True, kw_only=True)
     max_runs: Optional[int] = field(default=None, kw_only=True, metadata={"serializable": True})
+    _run_token_counts: dict[tuple[str, str, str], int] = field(factory=dict, init=False, alias="run_token_counts")
 
     def __attrs_post_init__(self) -> None:
         if self.autoload:
@@ -44,7 +45,8 @@ class BaseConversationMemory(SerializableMixin, ABC):
         if self.max_runs:
             while len(self.runs) > self.max_runs:
                 self.runs.pop(0)
-        self.conversation_memory_driver.store(self.runs, self.meta)
+        if self.runs:
+            self.conversation_memory_driver.append_run(self.runs[-1], self.runs, self.meta)
 
     @abstractmethod
     def try_add_run(self, run: Run) -> None: ...
@@ -53,7 +55,7 @@ class BaseConversationMemory(SerializableMixin, ABC):
     def to_prompt_stack(self, last_n: Optional[int] = None) -> PromptStack: ...
 
     def load_runs(self) -> list[Run]:
-        runs, meta = self.conversation_memory_driver.load()
+        runs, meta = self.conversation_memory_driver.load(last_n=self.max_runs or None)
         self.runs.extend(runs)
         self.meta = dict_merge(self.meta, meta)
 
@@ -76,30 +78,31 @@ class BaseConversationMemory(SerializableMixin, ABC):
         num_runs_to_fit_in_prompt = len(self.runs)
 
         if self.autoprune:
-            should_prune = True
-            temp_stack = PromptStack()
-
-            # Try to determine how many Conversation Memory runs we can
-            # fit into the Prompt Stack without exceeding the token limit.
-            while should_prune and num_runs_to_fit_in_prompt > 0:
-                temp_stack.messages = prompt_stack.messages.copy()
-
-                # Add n runs from Conversation Memory.
-                # Where we insert into the Prompt Stack doesn't matter here
-                # since we only care about the total token count.
-                memory_inputs = self.to_prompt_stack(num_runs_to_fit_in_prompt).messages
-                temp_stack.messages.extend(memory_inputs)
-
-                # Convert the Prompt Stack into tokens left.
-                tokens_left = prompt_driver.tokenizer.count_input_tokens_left(
-                    prompt_driver.prompt_stack_to_string(temp_stack),
-                )
-                if tokens_left > 0:
-                    # There are still tokens left, no need to prune.
-                    should_prune = False
-                else:
-                    # There were not any tokens left, prune one run and try again.
-                    num_runs_to_fit_in_prompt -= 1
+            runs = self._get_prompt_stack_runs()
+            # Where we insert into the Prompt Stack doesn't matter here
+            # since we only care about the total token count.
+            fixed_stack = PromptStack(messages=[*prompt_stack.messages, *self._get_prompt_stack_header_messages()])
+            tokens_left = prompt_driver.tokenizer.max_input_tokens - prompt_driver.tokenizer.count_tokens(
+                prompt_driver.prompt_stack_to_string(fixed_stack)
+            )
+            empty_stack_tokens = prompt_driver.tokenizer.count_tokens(
+                prompt_driver.prompt_stack_to_string(PromptStack())
+            )
+            num_runs_to_fit_in_prompt = 0
+
+            # Fit as many of the most recent Conversation Memory runs as possible
+            # into the Prompt Stack without exceeding the token limit.
+            for run in reversed(runs):
+                tokens_left -= self._count_run_tokens(prompt_driver, run, empty_stack_tokens)
+
+                if tokens_left <= 0:
+                    break
+
+                num_runs_to_fit_in_prompt += 1
+
+            # Runs that were removed from memory no longer need their token counts.
+            run_ids = {run.id for run in self.runs}
+            self._run_token_counts = {key: count for key, count in self._run_token_counts.items() if key[0] in run_ids}
 
         if num_runs_to_fit_in_prompt:
             memory_inputs = self.to_prompt_stack(num_runs_to_fit_in_prompt).messages
@@ -109,3 +112,30 @@ class BaseConversationMemory(SerializableMixin, ABC):
                 prompt_stack.messages[index:index] = memory_inputs
 
         return prompt_stack
+
+    def _get_prompt_stack_header_messages(self) -> list[Message]:
+        """Messages that `to_prompt_stack` adds regardless of `last_n`."""
+        return []
+
+    def _get_prompt_stack_runs(self) -> list[Run]:
+        """Runs that `to_prompt_stack` draws the last `last_n` runs from."""
+        return self.runs
+
+    def _count_run_tokens(self, prompt_driver: BasePromptDriver, run: Run, empty_stack_tokens: int) -> int:
+        """Counts the tokens a run adds to the Prompt Stack, reusing counts from previous calls.
+
+        Counts exclude the tokens of the empty Prompt Stack so that the counts of several runs can be summed up.
+        """
+        key = (run.id, prompt_driver.__class__.__name__, prompt_driver.model)
+
+        if key not in self._run_token_counts:
+            run_stack = PromptStack()
+            run_stack.add_user_message(run.input)
+            run_stack.add_assistant_message(run.output)
+
+            self._run_token_counts[key] = (
+                prompt_driver.tokenizer.count_tokens(prompt_driver.prompt_stack_to_string(run_stack))
+                - empty_stack_tokens
+            )
+
+        return self._run_token_counts[key]
@@ -30,9 +30,7 @@ class SummaryConversationMemory(BaseConversationMemory):
     )
 
     def to_prompt_stack(self, last_n: Optional[int] = None) -> PromptStack:
-        stack = PromptStack()
-        if self.summary:
-            stack.add_user_message(self.summary_get_template.render(summary=self.summary))
+        stack = PromptStack(messages=self._get_prompt_stack_header_messages())
 
         for r in self.unsummarized_runs(last_n):
             stack.add_user_message(r.input)
@@ -75,3 +73,12 @@ class SummaryConversationMemory(BaseConversationMemory):
             logging.exception("Error summarizing memory: %s(%s)", type(e).__name__, e)
 
             return previous_summary
+
+    def _get_prompt_stack_header_messages(self) -> list[Message]:
+        if self.summary:
+            return [Message(self.summary_get_template.render(summary=self.summary), role=Message.USER_ROLE)]
+        else:
+            return []
+
+    def _get_prompt_stack_runs(self) -> list[Run]:
+        return self.unsummarized_runs()
@@ -2,16 +2,32 @@ from __future__ import annotations
 
 import contextlib
 from abc import ABC
-from concurrent import futures
+from concurrent import futures  # noqa: TC003 -- BaseSchema resolves the annotations below at runtime
 from typing import Callable
 
 from attrs import Factory, define, field
 
+from griptape.utils.executor_registry import ExecutorRegistry
+
 
 @define(slots=False, kw_only=True)
 class FuturesExecutorMixin(ABC):
+    """Gives objects a `futures_executor` to run work concurrently.
+
+    By default, objects share the ExecutorRegistry executor named by `DEFAULT_FUTURES_EXECUTOR_NAME`, instead of each
+    starting threads of their own.
+
+    Attributes:
+        create_futures_executor: Creates the executor. Executors that are not shared are shut down with the object.
+        futures_executor: The executor.
+    """
+
+    DEFAULT_FUTURES_EXECUTOR_NAME = ExecutorRegistry.DEFAULT_EXECUTOR_NAME
+
     create_futures_executor: Callable[[], futures.Executor] = field(
-        default=Factory(lambda: lambda: futures.ThreadPoolExecutor()),
+        default=Factory(
+            lambda self: lambda: ExecutorRegistry.get_executor(self.DEFAULT_FUTURES_EXECUTOR_NAME), takes_self=True
+        ),
     )
 
     futures_executor: futures.Executor = field(
@@ -35,6 +35,11 @@ class Observability:
         driver = Observability.get_global_driver() or _no_op_observability_driver
         return driver.observe(call)
 
+    @staticmethod
+    async def aobserve(call: Observable.Call) -> Any:
+        driver = Observability.get_global_driver() or _no_op_observability_driver
+        return await driver.aobserve(call)
+
     @staticmethod
     def get_span_id() -> Optional[str]:
         driver = Observability.get_global_driver() or _no_op_observability_driver
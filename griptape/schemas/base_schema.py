@@ -18,13 +18,34 @@ class BaseSchema(Schema):
 
     DATACLASS_TYPE_MAPPING = {**Schema.TYPE_MAPPING, dict: fields.Dict, bytes: Bytes, Any: fields.Raw}
 
+    # Generated Schemas keyed by the Schema class that generated them and the exact attrs class they were generated
+    # for, so subclasses never share a parent's Schema.
+    _schema_cache: dict[tuple[type, type], type] = {}
+
     @classmethod
     def from_attrs_cls(cls, attrs_cls: type) -> type:
         """Generate a Schema from an attrs class.
 
+        Schemas are generated once per attrs class, later calls return the cached Schema.
+
         Args:
             attrs_cls: An attrs class.
         """
+        schema = BaseSchema._schema_cache.get((cls, attrs_cls))
+
+        if schema is None:
+            schema = cls._generate_schema(attrs_cls)
+            BaseSchema._schema_cache[(cls, attrs_cls)] = schema
+
+        return schema
+
+    @classmethod
+    def clear_schema_cache(cls) -> None:
+        """Clear the cached Schemas, forcing them to be generated again on next use."""
+        BaseSchema._schema_cache.clear()
+
+    @classmethod
+    def _generate_schema(cls, attrs_cls: type) -> type:
         from marshmallow import post_load
 
         from griptape.mixins.serializable_mixin import SerializableMixin
@@ -162,6 +183,7 @@ class BaseSchema(Schema):
         )
         from griptape.drivers import (
             BaseAudioTranscriptionDriver,
+            BaseCacheDriver,
             BaseConversationMemoryDriver,
             BaseEmbeddingDriver,
             BaseImageGenerationDriver,
@@ -186,6 +208,7 @@ class BaseSchema(Schema):
                 "Any": Any,
                 "BasePromptDriver": BasePromptDriver,
                 "BaseEmbeddingDriver": BaseEmbeddingDriver,
+                "BaseCacheDriver": BaseCacheDriver,
                 "BaseVectorStoreDriver": BaseVectorStoreDriver,
                 "BaseTextToSpeechDriver": BaseTextToSpeechDriver,
                 "BaseAudioTranscriptionDriver": BaseAudioTranscriptionDriver,
@@ -212,6 +235,9 @@ class BaseSchema(Schema):
                 "BaseArtifactStorage": BaseArtifactStorage,
                 # Third party modules
                 "Client": import_optional_dependency("cohere").Client if is_dependency_installed("cohere") else Any,
+                "AsyncClient": import_optional_dependency("cohere").AsyncClient
+                if is_dependency_installed("cohere")
+                else Any,
                 "GenerativeModel": import_optional_dependency("google.generativeai").GenerativeModel
                 if is_dependency_installed("google.generativeai")
                 else Any,
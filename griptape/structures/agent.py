@@ -63,7 +63,7 @@ class Agent(Structure):
 
         task.preprocess(self)
 
-        self._tasks.append(task)
+        self._append_task(task)
 
         return task
 
@@ -77,3 +77,9 @@ class Agent(Structure):
         self.task.run()
 
         return self
+
+    @observable
+    async def atry_run(self, *args) -> Agent:
+        await self.task.arun()
+
+        return self
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
 from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Iterator, Mapping
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 from attrs import Factory, define, field
@@ -14,6 +17,8 @@ from griptape.memory.structure import ConversationMemory, Run
 from griptape.mixins.rule_mixin import RuleMixin
 from griptape.mixins.runnable_mixin import RunnableMixin
 from griptape.mixins.serializable_mixin import SerializableMixin
+from griptape.utils.contextvars_utils import with_contextvars
+from griptape.utils.executor_registry import ExecutorRegistry
 
 if TYPE_CHECKING:
     from griptape.artifacts import BaseArtifact
@@ -21,6 +26,24 @@ if TYPE_CHECKING:
     from griptape.tasks import BaseTask
 
 
+class _TaskOutputs(Mapping[str, Optional["BaseArtifact"]]):
+    """Read-only view of the outputs of a Structure's Tasks by Task id, which stays current as the Tasks run."""
+
+    def __init__(self, structure: Structure) -> None:
+        self._structure = structure
+
+    def __getitem__(self, task_id: str) -> Optional[BaseArtifact]:
+        if (task := self._structure.try_find_task(task_id)) is None:
+            raise KeyError(task_id)
+        return task.output
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._structure.task_outputs)
+
+    def __len__(self) -> int:
+        return len(self._structure.task_outputs)
+
+
 @define
 class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
     id: str = field(default=Factory(lambda: uuid.uuid4().hex), kw_only=True, metadata={"serializable": True})
@@ -39,6 +62,14 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
     meta_memory: MetaMemory = field(default=Factory(lambda: MetaMemory()), kw_only=True)
     fail_fast: bool = field(default=True, kw_only=True, metadata={"serializable": True})
     _execution_args: tuple = ()
+    # Flattened `_tasks` and an index of them by id, rebuilt whenever `_tasks` is replaced or changes length outside of
+    # `_append_task`/`_insert_task`.
+    _flattened_tasks: list[BaseTask] = field(factory=list, init=False, eq=False, repr=False)
+    _task_index: dict[str, BaseTask] = field(factory=dict, init=False, eq=False, repr=False)
+    _indexed_tasks: Optional[list[Union[BaseTask, list[BaseTask]]]] = field(
+        default=None, init=False, eq=False, repr=False
+    )
+    _indexed_tasks_length: int = field(default=0, init=False, eq=False, repr=False)
 
     def __attrs_post_init__(self) -> None:
         tasks = self._tasks.copy()
@@ -50,14 +81,7 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
 
     @property
     def tasks(self) -> list[BaseTask]:
-        tasks = []
-
-        for task in self._tasks:
-            if isinstance(task, list):
-                tasks.extend(task)
-            else:
-                tasks.append(task)
-        return tasks
+        return self.__indexed_tasks().copy()
 
     @property
     def execution_args(self) -> tuple:
@@ -65,11 +89,15 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
 
     @property
     def input_task(self) -> Optional[BaseTask]:
-        return self.tasks[0] if self.tasks else None
+        tasks = self.__indexed_tasks()
+
+        return tasks[0] if tasks else None
 
     @property
     def output_task(self) -> Optional[BaseTask]:
-        return self.tasks[-1] if self.tasks else None
+        tasks = self.__indexed_tasks()
+
+        return tasks[-1] if tasks else None
 
     @property
     def output(self) -> BaseArtifact:
@@ -81,17 +109,22 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
 
     @property
     def task_outputs(self) -> dict[str, Optional[BaseArtifact]]:
-        return {task.id: task.output for task in self.tasks}
+        return {task.id: task.output for task in self.__indexed_tasks()}
+
+    @property
+    def task_outputs_view(self) -> Mapping[str, Optional[BaseArtifact]]:
+        """Same as `task_outputs`, without copying the output of every Task."""
+        return _TaskOutputs(self)
 
     @property
     def finished_tasks(self) -> list[BaseTask]:
-        return [s for s in self.tasks if s.is_finished()]
+        return [s for s in self.__indexed_tasks() if s.is_finished()]
 
     def is_finished(self) -> bool:
-        return all(s.is_finished() for s in self.tasks)
+        return all(s.is_finished() for s in self.__indexed_tasks())
 
     def is_running(self) -> bool:
-        return any(s for s in self.tasks if s.is_running())
+        return any(s for s in self.__indexed_tasks() if s.is_running())
 
     def find_task(self, task_id: str) -> BaseTask:
         if (task := self.try_find_task(task_id)) is not None:
@@ -99,10 +132,9 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
         raise ValueError(f"Task with id {task_id} doesn't exist.")
 
     def try_find_task(self, task_id: str) -> Optional[BaseTask]:
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        self.__indexed_tasks()
+
+        return self._task_index.get(task_id)
 
     def add_tasks(self, *tasks: BaseTask | list[BaseTask]) -> list[BaseTask]:
         added_tasks = []
@@ -117,13 +149,16 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
         return {"args": self.execution_args, "structure": self}
 
     def resolve_relationships(self) -> None:
-        task_by_id = {}
-        for task in self.tasks:
-            if task.id in task_by_id:
-                raise ValueError(f"Duplicate task with id {task.id} found.")
-            task_by_id[task.id] = task
+        # Reindex from scratch, in case Task ids were changed after the Tasks were added
+        tasks = self.__index_tasks()
+        task_by_id = self._task_index
 
-        for task in self.tasks:
+        if len(task_by_id) != len(tasks):
+            duplicate_id = next(task_id for task_id, count in Counter(task.id for task in tasks).items() if count > 1)
+
+            raise ValueError(f"Duplicate task with id {duplicate_id} found.")
+
+        for task in tasks:
             # Ensure parents include this task as a child
             for parent_id in task.parent_ids:
                 if parent_id not in task_by_id:
@@ -196,3 +231,64 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
 
     @abstractmethod
     def try_run(self, *args) -> Structure: ...
+
+    @observable
+    async def arun(self, *args) -> Structure:
+        """Same as `run`, but awaits `atry_run`, so that Tasks can run concurrently on an event loop."""
+        self.before_run(args)
+
+        result = await self.atry_run(*args)
+
+        self.after_run()
+
+        return result
+
+    async def atry_run(self, *args) -> Structure:
+        """Awaitable version of `try_run`.
+
+        Defaults to running `try_run` on the ExecutorRegistry's default executor. Structures that can await their Tasks
+        should override this.
+        """
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(ExecutorRegistry.get_executor(), with_contextvars(self.try_run), *args)
+
+    def _append_task(self, task: BaseTask) -> None:
+        self._insert_task(len(self._tasks), task)
+
+    def _insert_task(self, index: int, task: BaseTask) -> None:
+        tasks = self.__indexed_tasks()
+        # Positions in `_tasks` only match positions in the flattened list when no Tasks are nested
+        is_flat = len(tasks) == len(self._tasks)
+
+        self._tasks.insert(index, task)
+
+        if is_flat:
+            tasks.insert(index, task)
+            self._task_index.setdefault(task.id, task)
+            self._indexed_tasks_length = len(self._tasks)
+
+    def __indexed_tasks(self) -> list[BaseTask]:
+        if self._indexed_tasks is not self._tasks or self._indexed_tasks_length != len(self._tasks):
+            self.__index_tasks()
+
+        return self._flattened_tasks
+
+    def __index_tasks(self) -> list[BaseTask]:
+        tasks = []
+
+        for task in self._tasks:
+            if isinstance(task, list):
+                tasks.extend(task)
+            else:
+                tasks.append(task)
+
+        self._flattened_tasks = tasks
+        # The first Task wins when ids are duplicated, resolve_relationships reports the duplicates
+        self._task_index = {}
+        for task in reversed(tasks):
+            self._task_index[task.id] = task
+        self._indexed_tasks = self._tasks
+        self._indexed_tasks_length = len(self._tasks)
+
+        return tasks
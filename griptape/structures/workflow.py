@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import concurrent.futures as futures
+from collections import deque
 from graphlib import TopologicalSorter
 from typing import TYPE_CHECKING, Any, Optional
 
-from attrs import define
+from attrs import Attribute, define, field
 
 from griptape.artifacts import ErrorArtifact
 from griptape.common import observable
@@ -19,6 +21,22 @@ if TYPE_CHECKING:
 
 @define
 class Workflow(Structure, FuturesExecutorMixin):
+    """A Structure that runs its Tasks as a DAG, running each Task as soon as all of its parents have finished.
+
+    `run` runs the Tasks on the `futures_executor`, while `arun` runs them as asyncio Tasks on the running event loop.
+
+    Attributes:
+        max_concurrency: Maximum number of Tasks to run at the same time. Defaults to no limit beyond the
+            `futures_executor`'s own.
+    """
+
+    max_concurrency: Optional[int] = field(default=None, kw_only=True)
+
+    @max_concurrency.validator  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+    def validate_max_concurrency(self, _: Attribute, max_concurrency: Optional[int]) -> None:
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+
     @property
     def input_task(self) -> Optional[BaseTask]:
         return self.order_tasks()[0] if self.tasks else None
@@ -45,7 +63,7 @@ class Workflow(Structure, FuturesExecutorMixin):
 
         task.preprocess(self)
 
-        self._tasks.append(task)
+        self._append_task(task)
 
         return task
 
@@ -95,29 +113,76 @@ class Workflow(Structure, FuturesExecutorMixin):
         last_parent_index = self.__link_task_to_parents(task, parent_tasks)
 
         # Insert the new task once, just after the last parent task
-        self._tasks.insert(last_parent_index + 1, task)
+        self._insert_task(last_parent_index + 1, task)
 
         return task
 
     @observable
     def try_run(self, *args) -> Workflow:
-        exit_loop = False
+        task_by_id = {task.id: task for task in self.tasks}
+        sorter = TopologicalSorter(self.to_graph())
+        queued_tasks: deque[BaseTask] = deque()
+        running_tasks: dict[futures.Future[BaseArtifact], BaseTask] = {}
+
+        sorter.prepare()
+
+        while sorter.is_active():
+            self.__queue_ready_tasks(sorter, task_by_id, queued_tasks)
+
+            while queued_tasks and (self.max_concurrency is None or len(running_tasks) < self.max_concurrency):
+                task = queued_tasks.popleft()
 
-        while not self.is_finished() and not exit_loop:
-            futures_list = {}
-            ordered_tasks = self.order_tasks()
+                running_tasks[self.futures_executor.submit(with_contextvars(task.run))] = task
 
-            for task in ordered_tasks:
-                if task.can_run():
-                    future = self.futures_executor.submit(with_contextvars(task.run))
-                    futures_list[future] = task
+            if not running_tasks:
+                continue
+
+            # Wait for the next Task to finish, so that its children can be dispatched right away
+            done_futures, _ = futures.wait(running_tasks, return_when=futures.FIRST_COMPLETED)
+
+            for future in done_futures:
+                task = running_tasks.pop(future)
 
-            # Wait for all tasks to complete
-            for future in futures.as_completed(futures_list):
                 if isinstance(future.result(), ErrorArtifact) and self.fail_fast:
-                    exit_loop = True
+                    return self
+
+                sorter.done(task.id)
+
+        return self
+
+    @observable
+    async def atry_run(self, *args) -> Workflow:
+        task_by_id = {task.id: task for task in self.tasks}
+        sorter = TopologicalSorter(self.to_graph())
+        queued_tasks: deque[BaseTask] = deque()
+        running_tasks: dict[asyncio.Task[BaseArtifact], BaseTask] = {}
 
-                    break
+        sorter.prepare()
+
+        while sorter.is_active():
+            self.__queue_ready_tasks(sorter, task_by_id, queued_tasks)
+
+            while queued_tasks and (self.max_concurrency is None or len(running_tasks) < self.max_concurrency):
+                task = queued_tasks.popleft()
+
+                running_tasks[asyncio.create_task(task.arun())] = task
+
+            if not running_tasks:
+                continue
+
+            done_tasks, _ = await asyncio.wait(running_tasks, return_when=asyncio.FIRST_COMPLETED)
+
+            for done_task in done_tasks:
+                task = running_tasks.pop(done_task)
+
+                if isinstance(done_task.result(), ErrorArtifact) and self.fail_fast:
+                    # Unlike threads, pending asyncio Tasks would be cancelled along with the event loop
+                    if running_tasks:
+                        await asyncio.wait(running_tasks)
+
+                    return self
+
+                sorter.done(task.id)
 
         return self
 
@@ -126,7 +191,7 @@ class Workflow(Structure, FuturesExecutorMixin):
 
         context.update(
             {
-                "task_outputs": self.task_outputs,
+                "task_outputs": self.task_outputs_view,
                 "parent_outputs": task.parent_outputs,
                 "parents_output_text": task.parents_output_text,
                 "parents": {parent.id: parent for parent in task.parents},
@@ -137,20 +202,30 @@ class Workflow(Structure, FuturesExecutorMixin):
         return context
 
     def to_graph(self) -> dict[str, set[str]]:
-        graph: dict[str, set[str]] = {}
-
-        for key_task in self.tasks:
-            graph[key_task.id] = set()
+        tasks = self.tasks
+        graph: dict[str, set[str]] = {task.id: set() for task in tasks}
 
-            for value_task in self.tasks:
-                if key_task.id in value_task.child_ids:
-                    graph[key_task.id].add(value_task.id)
+        for task in tasks:
+            for child_id in task.child_ids:
+                if child_id in graph:
+                    graph[child_id].add(task.id)
 
         return graph
 
     def order_tasks(self) -> list[BaseTask]:
         return [self.find_task(task_id) for task_id in TopologicalSorter(self.to_graph()).static_order()]
 
+    def __queue_ready_tasks(
+        self, sorter: TopologicalSorter[str], task_by_id: dict[str, BaseTask], queued_tasks: deque[BaseTask]
+    ) -> None:
+        for task_id in sorter.get_ready():
+            task = task_by_id[task_id]
+
+            if task.is_pending():
+                queued_tasks.append(task)
+            else:
+                sorter.done(task_id)
+
     def __link_task_to_children(self, task: BaseTask, child_tasks: list[BaseTask]) -> None:
         for child_task in child_tasks:
             # Link the new task to the child task
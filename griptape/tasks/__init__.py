@@ -1,23 +1,53 @@
-from .base_task import BaseTask
-from .base_text_input_task import BaseTextInputTask
-from .prompt_task import PromptTask
-from .actions_subtask import ActionsSubtask
-from .toolkit_task import ToolkitTask
-from .text_summary_task import TextSummaryTask
-from .tool_task import ToolTask
-from .rag_task import RagTask
-from .extraction_task import ExtractionTask
-from .base_image_generation_task import BaseImageGenerationTask
-from .code_execution_task import CodeExecutionTask
-from .prompt_image_generation_task import PromptImageGenerationTask
-from .inpainting_image_generation_task import InpaintingImageGenerationTask
-from .outpainting_image_generation_task import OutpaintingImageGenerationTask
-from .variation_image_generation_task import VariationImageGenerationTask
-from .base_audio_generation_task import BaseAudioGenerationTask
-from .text_to_speech_task import TextToSpeechTask
-from .structure_run_task import StructureRunTask
-from .audio_transcription_task import AudioTranscriptionTask
-from .assistant_task import AssistantTask
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base_task import BaseTask
+    from .base_text_input_task import BaseTextInputTask
+    from .prompt_task import PromptTask
+    from .actions_subtask import ActionsSubtask
+    from .toolkit_task import ToolkitTask
+    from .text_summary_task import TextSummaryTask
+    from .tool_task import ToolTask
+    from .rag_task import RagTask
+    from .extraction_task import ExtractionTask
+    from .base_image_generation_task import BaseImageGenerationTask
+    from .code_execution_task import CodeExecutionTask
+    from .prompt_image_generation_task import PromptImageGenerationTask
+    from .inpainting_image_generation_task import InpaintingImageGenerationTask
+    from .outpainting_image_generation_task import OutpaintingImageGenerationTask
+    from .variation_image_generation_task import VariationImageGenerationTask
+    from .base_audio_generation_task import BaseAudioGenerationTask
+    from .text_to_speech_task import TextToSpeechTask
+    from .structure_run_task import StructureRunTask
+    from .audio_transcription_task import AudioTranscriptionTask
+    from .assistant_task import AssistantTask
+
+# Tasks are imported on first access, so that importing this package does not import the dependencies of every Task.
+_LAZY_IMPORTS = {
+    "BaseTask": ".base_task",
+    "BaseTextInputTask": ".base_text_input_task",
+    "PromptTask": ".prompt_task",
+    "ActionsSubtask": ".actions_subtask",
+    "ToolkitTask": ".toolkit_task",
+    "TextSummaryTask": ".text_summary_task",
+    "ToolTask": ".tool_task",
+    "RagTask": ".rag_task",
+    "ExtractionTask": ".extraction_task",
+    "BaseImageGenerationTask": ".base_image_generation_task",
+    "CodeExecutionTask": ".code_execution_task",
+    "PromptImageGenerationTask": ".prompt_image_generation_task",
+    "InpaintingImageGenerationTask": ".inpainting_image_generation_task",
+    "OutpaintingImageGenerationTask": ".outpainting_image_generation_task",
+    "VariationImageGenerationTask": ".variation_image_generation_task",
+    "BaseAudioGenerationTask": ".base_audio_generation_task",
+    "TextToSpeechTask": ".text_to_speech_task",
+    "StructureRunTask": ".structure_run_task",
+    "AudioTranscriptionTask": ".audio_transcription_task",
+    "AssistantTask": ".assistant_task",
+}
 
 __all__ = [
     "BaseTask",
@@ -41,3 +71,17 @@ __all__ = [
     "AudioTranscriptionTask",
     "AssistantTask",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from abc import ABC, abstractmethod
@@ -14,6 +15,7 @@ from griptape.events import EventBus, FinishTaskEvent, StartTaskEvent
 from griptape.mixins.futures_executor_mixin import FuturesExecutorMixin
 from griptape.mixins.runnable_mixin import RunnableMixin
 from griptape.mixins.serializable_mixin import SerializableMixin
+from griptape.utils.contextvars_utils import with_contextvars
 
 if TYPE_CHECKING:
     from griptape.memory.meta import BaseMetaEntry
@@ -101,7 +103,7 @@ class BaseTask(FuturesExecutorMixin, SerializableMixin, RunnableMixin["BaseTask"
         if self.id not in parent.child_ids:
             parent.child_ids.append(self.id)
 
-        if self.structure is not None and parent not in self.structure.tasks:
+        if self.structure is not None and self.structure.try_find_task(parent.id) is None:
             self.structure.add_task(parent)
 
         return self
@@ -117,7 +119,7 @@ class BaseTask(FuturesExecutorMixin, SerializableMixin, RunnableMixin["BaseTask"
         if self.id not in child.parent_ids:
             child.parent_ids.append(self.id)
 
-        if self.structure is not None and child not in self.structure.tasks:
+        if self.structure is not None and self.structure.try_find_task(child.id) is None:
             self.structure.add_task(child)
 
         return self
@@ -167,6 +169,25 @@ class BaseTask(FuturesExecutorMixin, SerializableMixin, RunnableMixin["BaseTask"
 
         return self.output
 
+    async def arun(self) -> BaseArtifact:
+        """Same as `run`, but awaits `atry_run`, so that Tasks can run concurrently on an event loop."""
+        try:
+            self.state = BaseTask.State.RUNNING
+
+            self.before_run()
+
+            self.output = await self.atry_run()
+
+            self.after_run()
+        except Exception as e:
+            logger.exception("%s %s\n%s", self.__class__.__name__, self.id, e)
+
+            self.output = ErrorArtifact(str(e), exception=e)
+        finally:
+            self.state = BaseTask.State.FINISHED
+
+        return self.output
+
     def after_run(self) -> None:
         super().after_run()
         if self.structure is not None:
@@ -192,6 +213,13 @@ class BaseTask(FuturesExecutorMixin, SerializableMixin, RunnableMixin["BaseTask"
     @abstractmethod
     def try_run(self) -> BaseArtifact: ...
 
+    async def atry_run(self) -> BaseArtifact:
+        """Awaitable version of `try_run`.
+
+        Defaults to running `try_run` on the `futures_executor`. Tasks that can await their drivers should override this.
+        """
+        return await asyncio.wrap_future(self.futures_executor.submit(with_contextvars(self.try_run)))
+
     @property
     def full_context(self) -> dict[str, Any]:
         context = self.context
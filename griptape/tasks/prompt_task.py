@@ -104,6 +104,11 @@ class PromptTask(RuleMixin, BaseTask):
 
         return message.to_artifact()
 
+    async def atry_run(self) -> BaseArtifact:
+        message = await self.prompt_driver.arun(self.prompt_stack)
+
+        return message.to_artifact()
+
     def _process_task_input(
         self,
         task_input: str | tuple | list | BaseArtifact | Callable[[BaseTask], BaseArtifact],
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from attrs import define, field
 
 from griptape.artifacts.list_artifact import ListArtifact
+from griptape.tasks.base_task import BaseTask
 from griptape.tasks.prompt_task import PromptTask
 
 if TYPE_CHECKING:
@@ -27,3 +28,7 @@ class StructureRunTask(PromptTask):
             return self.structure_run_driver.run(*self.input.value)
         else:
             return self.structure_run_driver.run(self.input)
+
+    async def atry_run(self) -> BaseArtifact:
+        # Skips PromptTask's version, which prompts the Prompt Driver instead of running the Structure
+        return await BaseTask.atry_run(self)
@@ -9,7 +9,7 @@ from attrs import define, field
 from griptape import utils
 from griptape.artifacts import BaseArtifact, ErrorArtifact, InfoArtifact, ListArtifact
 from griptape.mixins.actions_subtask_origin_mixin import ActionsSubtaskOriginMixin
-from griptape.tasks import ActionsSubtask, PromptTask
+from griptape.tasks import ActionsSubtask, BaseTask, PromptTask
 from griptape.utils import J2
 
 if TYPE_CHECKING:
@@ -93,6 +93,10 @@ class ToolTask(PromptTask, ActionsSubtaskOriginMixin):
             self.output = ErrorArtifact(f"Error processing tool input: {e}", exception=e)
         return self.output
 
+    async def atry_run(self) -> BaseArtifact:
+        # Skips PromptTask's version, which would only prompt the Prompt Driver without running the Tool
+        return await BaseTask.atry_run(self)
+
     def find_tool(self, tool_name: str) -> BaseTool:
         if self.tool.name == tool_name:
             return self.tool
@@ -192,6 +192,31 @@ class ToolkitTask(PromptTask, ActionsSubtaskOriginMixin):
 
         return self.output
 
+    async def atry_run(self) -> BaseArtifact:
+        self.subtasks.clear()
+
+        if self.response_stop_sequence not in self.prompt_driver.tokenizer.stop_sequences:
+            self.prompt_driver.tokenizer.stop_sequences.extend([self.response_stop_sequence])
+
+        result = await self.prompt_driver.arun(self.prompt_stack)
+        subtask = self.add_subtask(ActionsSubtask(result.to_artifact()))
+
+        while True:
+            if subtask.output is None:
+                if len(self.subtasks) >= self.max_subtasks:
+                    subtask.output = ErrorArtifact(f"Exceeded tool limit of {self.max_subtasks} subtasks per task")
+                else:
+                    await subtask.arun()
+
+                    result = await self.prompt_driver.arun(self.prompt_stack)
+                    subtask = self.add_subtask(ActionsSubtask(result.to_artifact()))
+            else:
+                break
+
+        self.output = subtask.output
+
+        return self.output
+
     def find_subtask(self, subtask_id: str) -> ActionsSubtask:
         for subtask in self.subtasks:
             if subtask.id == subtask_id:
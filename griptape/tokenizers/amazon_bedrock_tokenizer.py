@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 from attrs import define, field
 
 from griptape.tokenizers.base_tokenizer import BaseTokenizer
@@ -36,5 +38,8 @@ class AmazonBedrockTokenizer(BaseTokenizer):
     model: str = field(kw_only=True)
     characters_per_token: int = field(default=4, kw_only=True)
 
-    def count_tokens(self, text: str) -> int:
+    def try_count_tokens(self, text: str) -> int:
         return (len(text) + self.characters_per_token - 1) // self.characters_per_token
+
+    def _get_cache_key_params(self) -> dict[str, Any]:
+        return {**super()._get_cache_key_params(), "characters_per_token": self.characters_per_token}
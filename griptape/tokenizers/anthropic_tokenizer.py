@@ -23,11 +23,18 @@ class AnthropicTokenizer(BaseTokenizer):
     )
 
     def count_tokens(self, text: str | list[BetaMessageParam]) -> int:
+        # TODO: Refactor all Tokenizers to support Prompt Stack as an input.
+        if isinstance(text, str):
+            return super().count_tokens(text)
+        else:
+            return self.__count_message_tokens(text)
+
+    def try_count_tokens(self, text: str) -> int:
         types = import_optional_dependency("anthropic.types.beta")
 
-        # TODO: Refactor all Tokenizers to support Prompt Stack as an input.
-        messages = [types.BetaMessageParam(role="user", content=text)] if isinstance(text, str) else text
+        return self.__count_message_tokens([types.BetaMessageParam(role="user", content=text)])
 
+    def __count_message_tokens(self, messages: list[BetaMessageParam]) -> int:
         usage = self.client.beta.messages.count_tokens(
             model=self.model,
             messages=messages,
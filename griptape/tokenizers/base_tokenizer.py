@@ -1,13 +1,32 @@
 from __future__ import annotations
 
+import json
 import logging
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Optional
 
 from attrs import Factory, define, field
 
+from griptape.utils import str_to_hash
+
+if TYPE_CHECKING:
+    from griptape.drivers import BaseCacheDriver
+
 
 @define()
 class BaseTokenizer(ABC):
+    """Base Tokenizer.
+
+    Attributes:
+        model: The name of the model whose tokens are counted.
+        stop_sequences: Sequences that end generation.
+        max_input_tokens: The maximum number of input tokens of the model.
+        max_output_tokens: The maximum number of output tokens of the model.
+        cache_driver: Optional Cache Driver for reusing token counts. Counts are keyed by the Tokenizer class, the
+            settings returned by `_get_cache_key_params`, and the sha256 hash of the text, so a single Cache Driver,
+            such as a bounded `LocalCacheDriver`, can be shared by every Tokenizer.
+    """
+
     DEFAULT_MAX_INPUT_TOKENS = 4096
     DEFAULT_MAX_OUTPUT_TOKENS = 1000
     MODEL_PREFIXES_TO_MAX_INPUT_TOKENS = {}
@@ -17,6 +36,7 @@ class BaseTokenizer(ABC):
     stop_sequences: list[str] = field(default=Factory(list), kw_only=True)
     max_input_tokens: int = field(kw_only=True, default=None)
     max_output_tokens: int = field(kw_only=True, default=None)
+    cache_driver: Optional[BaseCacheDriver] = field(default=None, kw_only=True)
 
     def __attrs_post_init__(self) -> None:
         if hasattr(self, "model"):
@@ -42,8 +62,70 @@ class BaseTokenizer(ABC):
         else:
             return 0
 
+    def count_tokens(self, text: str) -> int:
+        if self.cache_driver is None:
+            return self.try_count_tokens(text)
+
+        cache_key = self._get_cache_key(text)
+        count = self.cache_driver.get(cache_key)
+
+        if count is None:
+            count = self.try_count_tokens(text)
+
+            self.cache_driver.set(cache_key, count)
+
+        return count
+
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Counts the tokens of multiple texts, only counting the texts missing from `cache_driver`.
+
+        Args:
+            texts: Texts to count the tokens of.
+
+        Returns:
+            One token count per text, in the same order as `texts`.
+        """
+        if self.cache_driver is None:
+            return self.try_count_tokens_batch(texts)
+
+        cache_keys = [self._get_cache_key(text) for text in texts]
+        counts = self.cache_driver.get_many(cache_keys)
+        missed_texts = {cache_keys[i]: texts[i] for i, count in enumerate(counts) if count is None}
+        missed_counts = {}
+
+        if missed_texts:
+            missed_counts = dict(zip(missed_texts.keys(), self.try_count_tokens_batch(list(missed_texts.values()))))
+
+            self.cache_driver.set_many(missed_counts)
+
+        return [missed_counts[key] if count is None else count for key, count in zip(cache_keys, counts)]
+
     @abstractmethod
-    def count_tokens(self, text: str) -> int: ...
+    def try_count_tokens(self, text: str) -> int: ...
+
+    def try_count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Counts the tokens of multiple texts.
+
+        Tokenizers that can count many texts at once should override this method. Defaults to counting each text with
+        `try_count_tokens`.
+        """
+        return [self.try_count_tokens(text) for text in texts]
+
+    def _get_cache_key(self, text: str) -> str:
+        params_hash = str_to_hash(json.dumps(self._get_cache_key_params(), sort_keys=True))
+
+        return f"{self.__class__.__name__}:{params_hash}:{str_to_hash(text)}"
+
+    def _get_cache_key_params(self) -> dict[str, Any]:
+        """Returns the settings that change token counts, used to key cached counts.
+
+        Tokenizers with settings other than the model and stop sequences that change their counts should extend this.
+        """
+        return {
+            "model": getattr(self, "model", None),
+            # Stop sequences change counts of Tokenizers that count them as special tokens.
+            "stop_sequences": sorted(self.stop_sequences),
+        }
 
     def _default_max_input_tokens(self) -> int:
         tokens = next(
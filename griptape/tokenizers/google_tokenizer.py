@@ -27,5 +27,5 @@ class GoogleTokenizer(BaseTokenizer):
 
         return genai.GenerativeModel(self.model)
 
-    def count_tokens(self, text: str) -> int:
+    def try_count_tokens(self, text: str) -> int:
         return self.client.count_tokens(text).total_tokens
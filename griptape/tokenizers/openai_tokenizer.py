@@ -7,6 +7,7 @@ import tiktoken
 from attrs import Factory, define, field
 
 from griptape.tokenizers import BaseTokenizer
+from griptape.utils.decorators import lazy_property
 
 
 @define()
@@ -52,8 +53,9 @@ class OpenAiTokenizer(BaseTokenizer):
         kw_only=True,
         default=Factory(lambda self: self._default_max_output_tokens(), takes_self=True),
     )
+    _encoding: Optional[tiktoken.Encoding] = field(default=None, kw_only=True, alias="encoding")
 
-    @property
+    @lazy_property()
     def encoding(self) -> tiktoken.Encoding:
         try:
             return tiktoken.encoding_for_model(self.model)
@@ -85,13 +87,7 @@ class OpenAiTokenizer(BaseTokenizer):
         """
         if isinstance(text, list):
             model = model or self.model
-
-            try:
-                encoding = tiktoken.encoding_for_model(model)
-            except KeyError:
-                logging.warning("model not found. Using cl100k_base encoding.")
-
-                encoding = tiktoken.get_encoding("cl100k_base")
+            encoding = self.__get_encoding(model)
 
             if model in {
                 "gpt-3.5-turbo-0613",
@@ -139,4 +135,22 @@ class OpenAiTokenizer(BaseTokenizer):
 
             return num_tokens
         else:
-            return len(self.encoding.encode(text, allowed_special=set(self.stop_sequences)))
+            return super().count_tokens(text)
+
+    def try_count_tokens(self, text: str) -> int:
+        return len(self.encoding.encode(text, allowed_special=set(self.stop_sequences)))
+
+    def try_count_tokens_batch(self, texts: list[str]) -> list[int]:
+        # Encodes the texts on tiktoken's thread pool.
+        return [len(tokens) for tokens in self.encoding.encode_batch(texts, allowed_special=set(self.stop_sequences))]
+
+    def __get_encoding(self, model: str) -> tiktoken.Encoding:
+        if model == self.model:
+            return self.encoding
+
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            logging.warning("model not found. Using cl100k_base encoding.")
+
+            return tiktoken.get_encoding("cl100k_base")
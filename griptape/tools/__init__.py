@@ -1,28 +1,63 @@
-from .base_tool import BaseTool
-from .base_image_generation_tool import BaseImageGenerationTool
-from .calculator.tool import CalculatorTool
-from .web_search.tool import WebSearchTool
-from .web_scraper.tool import WebScraperTool
-from .sql.tool import SqlTool
-from .email.tool import EmailTool
-from .rest_api.tool import RestApiTool
-from .file_manager.tool import FileManagerTool
-from .vector_store.tool import VectorStoreTool
-from .date_time.tool import DateTimeTool
-from .computer.tool import ComputerTool
-from .prompt_image_generation.tool import PromptImageGenerationTool
-from .variation_image_generation.tool import VariationImageGenerationTool
-from .inpainting_image_generation.tool import InpaintingImageGenerationTool
-from .outpainting_image_generation.tool import OutpaintingImageGenerationTool
-from .griptape_cloud_tool.tool import GriptapeCloudToolTool
-from .structure_run.tool import StructureRunTool
-from .image_query.tool import ImageQueryTool
-from .rag.tool import RagTool
-from .text_to_speech.tool import TextToSpeechTool
-from .audio_transcription.tool import AudioTranscriptionTool
-from .extraction.tool import ExtractionTool
-from .prompt_summary.tool import PromptSummaryTool
-from .query.tool import QueryTool
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base_tool import BaseTool
+    from .base_image_generation_tool import BaseImageGenerationTool
+    from .calculator.tool import CalculatorTool
+    from .web_search.tool import WebSearchTool
+    from .web_scraper.tool import WebScraperTool
+    from .sql.tool import SqlTool
+    from .email.tool import EmailTool
+    from .rest_api.tool import RestApiTool
+    from .file_manager.tool import FileManagerTool
+    from .vector_store.tool import VectorStoreTool
+    from .date_time.tool import DateTimeTool
+    from .computer.tool import ComputerTool
+    from .prompt_image_generation.tool import PromptImageGenerationTool
+    from .variation_image_generation.tool import VariationImageGenerationTool
+    from .inpainting_image_generation.tool import InpaintingImageGenerationTool
+    from .outpainting_image_generation.tool import OutpaintingImageGenerationTool
+    from .griptape_cloud_tool.tool import GriptapeCloudToolTool
+    from .structure_run.tool import StructureRunTool
+    from .image_query.tool import ImageQueryTool
+    from .rag.tool import RagTool
+    from .text_to_speech.tool import TextToSpeechTool
+    from .audio_transcription.tool import AudioTranscriptionTool
+    from .extraction.tool import ExtractionTool
+    from .prompt_summary.tool import PromptSummaryTool
+    from .query.tool import QueryTool
+
+# Tools are imported on first access, so that importing this package does not import the dependencies of every Tool.
+_LAZY_IMPORTS = {
+    "BaseTool": ".base_tool",
+    "BaseImageGenerationTool": ".base_image_generation_tool",
+    "CalculatorTool": ".calculator.tool",
+    "WebSearchTool": ".web_search.tool",
+    "WebScraperTool": ".web_scraper.tool",
+    "SqlTool": ".sql.tool",
+    "EmailTool": ".email.tool",
+    "RestApiTool": ".rest_api.tool",
+    "FileManagerTool": ".file_manager.tool",
+    "VectorStoreTool": ".vector_store.tool",
+    "DateTimeTool": ".date_time.tool",
+    "ComputerTool": ".computer.tool",
+    "PromptImageGenerationTool": ".prompt_image_generation.tool",
+    "VariationImageGenerationTool": ".variation_image_generation.tool",
+    "InpaintingImageGenerationTool": ".inpainting_image_generation.tool",
+    "OutpaintingImageGenerationTool": ".outpainting_image_generation.tool",
+    "GriptapeCloudToolTool": ".griptape_cloud_tool.tool",
+    "StructureRunTool": ".structure_run.tool",
+    "ImageQueryTool": ".image_query.tool",
+    "RagTool": ".rag.tool",
+    "TextToSpeechTool": ".text_to_speech.tool",
+    "AudioTranscriptionTool": ".audio_transcription.tool",
+    "ExtractionTool": ".extraction.tool",
+    "PromptSummaryTool": ".prompt_summary.tool",
+    "QueryTool": ".query.tool",
+}
 
 __all__ = [
     "BaseTool",
@@ -51,3 +86,17 @@ __all__ = [
     "PromptSummaryTool",
     "QueryTool",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
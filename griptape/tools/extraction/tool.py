@@ -21,9 +21,11 @@ class ExtractionTool(BaseTool, RuleMixin):
 
     Attributes:
         extraction_engine: `ExtractionEngine`.
+        args: Keyword arguments passed to the Extraction Engine, such as `parallel`.
     """
 
     extraction_engine: BaseExtractionEngine = field()
+    args: dict = field(factory=dict)
 
     @activity(
         config={
@@ -57,4 +59,4 @@ class ExtractionTool(BaseTool, RuleMixin):
             else:
                 return ErrorArtifact("memory not found")
 
-        return self.extraction_engine.extract_artifacts(artifacts)
+        return self.extraction_engine.extract_artifacts(artifacts, **self.args)
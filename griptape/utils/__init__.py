@@ -18,6 +18,7 @@ from .structure_visualizer import StructureVisualizer
 from .reference_utils import references_from_artifacts
 from .file_utils import get_mime_type
 from .contextvars_utils import with_contextvars
+from .executor_registry import ExecutorRegistry, ExecutorMetrics, SharedExecutor
 
 
 def minify_json(value: str) -> str:
@@ -49,4 +50,7 @@ __all__ = [
     "references_from_artifacts",
     "get_mime_type",
     "with_contextvars",
+    "ExecutorRegistry",
+    "ExecutorMetrics",
+    "SharedExecutor",
 ]
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+from concurrent import futures
+from typing import Callable, TypeVar
+
+from attrs import Factory, define, field
+
+from griptape.mixins.singleton_mixin import SingletonMixin
+
+T = TypeVar("T")
+
+# Tracks the SharedExecutor whose thread is running the current callable, if any.
+_worker = threading.local()
+
+
+@define(frozen=True, kw_only=True)
+class ExecutorMetrics:
+    """Point in time metrics of a SharedExecutor.
+
+    Attributes:
+        name: Name of the executor in the ExecutorRegistry.
+        max_workers: Maximum number of threads the executor starts.
+        thread_count: Number of threads the executor has started.
+        active_count: Number of callables running.
+        queue_depth: Number of callables waiting for a free thread.
+        completed_count: Number of callables that have finished.
+    """
+
+    name: str = field()
+    max_workers: int = field()
+    thread_count: int = field()
+    active_count: int = field()
+    queue_depth: int = field()
+    completed_count: int = field()
+
+
+@define(kw_only=True)
+class SharedExecutor(futures.Executor):
+    """Bounded thread pool shared by every object that picks it from the ExecutorRegistry.
+
+    Callables submitted from one of the executor's own threads while every thread is taken run inline instead of being
+    queued, so that callables waiting on the results of other callables can not deadlock the executor.
+
+    Since the executor outlives the objects using it, `shutdown()` does nothing. Use `ExecutorRegistry.shutdown()`
+    instead.
+
+    Attributes:
+        name: Name of the executor in the ExecutorRegistry.
+        max_workers: Maximum number of threads to start.
+    """
+
+    name: str = field()
+    max_workers: int = field()
+    _executor: futures.ThreadPoolExecutor = field(
+        default=Factory(
+            lambda self: futures.ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix=f"griptape-{self.name}"
+            ),
+            takes_self=True,
+        ),
+        alias="executor",
+    )
+    _lock: threading.Lock = field(factory=threading.Lock, alias="lock")
+    _active_count: int = field(default=0, alias="active_count")
+    _queue_depth: int = field(default=0, alias="queue_depth")
+    _completed_count: int = field(default=0, alias="completed_count")
+
+    @property
+    def metrics(self) -> ExecutorMetrics:
+        with self._lock:
+            return ExecutorMetrics(
+                name=self.name,
+                max_workers=self.max_workers,
+                thread_count=len(self._executor._threads),
+                active_count=self._active_count,
+                queue_depth=self._queue_depth,
+                completed_count=self._completed_count,
+            )
+
+    def submit(self, fn: Callable[..., T], /, *args, **kwargs) -> futures.Future[T]:
+        with self._lock:
+            run_inline = (
+                getattr(_worker, "executor", None) is self
+                and self._active_count + self._queue_depth >= self.max_workers
+            )
+
+            if not run_inline:
+                self._queue_depth += 1
+
+        if run_inline:
+            return self.__run_inline(fn, *args, **kwargs)
+
+        try:
+            future = self._executor.submit(self.__run, fn, *args, **kwargs)
+        except Exception:
+            with self._lock:
+                self._queue_depth -= 1
+            raise
+
+        future.add_done_callback(self.__on_done)
+
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:  # noqa: FBT001, FBT002
+        pass
+
+    def _shutdown(self, *, wait: bool = True, cancel_futures: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def __run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        with self._lock:
+            self._queue_depth -= 1
+            self._active_count += 1
+
+        _worker.executor = self
+
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _worker.executor = None
+
+            with self._lock:
+                self._active_count -= 1
+                self._completed_count += 1
+
+    def __run_inline(self, fn: Callable[..., T], *args, **kwargs) -> futures.Future[T]:
+        future = futures.Future()
+        future.set_running_or_notify_cancel()
+
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+        with self._lock:
+            self._completed_count += 1
+
+        return future
+
+    def __on_done(self, future: futures.Future) -> None:
+        # Callables cancelled while queued never run, so they never leave the queue on their own
+        if future.cancelled():
+            with self._lock:
+                self._queue_depth -= 1
+
+
+@define
+class _ExecutorRegistry(SingletonMixin):
+    """Process-wide registry of named SharedExecutors, each created on first use.
+
+    Attributes:
+        max_workers: Maximum number of threads of each executor by name. Changes apply to executors created afterwards,
+            and adding a name makes a new executor available.
+    """
+
+    DEFAULT_EXECUTOR_NAME = "io"
+    # Executors shut down last, so that events emitted by callables in the other executors still get published.
+    SHUTDOWN_LAST = ("events",)
+
+    max_workers: dict[str, int] = field(
+        factory=lambda: {
+            "io": min(32, (os.cpu_count() or 1) + 4),
+            "cpu": os.cpu_count() or 1,
+            "events": 4,
+        },
+        kw_only=True,
+    )
+    _executors: dict[str, SharedExecutor] = field(factory=dict, alias="executors")
+    _lock: threading.Lock = field(factory=threading.Lock, alias="lock")
+
+    def get_executor(self, name: str = DEFAULT_EXECUTOR_NAME) -> SharedExecutor:
+        with self._lock:
+            if name not in self._executors:
+                if name not in self.max_workers:
+                    raise ValueError(f"Executor {name} is not registered. Add it to ExecutorRegistry.max_workers.")
+
+                self._executors[name] = SharedExecutor(name=name, max_workers=self.max_workers[name])
+
+            return self._executors[name]
+
+    def metrics(self) -> dict[str, ExecutorMetrics]:
+        with self._lock:
+            executors = list(self._executors.values())
+
+        return {executor.name: executor.metrics for executor in executors}
+
+    def shutdown(self, *, wait: bool = True, cancel_futures: bool = False) -> None:
+        """Shuts down every executor, which get created again on next use.
+
+        Args:
+            wait: Whether to wait for the submitted callables to finish.
+            cancel_futures: Whether to cancel the callables that have not started yet.
+        """
+        with self._lock:
+            executors = self._executors
+            self._executors = {}
+
+        for name in sorted(executors, key=lambda name: name in self.SHUTDOWN_LAST):
+            executors[name]._shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+ExecutorRegistry = _ExecutorRegistry()
+
+atexit.register(ExecutorRegistry.shutdown)
@@ -0,0 +1,69 @@
+import logging
+import math
+import random
+import time
+
+import pytest
+from attrs import define, field
+
+from griptape.chunkers import MarkdownChunker, TextChunker
+from griptape.configs import Defaults
+from griptape.tokenizers import OpenAiTokenizer
+
+
+@define
+class CountingOpenAiTokenizer(OpenAiTokenizer):
+    tokenized_characters: int = field(default=0, kw_only=True)
+
+    def try_count_tokens(self, text: str) -> int:
+        self.tokenized_characters += len(text)
+
+        return super().try_count_tokens(text)
+
+    def try_count_tokens_batch(self, texts: list[str]) -> list[int]:
+        self.tokenized_characters += sum(len(text) for text in texts)
+
+        return super().try_count_tokens_batch(texts)
+
+
+class TestTextChunkerBenchmark:
+    PARAGRAPHS = 4000
+
+    @pytest.fixture(autouse=True)
+    def _quiet_logger(self):
+        logging.getLogger(Defaults.logging_config.logger_name).setLevel(logging.WARNING)
+
+    @pytest.fixture()
+    def text(self):
+        rng = random.Random(42)
+        words = ["".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(2, 9))) for _ in range(5000)]
+
+        def sentence() -> str:
+            return " ".join(rng.choices(words, k=rng.randint(5, 25))) + rng.choice([". ", "! ", "? "])
+
+        def paragraph() -> str:
+            return "".join(sentence() for _ in range(rng.randint(2, 8)))
+
+        return "\n\n".join(f"## {paragraph()}" if i % 10 == 0 else paragraph() for i in range(self.PARAGRAPHS))
+
+    @pytest.mark.parametrize("chunker_class", [TextChunker, MarkdownChunker])
+    def test_chunk_large_text(self, chunker_class, text):
+        tokenizer = CountingOpenAiTokenizer(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL)
+        chunker = chunker_class(tokenizer=tokenizer, max_tokens=500)
+
+        start = time.perf_counter()
+        chunks = chunker.chunk(text)
+        elapsed = time.perf_counter() - start
+
+        depth = math.log2(len(chunks))
+        tokenized_ratio = tokenizer.tokenized_characters / len(text)
+
+        print(  # noqa: T201
+            f"\n{chunker_class.__name__} chunked {len(text) / 1e6:.1f}MB into {len(chunks)} chunks in {elapsed:.2f}s, "
+            f"tokenizing each character {tokenized_ratio:.1f} times"
+        )
+
+        assert all(tokenizer.count_tokens(chunk.value) <= 500 for chunk in chunks)
+        # Every level of the recursion tokenizes its chunks once, but subchunks only get tokenized once overall instead
+        # of once per level, which used to double the tokenized characters.
+        assert tokenized_ratio < 1.5 * depth
@@ -0,0 +1,67 @@
+import time
+
+import numpy as np
+import pytest
+
+from griptape.drivers import LocalVectorStoreDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+class TestLocalVectorStoreDriverBenchmark:
+    ENTRY_COUNT = 20000
+    DIMENSIONS = 256
+    CLUSTER_COUNT = 100
+    QUERY_COUNT = 100
+    TOP_K = 10
+
+    @pytest.fixture()
+    def dataset(self):
+        # Clustered vectors approximate the structure of text embeddings better than uniform noise.
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(self.CLUSTER_COUNT, self.DIMENSIONS))
+        clusters = rng.integers(0, self.CLUSTER_COUNT, size=self.ENTRY_COUNT + self.QUERY_COUNT)
+        vectors = centers[clusters] + rng.normal(scale=0.5, size=(len(clusters), self.DIMENSIONS))
+
+        return vectors[: self.ENTRY_COUNT].tolist(), vectors[self.ENTRY_COUNT :].tolist()
+
+    def test_hnsw_recall_and_latency(self, dataset):
+        vectors, queries = dataset
+        entries = [LocalVectorStoreDriver.Entry(id=str(i), vector=vector) for i, vector in enumerate(vectors)]
+        exact_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+        hnsw_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), index_type="hnsw")
+
+        exact_build = self._time(lambda: exact_driver.upsert_vectors(entries))
+        hnsw_build = self._time(lambda: hnsw_driver.upsert_vectors(entries))
+
+        exact_latencies, exact_results = self._query(exact_driver, queries)
+        hnsw_latencies, hnsw_results = self._query(hnsw_driver, queries)
+        recall = np.mean([len(set(exact) & set(hnsw)) / self.TOP_K for exact, hnsw in zip(exact_results, hnsw_results)])
+
+        print(  # noqa: T201
+            f"\n{self.ENTRY_COUNT} entries x {self.DIMENSIONS} dimensions, top {self.TOP_K}\n"
+            f"exact: build {exact_build:.2f}s, query p50 {np.median(exact_latencies) * 1000:.2f}ms\n"
+            f"hnsw:  build {hnsw_build:.2f}s, query p50 {np.median(hnsw_latencies) * 1000:.2f}ms, "
+            f"recall@{self.TOP_K} {recall:.3f}"
+        )
+
+        assert recall >= 0.9
+
+    def _query(self, driver, queries):
+        latencies = []
+        results = []
+
+        for query_vector in queries:
+            driver.embedding_driver = MockEmbeddingDriver(mock_output=lambda _, v=query_vector: v)
+
+            start = time.perf_counter()
+            entries = driver.query("benchmark", count=self.TOP_K)
+            latencies.append(time.perf_counter() - start)
+            results.append([entry.id for entry in entries])
+
+        return latencies, results
+
+    def _time(self, func):
+        start = time.perf_counter()
+        func()
+
+        return time.perf_counter() - start
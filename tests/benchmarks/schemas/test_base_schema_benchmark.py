@@ -0,0 +1,48 @@
+import time
+
+import pytest
+
+from griptape.artifacts import TextArtifact
+from griptape.events import FinishPromptEvent
+from griptape.memory.structure import Run
+from griptape.schemas import BaseSchema
+
+
+class TestBaseSchemaBenchmark:
+    ROUND_TRIPS = 200
+
+    @pytest.mark.parametrize(
+        "serializable",
+        [
+            TextArtifact("foo", meta={"bar": "baz"}),
+            Run(input=TextArtifact("foo"), output=TextArtifact("bar")),
+            FinishPromptEvent(model="foo", result="bar", input_token_count=1, output_token_count=2),
+        ],
+        ids=["TextArtifact", "Run", "FinishPromptEvent"],
+    )
+    def test_round_trip(self, serializable):
+        def round_trip() -> None:
+            type(serializable).from_dict(serializable.to_dict())
+
+        uncached = self._time(round_trip, before=BaseSchema.clear_schema_cache)
+        cached = self._time(round_trip)
+
+        print(  # noqa: T201
+            f"\n{type(serializable).__name__} round trip: uncached {uncached * 1e6:.0f}us, "
+            f"cached {cached * 1e6:.0f}us, {uncached / cached:.1f}x"
+        )
+
+        assert cached < uncached
+
+    def _time(self, func, *, before=None) -> float:
+        total = 0.0
+
+        for _ in range(self.ROUND_TRIPS):
+            if before is not None:
+                before()
+
+            start = time.perf_counter()
+            func()
+            total += time.perf_counter() - start
+
+        return total / self.ROUND_TRIPS
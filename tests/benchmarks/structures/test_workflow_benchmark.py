@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from concurrent import futures
+
+import pytest
+from attrs import define, field
+
+from griptape.artifacts import TextArtifact
+from griptape.common import Message, PromptStack, TextMessageContent
+from griptape.configs import Defaults
+from griptape.structures import Workflow
+from griptape.tasks import CodeExecutionTask, PromptTask
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+
+@define
+class MockAsyncPromptDriver(MockPromptDriver):
+    latency: float = field(default=0.5, kw_only=True)
+    peak_thread_count: int = field(default=0, kw_only=True)
+
+    async def atry_run(self, prompt_stack: PromptStack) -> Message:
+        self.peak_thread_count = max(self.peak_thread_count, threading.active_count())
+        await asyncio.sleep(self.latency)
+
+        return Message(content=[TextMessageContent(TextArtifact("mock output"))], role=Message.ASSISTANT_ROLE)
+
+
+class TestWorkflowBenchmark:
+    @pytest.fixture(autouse=True)
+    def _quiet_logger(self):
+        # Logging every Task's input and output to the console would dominate the timings
+        logger = logging.getLogger(Defaults.logging_config.logger_name)
+        level = logger.level
+        logger.setLevel(logging.WARNING)
+
+        yield
+
+        logger.setLevel(level)
+
+    def test_build_and_run_scaling(self):
+        small_seconds = self._build_and_run(1_000)
+        large_seconds = self._build_and_run(10_000)
+
+        # Quadratic lookups would make each Task ~10x slower in the larger Workflow
+        assert large_seconds / 10_000 < 3 * small_seconds / 1_000
+
+    def test_run_uneven_durations(self):
+        rng = random.Random(42)
+        durations = {}
+        tasks = []
+
+        # Layers of Tasks where a few slow Tasks sit next to chains of fast ones
+        for layer in range(8):
+            for i in range(16):
+                task_id = f"task_{layer}_{i}"
+                durations[task_id] = 0.2 if rng.random() < 0.1 else 0.01
+                task = CodeExecutionTask(on_run=lambda task: self._sleep(durations[task.id]), id=task_id)
+
+                if layer:
+                    task.add_parents(rng.sample(tasks[-16:], 1))
+                tasks.append(task)
+        workflow = Workflow(
+            tasks=tasks, create_futures_executor=lambda: futures.ThreadPoolExecutor(max_workers=len(tasks))
+        )
+
+        start = time.perf_counter()
+        workflow.run()
+        elapsed = time.perf_counter() - start
+
+        critical_path = self._critical_path(workflow, durations)
+        wave_maxima = self._wave_maxima(workflow, durations)
+        print(  # noqa: T201
+            f"\nWorkflow of {len(tasks)} Tasks: {elapsed:.2f}s, critical path {critical_path:.2f}s, "
+            f"sum of wave maxima {wave_maxima:.2f}s"
+        )
+
+        assert elapsed < (critical_path + wave_maxima) / 2
+
+    def test_arun_concurrent_prompts(self):
+        latency = 0.5
+        overhead_seconds, _ = self._arun_prompts(1_000, latency=0)
+        elapsed, peak_thread_count = self._arun_prompts(1_000, latency=latency)
+
+        print(  # noqa: T201
+            f"\nWorkflow of 1000 Prompt Tasks with {latency}s latency: {elapsed:.2f}s "
+            f"({overhead_seconds:.2f}s without latency), peak of {peak_thread_count} threads"
+        )
+        # Every prompt waits at the same time, instead of one batch of prompts per executor thread
+        assert elapsed - overhead_seconds < 2 * latency
+        assert peak_thread_count < 50
+
+    def _arun_prompts(self, task_count: int, *, latency: float) -> tuple[float, int]:
+        prompt_driver = MockAsyncPromptDriver(latency=latency)
+        tasks = [PromptTask(f"prompt {i}", prompt_driver=prompt_driver) for i in range(task_count)]
+        workflow = Workflow(tasks=tasks)
+
+        start = time.perf_counter()
+        asyncio.run(workflow.arun())
+        elapsed = time.perf_counter() - start
+
+        assert all(task.output.value == "mock output" for task in tasks)
+
+        return elapsed, prompt_driver.peak_thread_count
+
+    def _build_and_run(self, task_count: int) -> float:
+        rng = random.Random(42)
+        tasks = [
+            CodeExecutionTask(on_run=lambda task: TextArtifact(task.id), id=f"task_{i}") for i in range(task_count)
+        ]
+
+        start = time.perf_counter()
+        workflow = Workflow()
+        for i, task in enumerate(tasks):
+            workflow.add_task(task)
+            if i:
+                # Link to a couple of recent Tasks, so that the DAG is both wide and deep
+                task.add_parents(rng.sample(tasks[max(0, i - 50) : i], min(i, 2)))
+        build_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        workflow.run()
+        run_seconds = time.perf_counter() - start
+
+        print(  # noqa: T201
+            f"\nWorkflow of {task_count} Tasks: built in {build_seconds:.2f}s, ran in {run_seconds:.2f}s, "
+            f"{(build_seconds + run_seconds) / task_count * 1e6:.0f}us per Task"
+        )
+        assert all(task.output.value == task.id for task in tasks)
+
+        return build_seconds + run_seconds
+
+    def _sleep(self, duration: float) -> TextArtifact:
+        time.sleep(duration)
+
+        return TextArtifact(str(duration))
+
+    def _critical_path(self, workflow: Workflow, durations: dict) -> float:
+        finish_times = {}
+
+        for task in workflow.order_tasks():
+            finish_times[task.id] = durations[task.id] + max((finish_times[p] for p in task.parent_ids), default=0)
+
+        return max(finish_times.values())
+
+    def _wave_maxima(self, workflow: Workflow, durations: dict) -> float:
+        waves = {}
+
+        for task in workflow.order_tasks():
+            waves[task.id] = 1 + max((waves[p] for p in task.parent_ids), default=0)
+
+        return sum(max(durations[task_id] for task_id, wave in waves.items() if wave == i) for i in set(waves.values()))
@@ -0,0 +1,39 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+
+class TestImportBenchmark:
+    RUNS = 5
+
+    # Generous budget for cold imports, which take a few milliseconds while the packages are loaded lazily.
+    MAX_IMPORT_SECONDS = 0.25
+
+    # Provider SDKs that should only be imported by the Drivers that use them.
+    HEAVY_MODULES = ["openai", "anthropic", "cohere", "boto3", "tiktoken", "numpy"]
+
+    @pytest.mark.parametrize(
+        "statement",
+        ["import griptape", "import griptape.drivers, griptape.tools, griptape.loaders, griptape.tasks"],
+    )
+    def test_import_time(self, statement):
+        results = [self._import(statement) for _ in range(self.RUNS)]
+        seconds = min(result["seconds"] for result in results)
+
+        print(f"\n{statement}: {seconds * 1000:.1f}ms")  # noqa: T201
+
+        assert seconds < self.MAX_IMPORT_SECONDS
+        assert not set(results[0]["modules"]) & set(self.HEAVY_MODULES)
+
+    def _import(self, statement: str) -> dict:
+        code = (
+            "import json, sys, time\n"
+            "start = time.perf_counter()\n"
+            f"{statement}\n"
+            "seconds = time.perf_counter() - start\n"
+            "print(json.dumps({'seconds': seconds, 'modules': sorted(sys.modules)}))\n"
+        )
+
+        return json.loads(subprocess.check_output([sys.executable, "-c", code], text=True))
@@ -0,0 +1,64 @@
+import logging
+import threading
+import time
+from concurrent import futures
+
+import pytest
+
+from griptape.artifacts import TextArtifact
+from griptape.configs import Defaults
+from griptape.structures import Workflow
+from griptape.tasks import CodeExecutionTask
+from griptape.utils import ExecutorRegistry
+
+
+class TestExecutorRegistryBenchmark:
+    TASK_COUNT = 500
+
+    @pytest.fixture(autouse=True)
+    def _quiet_logger(self):
+        logger = logging.getLogger(Defaults.logging_config.logger_name)
+        level = logger.level
+        logger.setLevel(logging.WARNING)
+
+        yield
+
+        logger.setLevel(level)
+
+    def test_thread_count(self):
+        shared_threads, shared_seconds = self._run(None)
+        owned_threads, owned_seconds = self._run(lambda: futures.ThreadPoolExecutor())
+
+        print(  # noqa: T201
+            f"\nWorkflow of {self.TASK_COUNT} fanning out Tasks: peak {shared_threads} threads in {shared_seconds:.2f}s "
+            f"with shared executors, {owned_threads} threads in {owned_seconds:.2f}s with an executor per Task"
+        )
+
+        assert shared_threads <= sum(ExecutorRegistry.max_workers.values()) + 1
+        assert shared_threads < owned_threads
+
+    def _run(self, create_futures_executor) -> tuple[int, float]:
+        peak_threads = 0
+        lock = threading.Lock()
+
+        def fan_out(task):
+            nonlocal peak_threads
+
+            # Like an ActionsSubtask running its actions concurrently
+            results = [f.result() for f in [task.futures_executor.submit(time.sleep, 0.001) for _ in range(4)]]
+            with lock:
+                peak_threads = max(peak_threads, threading.active_count())
+
+            return TextArtifact(str(len(results)))
+
+        kwargs = {} if create_futures_executor is None else {"create_futures_executor": create_futures_executor}
+        tasks = [CodeExecutionTask(on_run=fan_out, **kwargs) for _ in range(self.TASK_COUNT)]
+        workflow = Workflow(tasks=tasks)
+
+        start = time.perf_counter()
+        workflow.run()
+        seconds = time.perf_counter() - start
+
+        del workflow, tasks
+
+        return peak_threads, seconds
@@ -7,5 +7,5 @@ from griptape.tokenizers import BaseTokenizer
 
 @define()
 class MockTokenizer(BaseTokenizer):
-    def count_tokens(self, text: str) -> int:
+    def try_count_tokens(self, text: str) -> int:
         return len(text)
@@ -1,7 +1,11 @@
+import io
+
 import pytest
 
 from griptape.artifacts import TextArtifact
 from griptape.chunkers import TextChunker
+from griptape.tokenizers import SimpleTokenizer
+from tests.mocks.mock_tokenizer import MockTokenizer
 from tests.unit.chunkers.utils import gen_paragraph
 
 MAX_TOKENS = 50
@@ -111,3 +115,100 @@ class TestTextChunker:
     def test_chunk_with_max_tokens(self, chunker):
         with pytest.raises(ValueError):
             TextChunker(max_tokens=-1)
+
+    def test_chunk_tokenizes_subchunks_once(self, mocker):
+        chunker = TextChunker(tokenizer=MockTokenizer(model="foo"), max_tokens=10)
+        count_tokens_batch = mocker.spy(MockTokenizer, "count_tokens_batch")
+
+        chunks = chunker.chunk(" ".join(f"foo{i}" for i in range(100)))
+
+        counted_subchunks = [text for call in count_tokens_batch.call_args_list for text in call.args[1]]
+        assert len(counted_subchunks) == len(set(counted_subchunks)) == 100
+        assert all(len(chunk.value) <= 10 for chunk in chunks)
+
+    def test_chunk_offsets(self, chunker):
+        text = gen_paragraph(MAX_TOKENS * 3, chunker.tokenizer, ". ")
+
+        chunks = chunker.chunk(text)
+
+        assert all(text[c.meta["start"] : c.meta["end"]] == c.value for c in chunks)
+        assert all(a.meta["end"] <= b.meta["start"] for a, b in zip(chunks, chunks[1:]))
+
+    def test_chunk_with_overlap_tokens(self):
+        tokenizer = MockTokenizer(model="foo")
+        chunker = TextChunker(tokenizer=tokenizer, max_tokens=40, overlap_tokens=10)
+        text = " ".join(f"w{i}" for i in range(100))
+
+        chunks = chunker.chunk(text)
+
+        assert all(text[c.meta["start"] : c.meta["end"]] == c.value for c in chunks)
+        assert all(tokenizer.count_tokens(c.value) <= 40 for c in chunks)
+        for previous, chunk in zip(chunks, chunks[1:]):
+            overlap = text[chunk.meta["start"] : previous.meta["end"]]
+            assert previous.value.endswith(overlap)
+            assert 0 < tokenizer.count_tokens(overlap) <= 10
+            # The overlap is the longest run of whole words that fits.
+            assert tokenizer.count_tokens(f"{previous.value[: -len(overlap)].split()[-1]} {overlap}") > 10
+        assert " ".join(c.value for c in chunks).split() != text.split()
+        assert set(" ".join(c.value for c in chunks).split()) == set(text.split())
+
+    def test_chunk_with_balance_at_last_subchunk(self):
+        chunker = TextChunker(tokenizer=SimpleTokenizer(characters_per_token=1), max_tokens=50)
+
+        chunks = chunker.chunk("a" + "\n\n" * 10 + "B" * 60)
+
+        assert [c.value for c in chunks] == ["a", "B" * 30, "B" * 30]
+
+    def test_chunk_with_invalid_overlap_tokens(self):
+        with pytest.raises(ValueError, match="overlap_tokens"):
+            TextChunker(max_tokens=10, overlap_tokens=10)
+
+        with pytest.raises(ValueError, match="overlap_tokens"):
+            TextChunker(max_tokens=10, overlap_tokens=-1)
+
+    def test_iter_chunks(self, chunker):
+        text = gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, " ")
+
+        assert [c.value for c in chunker.iter_chunks(text)] == [c.value for c in chunker.chunk(text)]
+        assert [c.value for c in chunker.iter_chunks(TextArtifact(text))] == [c.value for c in chunker.chunk(text)]
+
+    def test_iter_chunks_with_stream(self):
+        chunker = TextChunker(tokenizer=MockTokenizer(model="foo"), max_tokens=20, stream_buffer_size=100)
+        paragraphs = [" ".join(f"p{i}w{j}" for j in range(i % 7 + 1)) for i in range(200)]
+        stream = io.StringIO("\n\n".join(paragraphs))
+        read_sizes = []
+        read = stream.read
+        stream.read = lambda size: read_sizes.append(size) or read(size)
+
+        chunks = [c.value for c in chunker.iter_chunks(stream)]
+
+        assert set(read_sizes) == {100}
+        assert all(len(chunk) <= 20 for chunk in chunks)
+        # Buffers are cut between paragraphs, so no chunk joins parts of two paragraphs with a lower priority separator.
+        assert all(
+            any(part in paragraph for paragraph in paragraphs) for chunk in chunks for part in chunk.split("\n\n")
+        )
+        assert " ".join(chunks).split() == " ".join(paragraphs).split()
+
+    def test_iter_chunks_with_iterator(self):
+        chunker = TextChunker(tokenizer=MockTokenizer(model="foo"), max_tokens=20, stream_buffer_size=50)
+        text = "\n".join(f"line {i}. " + "word " * (i % 5) for i in range(100))
+
+        chunks = list(chunker.iter_chunks(text[i : i + 7] for i in range(0, len(text), 7)))
+
+        assert all(len(chunk.value) <= 20 for chunk in chunks)
+        assert " ".join(c.value for c in chunks).split() == text.split()
+
+    def test_iter_chunks_with_overlap_tokens(self):
+        tokenizer = MockTokenizer(model="foo")
+        text = "\n".join(" ".join(f"l{i}w{j}" for j in range(i % 9 + 1)) for i in range(100))
+        chunker = TextChunker(tokenizer=tokenizer, max_tokens=30, overlap_tokens=8, stream_buffer_size=64)
+
+        chunks = list(chunker.iter_chunks(text[i : i + 10] for i in range(0, len(text), 10)))
+
+        assert all(text[c.meta["start"] : c.meta["end"]] == c.value for c in chunks)
+        assert all(a.meta["start"] < b.meta["start"] < a.meta["end"] for a, b in zip(chunks, chunks[1:]))
+
+    def test_iter_chunks_with_stream_buffer_size(self):
+        with pytest.raises(ValueError, match="stream_buffer_size"):
+            TextChunker(stream_buffer_size=0)
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import call
 
 import pytest
@@ -239,3 +240,20 @@ class TestObservable:
                 ),
             ]
         )
+
+    def test_observable_coroutine_function(self, observe_spy, mocker):
+        from griptape.common import observable
+
+        aobserve_spy = mocker.spy(observability.Observability, "aobserve")
+
+        @observable
+        async def bar(*args, **kwargs):
+            await asyncio.sleep(0)
+
+            return args[0]
+
+        assert asyncio.run(bar("a")) == "a"
+
+        original_bar = bar.__wrapped__
+        assert observe_spy.call_count == 0
+        aobserve_spy.assert_called_once_with(Observable.Call(func=original_bar, args=("a",)))
@@ -40,6 +40,7 @@ class TestAnthropicDriversConfig:
             "conversation_memory_driver": {
                 "type": "LocalConversationMemoryDriver",
                 "persist_file": None,
+                "persist_format": "json",
             },
             "ruleset_driver": {
                 "type": "LocalRulesetDriver",
@@ -41,6 +41,7 @@ class TestAzureOpenAiDriversConfig:
             "conversation_memory_driver": {
                 "type": "LocalConversationMemoryDriver",
                 "persist_file": None,
+                "persist_format": "json",
             },
             "embedding_driver": {
                 "base_url": None,
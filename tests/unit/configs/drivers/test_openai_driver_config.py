@@ -33,6 +33,7 @@ class TestOpenAiDriversConfig:
             "conversation_memory_driver": {
                 "type": "LocalConversationMemoryDriver",
                 "persist_file": None,
+                "persist_format": "json",
             },
             "embedding_driver": {
                 "base_url": None,
@@ -0,0 +1,59 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from griptape.drivers import LocalCacheDriver
+
+
+class TestLocalCacheDriver:
+    @pytest.fixture()
+    def driver(self):
+        return LocalCacheDriver(max_size=2)
+
+    def test_get_set(self, driver):
+        driver.set("foo", [0, 1])
+
+        assert driver.get("foo") == [0, 1]
+        assert driver.get("bar") is None
+        assert driver.hits == 1
+        assert driver.misses == 1
+
+    def test_get_many(self, driver):
+        driver.set_many({"foo": 1, "bar": 2})
+
+        assert driver.get_many(["foo", "baz", "bar"]) == [1, None, 2]
+        assert driver.hits == 2
+        assert driver.misses == 1
+
+    def test_get_many_from_threads(self, driver):
+        driver.set("foo", 1)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: driver.get_many(["foo", "bar"]), range(1000)))
+
+        assert driver.hits == 1000
+        assert driver.misses == 1000
+
+    def test_evicts_least_recently_used(self, driver):
+        driver.set("foo", 1)
+        driver.set("bar", 2)
+        driver.get("foo")
+        driver.set("baz", 3)
+
+        assert driver.get_many(["foo", "bar", "baz"]) == [1, None, 3]
+
+    def test_ttl(self, driver, mocker):
+        mock_time = mocker.patch("time.monotonic", return_value=100)
+        driver.set("foo", 1, ttl=10)
+        driver.ttl = 20
+        driver.set("bar", 2)
+
+        mock_time.return_value = 115
+
+        assert driver.get_many(["foo", "bar"]) == [None, 2]
+
+    def test_delete(self, driver):
+        driver.set("foo", 1)
+        driver.delete("foo")
+
+        assert driver.get("foo") is None
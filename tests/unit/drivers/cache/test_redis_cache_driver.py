@@ -0,0 +1,36 @@
+import pytest
+
+from griptape.drivers import RedisCacheDriver
+
+
+class TestRedisCacheDriver:
+    @pytest.fixture()
+    def mock_client(self, mocker):
+        mock_client = mocker.patch("redis.Redis").return_value
+        mock_client.mget.return_value = [b"[0, 1]", None]
+
+        return mock_client
+
+    @pytest.fixture()
+    def driver(self, mock_client):
+        return RedisCacheDriver(host="localhost", port=6379, ttl=10)
+
+    def test_get_many(self, driver, mock_client):
+        assert driver.get_many(["foo", "bar"]) == [[0, 1], None]
+        mock_client.mget.assert_called_once_with(["griptape:cache:foo", "griptape:cache:bar"])
+        assert driver.hits == 1
+        assert driver.misses == 1
+
+    def test_set(self, driver, mock_client):
+        driver.set("foo", [0, 1])
+        driver.set("bar", [1, 0], ttl=1.5)
+
+        pipeline = mock_client.pipeline.return_value
+        pipeline.set.assert_any_call("griptape:cache:foo", "[0, 1]", px=10000)
+        pipeline.set.assert_any_call("griptape:cache:bar", "[1, 0]", px=1500)
+        assert pipeline.execute.call_count == 2
+
+    def test_delete(self, driver, mock_client):
+        driver.delete("foo")
+
+        mock_client.delete.assert_called_once_with("griptape:cache:foo")
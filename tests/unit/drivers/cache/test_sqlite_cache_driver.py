@@ -0,0 +1,51 @@
+import os
+import tempfile
+
+import pytest
+
+from griptape.drivers import SqliteCacheDriver
+
+
+class TestSqliteCacheDriver:
+    @pytest.fixture()
+    def database(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield os.path.join(temp_dir, "cache", "cache.db")
+
+    @pytest.fixture()
+    def driver(self, database):
+        return SqliteCacheDriver(database=database)
+
+    def test_get_set(self, driver):
+        driver.set("foo", [0.5, 1.0])
+
+        assert driver.get("foo") == [0.5, 1.0]
+        assert driver.get("bar") is None
+        assert driver.hits == 1
+        assert driver.misses == 1
+
+    def test_get_many(self, driver):
+        driver.set_many({f"foo-{i}": i for i in range(1200)})
+
+        assert driver.get_many([f"foo-{i}" for i in range(1201)]) == [*range(1200), None]
+
+    def test_persistence(self, driver, database):
+        driver.set("foo", {"bar": "baz"})
+
+        assert SqliteCacheDriver(database=database).get("foo") == {"bar": "baz"}
+
+    def test_ttl(self, driver, mocker):
+        mock_time = mocker.patch("time.time", return_value=100)
+        driver.set("foo", 1, ttl=10)
+        driver.set("bar", 2)
+
+        mock_time.return_value = 115
+
+        assert driver.get_many(["foo", "bar"]) == [None, 2]
+        assert driver.connection.execute("SELECT COUNT(*) FROM griptape_cache").fetchone()[0] == 1
+
+    def test_delete(self, driver):
+        driver.set("foo", 1)
+        driver.delete("foo")
+
+        assert driver.get("foo") is None
@@ -3,7 +3,9 @@ from unittest.mock import patch
 import pytest
 
 from griptape.artifacts import TextArtifact
+from griptape.drivers import LocalCacheDriver
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 
 class TestBaseEmbeddingDriver:
@@ -41,3 +43,86 @@ class TestBaseEmbeddingDriver:
             driver.embed_string("foobar")
 
         assert e.value.args[0] == "nope"
+
+    def test_embed_strings(self, driver):
+        driver.mock_output = lambda chunk: [len(chunk), 1]
+
+        assert driver.embed_strings(["a", "bb", "ccc"]) == [[1, 1], [2, 1], [3, 1]]
+
+    def test_embed_strings_batches_by_size(self, driver):
+        driver.max_batch_size = 2
+
+        with patch.object(
+            MockEmbeddingDriver, "try_embed_chunks", side_effect=lambda chunks: [[0, 1]] * len(chunks)
+        ) as m:
+            assert len(driver.embed_strings(["a", "b", "c", "d", "e"])) == 5
+
+        assert [call.args[0] for call in m.call_args_list] == [["a", "b"], ["c", "d"], ["e"]]
+
+    def test_embed_strings_batches_by_tokens(self, driver):
+        driver.max_batch_size = 10
+        driver.max_batch_tokens = 5
+
+        with patch.object(
+            MockEmbeddingDriver, "try_embed_chunks", side_effect=lambda chunks: [[0, 1]] * len(chunks)
+        ) as m:
+            driver.embed_strings(["aa", "bb", "cc", "d", "eeeee"])
+
+        assert [call.args[0] for call in m.call_args_list] == [["aa", "bb"], ["cc", "d"], ["eeeee"]]
+
+    def test_embed_strings_long_string(self, driver):
+        driver.max_batch_size = 10
+        driver.mock_output = lambda chunk: [len(chunk), 0]
+
+        embeddings = driver.embed_strings(["foo", "foobar" * 5000, "bar"])
+
+        assert embeddings[0] == [3, 0]
+        assert embeddings[1] == [1, 0]
+        assert embeddings[2] == [3, 0]
+
+    def test_embed_strings_mismatched_embeddings(self, driver):
+        driver.max_batch_size = 10
+
+        with patch.object(MockEmbeddingDriver, "try_embed_chunks", return_value=[[0, 1]]), pytest.raises(ValueError):
+            driver.embed_strings(["foo", "bar"])
+
+    def test_embed_string_cache(self, driver):
+        driver.cache_driver = LocalCacheDriver()
+
+        with patch.object(MockEmbeddingDriver, "try_embed_chunk", return_value=[0, 1]) as m:
+            assert driver.embed_string("foobar") == [0, 1]
+            assert driver.embed_string("foobar") == [0, 1]
+
+        assert m.call_count == 1
+        assert driver.cache_driver.hits == 1
+        assert driver.cache_driver.misses == 1
+
+    def test_embed_string_cache_hit_skips_tokenizer(self, driver):
+        driver.cache_driver = LocalCacheDriver()
+        driver.embed_string("foobar")
+
+        with patch.object(MockTokenizer, "count_tokens") as m:
+            driver.embed_string("foobar")
+
+        m.assert_not_called()
+
+    def test_embed_strings_cache(self, driver):
+        driver.cache_driver = LocalCacheDriver()
+        driver.max_batch_size = 10
+        driver.embed_string("foo")
+
+        with patch.object(
+            MockEmbeddingDriver, "try_embed_chunks", side_effect=lambda chunks: [[0, 1]] * len(chunks)
+        ) as m:
+            embeddings = driver.embed_strings(["foo", "bar", "baz", "bar"])
+
+        assert embeddings == [[0, 1]] * 4
+        m.assert_called_once_with(["bar", "baz"])
+        assert driver.cache_driver.get_many([driver._get_cache_key("bar"), driver._get_cache_key("baz")]) == [
+            [0, 1],
+            [0, 1],
+        ]
+
+    def test_cache_key(self, driver):
+        assert driver._get_cache_key("foo") != MockEmbeddingDriver(model="bar")._get_cache_key("foo")
+        assert driver._get_cache_key("foo") == MockEmbeddingDriver()._get_cache_key("foo")
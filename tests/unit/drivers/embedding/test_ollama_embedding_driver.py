@@ -17,3 +17,9 @@ class TestOllamaEmbeddingDriver:
 
     def test_try_embed_chunk(self):
         assert OllamaEmbeddingDriver(model="foo").try_embed_chunk("foobar") == [0, 1, 0]
+
+    def test_try_embed_chunks(self, mock_client):
+        mock_client.return_value.embed.return_value = {"embeddings": [[0, 1, 0], [1, 0, 0]]}
+
+        assert OllamaEmbeddingDriver(model="foo").try_embed_chunks(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        mock_client.return_value.embed.assert_called_once_with(model="foo", input=["foo", "bar"])
@@ -149,3 +149,102 @@ class TestDynamoDbConversationMemoryDriver:
 
         assert len(runs) == 2
         assert metadata == {"foo": "bar"}
+
+    def test_append_run_with_run_items(self):
+        session = boto3.Session(region_name=self.AWS_REGION)
+        table = session.resource("dynamodb").Table(self.DYNAMODB_COMPOSITE_TABLE_NAME)
+        memory_driver = self._create_run_items_driver(session)
+        memory = ConversationMemory(conversation_memory_driver=memory_driver, meta={"foo": "bar"})
+        pipeline = Pipeline(conversation_memory=memory)
+
+        pipeline.add_task(PromptTask("test"))
+
+        pipeline.run()
+        pipeline.run()
+        pipeline.run()
+
+        items = table.scan()["Items"]
+        runs, metadata = memory_driver.load(last_n=2)
+
+        # One item per run and one for the metadata.
+        assert len(items) == 4
+        assert [run.id for run in runs] == [run.id for run in memory.runs[1:]]
+        assert [run.id for run in memory_driver.load()[0]] == [run.id for run in memory.runs]
+        assert memory_driver.load(last_n=0) == ([], {"foo": "bar"})
+        assert metadata == {"foo": "bar"}
+
+    def test_append_run_migrates_legacy_runs(self):
+        session = boto3.Session(region_name=self.AWS_REGION)
+        table = session.resource("dynamodb").Table(self.DYNAMODB_COMPOSITE_TABLE_NAME)
+        legacy_driver = AmazonDynamoDbConversationMemoryDriver(
+            session=session,
+            table_name=self.DYNAMODB_COMPOSITE_TABLE_NAME,
+            partition_key=self.DYNAMODB_PARTITION_KEY,
+            value_attribute_key=self.VALUE_ATTRIBUTE_KEY,
+            partition_key_value=self.PARTITION_KEY_VALUE,
+            sort_key=self.DYNAMODB_SORT_KEY,
+            sort_key_value=self.SORT_KEY_VALUE,
+        )
+        pipeline = Pipeline(conversation_memory=ConversationMemory(conversation_memory_driver=legacy_driver))
+
+        pipeline.add_task(PromptTask("test"))
+
+        pipeline.run()
+        pipeline.run()
+
+        memory_driver = self._create_run_items_driver(session)
+        memory = ConversationMemory(conversation_memory_driver=memory_driver)
+        pipeline = Pipeline(conversation_memory=memory)
+
+        pipeline.add_task(PromptTask("test"))
+
+        pipeline.run()
+
+        runs, _ = memory_driver.load()
+
+        # One item per run and one for the metadata.
+        assert len(table.scan()["Items"]) == 4
+        assert len(memory.runs) == 3
+        assert [run.id for run in runs] == [run.id for run in memory.runs]
+
+    def test_store_with_run_items(self):
+        session = boto3.Session(region_name=self.AWS_REGION)
+        table = session.resource("dynamodb").Table(self.DYNAMODB_COMPOSITE_TABLE_NAME)
+        memory_driver = self._create_run_items_driver(session)
+        memory = ConversationMemory(conversation_memory_driver=memory_driver)
+        pipeline = Pipeline(conversation_memory=memory)
+
+        pipeline.add_task(PromptTask("test"))
+
+        pipeline.run()
+        pipeline.run()
+        memory_driver.store(memory.runs[1:], {"fizz": "buzz"})
+
+        runs, metadata = memory_driver.load()
+
+        assert len(table.scan()["Items"]) == 2
+        assert [run.id for run in runs] == [memory.runs[1].id]
+        assert metadata == {"fizz": "buzz"}
+
+    def test_run_items_without_sort_key(self):
+        with pytest.raises(ValueError, match="requires a sort_key and a sort_key_value"):
+            AmazonDynamoDbConversationMemoryDriver(
+                session=boto3.Session(region_name=self.AWS_REGION),
+                table_name=self.DYNAMODB_TABLE_NAME,
+                partition_key=self.DYNAMODB_PARTITION_KEY,
+                value_attribute_key=self.VALUE_ATTRIBUTE_KEY,
+                partition_key_value=self.PARTITION_KEY_VALUE,
+                run_items=True,
+            )
+
+    def _create_run_items_driver(self, session):
+        return AmazonDynamoDbConversationMemoryDriver(
+            session=session,
+            table_name=self.DYNAMODB_COMPOSITE_TABLE_NAME,
+            partition_key=self.DYNAMODB_PARTITION_KEY,
+            value_attribute_key=self.VALUE_ATTRIBUTE_KEY,
+            partition_key_value=self.PARTITION_KEY_VALUE,
+            sort_key=self.DYNAMODB_SORT_KEY,
+            sort_key_value=self.SORT_KEY_VALUE,
+            run_items=True,
+        )
@@ -4,8 +4,9 @@ from pathlib import Path
 
 import pytest
 
+from griptape.artifacts import TextArtifact
 from griptape.drivers import LocalConversationMemoryDriver
-from griptape.memory.structure import ConversationMemory
+from griptape.memory.structure import ConversationMemory, Run
 from griptape.structures import Pipeline
 from griptape.tasks import PromptTask
 
@@ -79,6 +80,67 @@ class TestLocalConversationMemoryDriver:
         assert autoloaded_memory.runs[0].input.value == "test"
         assert autoloaded_memory.runs[0].output.value == "mock output"
 
+    def test_load_last_n(self):
+        memory_driver = LocalConversationMemoryDriver(persist_file=self.MEMORY_FILE_PATH)
+        memory_driver.store([Run(input=TextArtifact(f"foo{i}"), output=TextArtifact("bar")) for i in range(3)], {})
+
+        runs, _ = memory_driver.load(last_n=2)
+
+        assert [run.input.value for run in runs] == ["foo1", "foo2"]
+        assert memory_driver.load(last_n=0)[0] == []
+
+    def test_store_jsonl(self):
+        memory_driver = LocalConversationMemoryDriver(persist_file=self.MEMORY_FILE_PATH, persist_format="jsonl")
+        runs = [Run(input=TextArtifact(f"foo{i}"), output=TextArtifact("bar")) for i in range(3)]
+
+        memory_driver.store(runs, {"foo": "bar"})
+
+        assert len(Path(self.MEMORY_FILE_PATH).read_text().splitlines()) == 4
+        assert [run.id for run in memory_driver.load()[0]] == [run.id for run in runs]
+        assert memory_driver.load()[1] == {"foo": "bar"}
+
+    def test_append_run_jsonl(self):
+        memory_driver = LocalConversationMemoryDriver(persist_file=self.MEMORY_FILE_PATH, persist_format="jsonl")
+        memory = ConversationMemory(conversation_memory_driver=memory_driver, meta={"foo": "bar"})
+        pipeline = Pipeline(conversation_memory=memory)
+
+        pipeline.add_task(PromptTask("test"))
+
+        pipeline.run()
+        pipeline.run()
+        memory.meta["fizz"] = "buzz"
+        pipeline.run()
+
+        lines = Path(self.MEMORY_FILE_PATH).read_text().splitlines()
+        runs, metadata = memory_driver.load(last_n=2)
+
+        # 3 runs, and the metadata each time it changed.
+        assert len(lines) == 5
+        assert [run.id for run in runs] == [run.id for run in memory.runs[1:]]
+        assert metadata == {"foo": "bar", "fizz": "buzz"}
+
+    def test_autoload_jsonl_with_max_runs(self):
+        memory_driver = LocalConversationMemoryDriver(persist_file=self.MEMORY_FILE_PATH, persist_format="jsonl")
+        memory = ConversationMemory(conversation_memory_driver=memory_driver, max_runs=2)
+        pipeline = Pipeline(conversation_memory=memory)
+
+        pipeline.add_task(PromptTask("test"))
+
+        pipeline.run()
+        pipeline.run()
+        pipeline.run()
+
+        autoloaded_memory = ConversationMemory(conversation_memory_driver=memory_driver, max_runs=2)
+
+        assert [run.id for run in autoloaded_memory.runs] == [run.id for run in memory.runs]
+
+    def test_load_bad_data_jsonl(self):
+        Path(self.MEMORY_FILE_PATH).write_text('{"run": bad data')
+        memory_driver = LocalConversationMemoryDriver(persist_file=self.MEMORY_FILE_PATH, persist_format="jsonl")
+
+        with pytest.raises(ValueError, match="Unable to load data from test_memory.json"):
+            memory_driver.load()
+
     def __delete_file(self, persist_file) -> None:
         with contextlib.suppress(FileNotFoundError):
             os.remove(persist_file)
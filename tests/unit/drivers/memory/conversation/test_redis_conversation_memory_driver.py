@@ -1,3 +1,5 @@
+import json
+
 import pytest
 import redis
 
@@ -19,6 +21,10 @@ class TestRedisConversationMemoryDriver:
         mocker.patch.object(redis.StrictRedis, "hset", return_value=None)
         mocker.patch.object(redis.StrictRedis, "keys", return_value=[b"test"])
         mocker.patch.object(redis.StrictRedis, "hget", return_value=TEST_DATA)
+        mocker.patch.object(redis.StrictRedis, "lrange", return_value=[])
+        mocker.patch.object(redis.StrictRedis, "exists", return_value=1)
+        mocker.patch.object(redis.StrictRedis, "rpush", return_value=1)
+        mocker.patch.object(redis.StrictRedis, "delete", return_value=1)
 
         fake_redisearch = mocker.MagicMock()
         fake_redisearch.search = mocker.MagicMock(return_value=mocker.MagicMock(docs=[]))
@@ -35,6 +41,53 @@ class TestRedisConversationMemoryDriver:
         memory = BaseConversationMemory.from_json(TEST_MEMORY)
         assert driver.store(memory.runs, memory.meta) is None
 
+        redis.StrictRedis.delete.assert_called_once_with(f"{INDEX}:{CONVERSATION_ID}:runs")
+        redis.StrictRedis.rpush.assert_called_once_with(f"{INDEX}:{CONVERSATION_ID}:runs", memory.runs[0].to_json())
+        redis.StrictRedis.hset.assert_called_once_with(
+            INDEX, CONVERSATION_ID, json.dumps({"runs": [], "metadata": memory.meta})
+        )
+
+    def test_append_run(self, driver):
+        memory = BaseConversationMemory.from_json(TEST_MEMORY)
+
+        driver.append_run(memory.runs[0], memory.runs, {"foo": "bar"})
+
+        redis.StrictRedis.delete.assert_not_called()
+        redis.StrictRedis.rpush.assert_called_once_with(f"{INDEX}:{CONVERSATION_ID}:runs", memory.runs[0].to_json())
+        redis.StrictRedis.hset.assert_called_once_with(
+            INDEX, CONVERSATION_ID, json.dumps({"runs": [], "metadata": {"foo": "bar"}})
+        )
+
+    def test_append_run_migrates_legacy_runs(self, mocker, driver):
+        mocker.patch.object(redis.StrictRedis, "exists", return_value=0)
+        memory = BaseConversationMemory.from_json(TEST_MEMORY)
+        legacy_runs, _ = driver.load()
+
+        driver.append_run(memory.runs[0], [*legacy_runs, memory.runs[0]], {"foo": "bar"})
+
+        redis.StrictRedis.delete.assert_called_once_with(f"{INDEX}:{CONVERSATION_ID}:runs")
+        redis.StrictRedis.rpush.assert_called_once_with(
+            f"{INDEX}:{CONVERSATION_ID}:runs", legacy_runs[0].to_json(), memory.runs[0].to_json()
+        )
+        redis.StrictRedis.hset.assert_called_once_with(
+            INDEX, CONVERSATION_ID, json.dumps({"runs": [], "metadata": {"foo": "bar"}})
+        )
+
+    def test_load_runs(self, mocker, driver):
+        memory = BaseConversationMemory.from_json(TEST_MEMORY)
+        mocker.patch.object(redis.StrictRedis, "hget", return_value='{"runs": [], "metadata": {"foo": "bar"}}')
+        mocker.patch.object(redis.StrictRedis, "lrange", return_value=[memory.runs[0].to_json().encode()])
+
+        runs, metadata = driver.load(last_n=1)
+
+        redis.StrictRedis.lrange.assert_called_once_with(f"{INDEX}:{CONVERSATION_ID}:runs", -1, -1)
+        assert [run.id for run in runs] == [memory.runs[0].id]
+        assert metadata == {"foo": "bar"}
+
+    def test_load_last_n(self, driver):
+        assert len(driver.load(last_n=1)[0]) == 1
+        assert driver.load(last_n=0) == ([], {"foo": "bar"})
+
     def test_load(self, driver):
         runs, metadata = driver.load()
         assert len(runs) == 1
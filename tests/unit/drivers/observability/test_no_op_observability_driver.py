@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from griptape.common.observable import Observable
@@ -25,6 +27,15 @@ class TestNoOpObservabilityDriver:
             assert driver.observe(Observable.Call(func=func, instance=None, args=["Hi"])) == "Hi you"
             assert driver.observe(Observable.Call(func=instance.method, instance=instance, args=["Bye"])) == "Bye yous"
 
+    def test_aobserve(self, driver):
+        async def func(word: str):
+            await asyncio.sleep(0)
+
+            return word + " you"
+
+        with driver:
+            assert asyncio.run(driver.aobserve(Observable.Call(func=func, instance=None, args=["Hi"]))) == "Hi you"
+
     def test_get_span_id(self, driver):
         assert driver.get_span_id() is None
 
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
@@ -113,6 +114,50 @@ class TestOpenTelemetryObservabilityDriver:
         mock_span_exporter.export.assert_called_with(expected_spans)
         mock_span_exporter.export.reset_mock()
 
+    def test_context_manager_aobserve(self, driver, mock_span_exporter):
+        expected_spans = ExpectedSpans(
+            spans=[
+                ExpectedSpan(name="main", parent=None, status_code=StatusCode.OK),
+                ExpectedSpan(name="afunc()", parent="main", status_code=StatusCode.OK),
+                ExpectedSpan(name="func()", parent="afunc()", status_code=StatusCode.OK),
+            ]
+        )
+
+        def func(word: str):
+            return word + " you"
+
+        async def afunc(word: str):
+            await asyncio.sleep(0)
+
+            return driver.observe(Observable.Call(func=func, instance=None, args=[word]))
+
+        with driver:
+            assert asyncio.run(driver.aobserve(Observable.Call(func=afunc, instance=None, args=["Hi"]))) == "Hi you"
+
+        assert mock_span_exporter.export.call_count == 1
+        mock_span_exporter.export.assert_called_with(expected_spans)
+
+    def test_context_manager_aobserve_exception(self, driver, mock_span_exporter):
+        expected_spans = ExpectedSpans(
+            spans=[
+                ExpectedSpan(name="main", parent=None, status_code=StatusCode.ERROR, exception=Exception("Boom afunc")),
+                ExpectedSpan(
+                    name="afunc()", parent="main", status_code=StatusCode.ERROR, exception=Exception("Boom afunc")
+                ),
+            ]
+        )
+
+        async def afunc():
+            await asyncio.sleep(0)
+
+            raise Exception("Boom afunc")
+
+        with pytest.raises(Exception, match="Boom afunc"), driver:
+            asyncio.run(driver.aobserve(Observable.Call(func=afunc, instance=None)))
+
+        assert mock_span_exporter.export.call_count == 1
+        mock_span_exporter.export.assert_called_with(expected_spans)
+
     def test_context_manager_observe_exception_function(self, driver, mock_span_exporter):
         expected_spans = ExpectedSpans(
             spans=[
@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -7,6 +8,7 @@ from griptape.artifacts.error_artifact import ErrorArtifact
 from griptape.common import ActionCallDeltaMessageContent, PromptStack, TextDeltaMessageContent, ToolAction
 from griptape.drivers import AnthropicPromptDriver
 from tests.mocks.mock_tool.tool import MockTool
+from tests.utils.async_utils import to_async_iterator, to_list
 
 
 class TestAnthropicPromptDriver:
@@ -196,6 +198,24 @@ class TestAnthropicPromptDriver:
 
         return mock_stream_client
 
+    @pytest.fixture()
+    def mock_async_client(self, mocker, mock_client):
+        mock_async_client = mocker.patch("anthropic.AsyncAnthropic")
+        mock_async_client.return_value.messages.create = AsyncMock(
+            return_value=mock_client.return_value.messages.create.return_value
+        )
+
+        return mock_async_client
+
+    @pytest.fixture()
+    def mock_async_stream_client(self, mocker, mock_stream_client):
+        mock_async_stream_client = mocker.patch("anthropic.AsyncAnthropic")
+        mock_async_stream_client.return_value.messages.create = AsyncMock(
+            return_value=to_async_iterator(mock_stream_client.return_value.messages.create.return_value)
+        )
+
+        return mock_async_stream_client
+
     @pytest.fixture(params=[True, False])
     def prompt_stack(self, request):
         prompt_stack = PromptStack()
@@ -375,6 +395,29 @@ class TestAnthropicPromptDriver:
         assert message.usage.input_tokens == 5
         assert message.usage.output_tokens == 10
 
+    def test_atry_run(self, mock_async_client, prompt_stack):
+        driver = AnthropicPromptDriver(model="claude-3-haiku", api_key="api-key")
+
+        message = asyncio.run(driver.atry_run(prompt_stack))
+
+        mock_async_client.return_value.messages.create.assert_awaited_once()
+        assert message.value[0].value == "model-output"
+        assert message.value[1].value.input == {"foo": "bar"}
+        assert message.usage.input_tokens == 5
+        assert message.usage.output_tokens == 10
+
+    def test_atry_stream(self, mock_async_stream_client, prompt_stack):
+        driver = AnthropicPromptDriver(model="claude-3-haiku", api_key="api-key", stream=True)
+
+        events = asyncio.run(to_list(driver.atry_stream(prompt_stack)))
+
+        assert mock_async_stream_client.return_value.messages.create.await_args.kwargs["stream"] is True
+        assert events[0].usage.input_tokens == 5
+        assert events[2].content.text == "model-output"
+        assert events[3].content.tag == "mock-id"
+        assert events[4].content.partial_input == '{"foo": "bar"}'
+        assert events[5].usage.output_tokens == 10
+
     @pytest.mark.parametrize("use_native_tools", [True, False])
     def test_try_stream_run(self, mock_stream_client, prompt_stack, messages, use_native_tools):
         # Given
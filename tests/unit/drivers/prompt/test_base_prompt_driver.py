@@ -1,12 +1,25 @@
-from griptape.artifacts import ErrorArtifact, TextArtifact
-from griptape.common import Message, PromptStack
-from griptape.events import FinishPromptEvent, StartPromptEvent
+import asyncio
+import threading
+
+import pytest
+
+from griptape.artifacts import ErrorArtifact, JsonArtifact, ListArtifact, TextArtifact
+from griptape.common import (
+    ActionResultMessageContent,
+    Message,
+    PromptStack,
+    TextMessageContent,
+    ToolAction,
+)
+from griptape.drivers import LocalCacheDriver
+from griptape.events import ActionChunkEvent, FinishPromptEvent, StartPromptEvent, TextChunkEvent
 from griptape.events.event_bus import _EventBus
 from griptape.structures import Pipeline
 from griptape.tasks import PromptTask, ToolkitTask
 from tests.mocks.mock_failing_prompt_driver import MockFailingPromptDriver
 from tests.mocks.mock_prompt_driver import MockPromptDriver
 from tests.mocks.mock_tool.tool import MockTool
+from tests.utils.async_utils import to_list
 
 
 class TestBasePromptDriver:
@@ -65,3 +78,150 @@ class TestBasePromptDriver:
         output = pipeline.run().output_task.output
         assert isinstance(output, TextArtifact)
         assert output.value == "mock output"
+
+    def test_arun(self):
+        assert isinstance(asyncio.run(MockPromptDriver().arun(PromptStack(messages=[]))), Message)
+        assert asyncio.run(MockPromptDriver().arun(TextArtifact(""))).value == "mock output"
+
+    def test_arun_with_stream(self, mocker):
+        mock_publish_event = mocker.patch.object(_EventBus, "publish_event")
+
+        result = asyncio.run(MockPromptDriver(stream=True).arun(PromptStack(messages=[])))
+
+        events = [call_args[0][0] for call_args in mock_publish_event.call_args_list]
+        assert result.value == "mock output"
+        assert [event.token for event in events if isinstance(event, TextChunkEvent)] == ["mock output"]
+        assert len([event for event in events if isinstance(event, FinishPromptEvent)]) == 1
+
+    def test_arun_retries_success(self):
+        driver = MockFailingPromptDriver(max_failures=1, max_attempts=2, min_retry_delay=0, max_retry_delay=0)
+
+        assert asyncio.run(driver.arun(PromptStack(messages=[]))).value == "success"
+
+    def test_arun_retries_failure(self):
+        driver = MockFailingPromptDriver(max_failures=2, max_attempts=1)
+
+        with pytest.raises(Exception, match="failed attempt"):
+            asyncio.run(driver.arun(PromptStack(messages=[])))
+
+    def test_atry_run_runs_in_executor(self):
+        driver = MockPromptDriver(mock_output=lambda _: threading.current_thread().name)
+
+        result = asyncio.run(driver.atry_run(PromptStack(messages=[])))
+
+        assert result.value.startswith("griptape-io")
+
+    def test_atry_stream(self):
+        message_deltas = asyncio.run(to_list(MockPromptDriver().atry_stream(PromptStack(messages=[]))))
+
+        assert [message_delta.content.text for message_delta in message_deltas] == ["mock output"]
+
+    def test_run_with_cache_driver(self):
+        cache_driver = LocalCacheDriver()
+        outputs = iter(["first", "second"])
+        driver = MockPromptDriver(temperature=0, cache_driver=cache_driver, mock_output=lambda _: next(outputs))
+
+        assert driver.run(TextArtifact("foo")).value == "first"
+        assert driver.run(TextArtifact("foo")).value == "first"
+        assert driver.run(TextArtifact("bar")).value == "second"
+        assert cache_driver.hits == 1
+        assert cache_driver.misses == 2
+
+    def test_run_with_cache_driver_and_temperature(self):
+        cache_driver = LocalCacheDriver()
+        driver = MockPromptDriver(temperature=0.1, cache_driver=cache_driver)
+
+        driver.run(TextArtifact("foo"))
+        driver.run(TextArtifact("foo"))
+
+        assert cache_driver.hits == 0
+        assert cache_driver.misses == 0
+
+    def test_run_with_cache_driver_and_stream(self, mocker):
+        driver = MockPromptDriver(temperature=0, cache_driver=LocalCacheDriver(), stream=True)
+        driver.run(TextArtifact("foo"))
+        mock_publish_event = mocker.patch.object(_EventBus, "publish_event")
+        mocker.patch.object(driver, "try_stream", side_effect=Exception("not cached"))
+
+        result = driver.run(TextArtifact("foo"))
+
+        events = [call_args[0][0] for call_args in mock_publish_event.call_args_list]
+        assert result.value == "mock output"
+        assert [event.token for event in events if isinstance(event, TextChunkEvent)] == ["mock output"]
+        assert len([event for event in events if isinstance(event, FinishPromptEvent)]) == 1
+
+    def test_run_with_cache_driver_and_tools_and_stream(self, mocker):
+        driver = MockPromptDriver(temperature=0, cache_driver=LocalCacheDriver(), stream=True, use_native_tools=True)
+        driver.run(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)], tools=[MockTool()]))
+        mock_publish_event = mocker.patch.object(_EventBus, "publish_event")
+
+        result = driver.run(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)], tools=[MockTool()]))
+
+        events = [call_args[0][0] for call_args in mock_publish_event.call_args_list]
+        action_chunk_events = [event for event in events if isinstance(event, ActionChunkEvent)]
+        assert result.to_artifact().value.name == "MockTool"
+        assert len(action_chunk_events) == 1
+        assert action_chunk_events[0].partial_input == '{"values": {"test": "test-value"}}'
+
+    def test_arun_with_cache_driver(self):
+        cache_driver = LocalCacheDriver()
+        driver = MockPromptDriver(temperature=0, cache_driver=cache_driver)
+
+        asyncio.run(driver.arun(TextArtifact("foo")))
+        result = asyncio.run(driver.arun(TextArtifact("foo")))
+
+        assert result.value == "mock output"
+        assert cache_driver.hits == 1
+
+    def test_get_cache_key(self):
+        driver = MockPromptDriver(temperature=0, cache_driver=LocalCacheDriver())
+        key = driver._get_cache_key(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)]))
+
+        assert key is not None
+        assert key.startswith("MockPromptDriver:test-model:")
+        assert key == driver._get_cache_key(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)]))
+        assert key != driver._get_cache_key(PromptStack(messages=[Message("foo", role=Message.SYSTEM_ROLE)]))
+        assert key != driver._get_cache_key(
+            PromptStack(messages=[Message("foo", role=Message.USER_ROLE)], tools=[MockTool()])
+        )
+        assert key != MockPromptDriver(
+            temperature=0, cache_driver=LocalCacheDriver(), extra_params={"foo": "bar"}
+        )._get_cache_key(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)]))
+        assert key == MockPromptDriver(temperature=0, cache_driver=LocalCacheDriver(), stream=True)._get_cache_key(
+            PromptStack(messages=[Message("foo", role=Message.USER_ROLE)])
+        )
+        assert MockPromptDriver(temperature=0)._get_cache_key(PromptStack(messages=[])) is None
+
+    def test_get_cache_key_keeps_nested_ids(self):
+        driver = MockPromptDriver(temperature=0, cache_driver=LocalCacheDriver())
+        action = ToolAction(tag="foo", name="MockTool", path="test", input={"values": {"id": 1}})
+
+        def tool_result_key(result_id: int):
+            return driver._get_cache_key(
+                PromptStack(
+                    messages=[
+                        Message(
+                            [
+                                ActionResultMessageContent(
+                                    ListArtifact([JsonArtifact({"id": result_id})]), action=action
+                                )
+                            ],
+                            role=Message.USER_ROLE,
+                        )
+                    ]
+                )
+            )
+
+        def meta_key(meta_id: str):
+            return driver._get_cache_key(
+                PromptStack(
+                    messages=[
+                        Message([TextMessageContent(TextArtifact("foo", meta={"id": meta_id}))], role=Message.USER_ROLE)
+                    ]
+                )
+            )
+
+        assert tool_result_key(1) == tool_result_key(1)
+        assert tool_result_key(1) != tool_result_key(2)
+        assert meta_key("foo") == meta_key("foo")
+        assert meta_key("foo") != meta_key("bar")
@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -8,6 +9,7 @@ from griptape.artifacts.text_artifact import TextArtifact
 from griptape.common import ActionCallDeltaMessageContent, PromptStack, TextDeltaMessageContent, ToolAction
 from griptape.drivers import CoherePromptDriver
 from tests.mocks.mock_tool.tool import MockTool
+from tests.utils.async_utils import to_async_iterator, to_list
 
 
 class TestCoherePromptDriver:
@@ -76,6 +78,22 @@ class TestCoherePromptDriver:
 
         return mock_client
 
+    @pytest.fixture()
+    def mock_async_client(self, mocker, mock_client):
+        mock_async_client = mocker.patch("cohere.AsyncClient").return_value
+        mock_async_client.chat = AsyncMock(return_value=mock_client.chat.return_value)
+
+        return mock_async_client
+
+    @pytest.fixture()
+    def mock_async_stream_client(self, mocker, mock_stream_client):
+        mock_async_client = mocker.patch("cohere.AsyncClient").return_value
+        mock_async_client.chat_stream = Mock(
+            return_value=to_async_iterator(mock_stream_client.chat_stream.return_value)
+        )
+
+        return mock_async_client
+
     @pytest.fixture(autouse=True)
     def mock_tokenizer(self, mocker):
         return mocker.patch("griptape.tokenizers.CohereTokenizer").return_value
@@ -187,6 +205,29 @@ class TestCoherePromptDriver:
         assert message.usage.input_tokens == 5
         assert message.usage.output_tokens == 10
 
+    def test_atry_run(self, mock_async_client, prompt_stack):
+        driver = CoherePromptDriver(model="command", api_key="api-key")
+
+        message = asyncio.run(driver.atry_run(prompt_stack))
+
+        mock_async_client.chat.assert_awaited_once()
+        assert message.value[0].value == "model-output"
+        assert message.value[1].value.input == {"foo": "bar"}
+        assert message.usage.input_tokens == 5
+        assert message.usage.output_tokens == 10
+
+    def test_atry_stream(self, mock_async_stream_client, prompt_stack):
+        driver = CoherePromptDriver(model="command", api_key="api-key", stream=True)
+
+        events = asyncio.run(to_list(driver.atry_stream(prompt_stack)))
+
+        mock_async_stream_client.chat_stream.assert_called_once()
+        assert events[0].content.text == "model-output"
+        assert events[1].content.name == "MockTool"
+        assert events[2].content.partial_input == '{"foo": "bar"}'
+        assert events[3].usage.input_tokens == 5
+        assert events[3].usage.output_tokens == 10
+
     @pytest.mark.parametrize("use_native_tools", [True, False])
     def test_try_stream_run(self, mock_stream_client, prompt_stack, use_native_tools):
         # Given
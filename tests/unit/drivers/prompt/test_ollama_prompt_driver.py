@@ -1,9 +1,13 @@
+import asyncio
+from unittest.mock import AsyncMock
+
 import pytest
 
 from griptape.artifacts import ActionArtifact, ImageArtifact, ListArtifact, TextArtifact
 from griptape.common import PromptStack, TextDeltaMessageContent, ToolAction
 from griptape.drivers import OllamaPromptDriver
 from tests.mocks.mock_tool.tool import MockTool
+from tests.utils.async_utils import to_async_iterator, to_list
 
 
 class TestOllamaPromptDriver:
@@ -135,6 +139,22 @@ class TestOllamaPromptDriver:
 
         return mock_stream_client
 
+    @pytest.fixture()
+    def mock_async_client(self, mocker, mock_client):
+        mock_async_client = mocker.patch("ollama.AsyncClient")
+        mock_async_client.return_value.chat = AsyncMock(return_value=mock_client.return_value.chat.return_value)
+
+        return mock_async_client
+
+    @pytest.fixture()
+    def mock_async_stream_client(self, mocker, mock_stream_client):
+        mock_async_stream_client = mocker.patch("ollama.AsyncClient")
+        mock_async_stream_client.return_value.chat = AsyncMock(
+            return_value=to_async_iterator(mock_stream_client.return_value.chat.return_value)
+        )
+
+        return mock_async_stream_client
+
     @pytest.fixture()
     def prompt_stack(self):
         prompt_stack = PromptStack()
@@ -272,3 +292,27 @@ class TestOllamaPromptDriver:
         # When/Then
         with pytest.raises(Exception, match="invalid model response"):
             next(driver.try_stream(prompt_stack))
+
+    def test_atry_run(self, mock_async_client, prompt_stack):
+        driver = OllamaPromptDriver(model="llama")
+
+        message = asyncio.run(driver.atry_run(prompt_stack))
+
+        mock_async_client.return_value.chat.assert_awaited_once()
+        assert message.value[0].value == "model-output"
+        assert message.value[1].value.input == {"foo": "bar"}
+
+    def test_atry_stream(self, mock_async_stream_client):
+        driver = OllamaPromptDriver(model="llama", stream=True)
+
+        events = asyncio.run(to_list(driver.atry_stream(PromptStack())))
+
+        assert mock_async_stream_client.return_value.chat.await_args.kwargs["stream"] is True
+        assert [event.content.text for event in events] == ["model-output"]
+
+    def test_atry_stream_bad_response(self, mock_async_stream_client):
+        driver = OllamaPromptDriver(model="llama", stream=True)
+        mock_async_stream_client.return_value.chat.return_value = "bad-response"
+
+        with pytest.raises(Exception, match="invalid model response"):
+            asyncio.run(to_list(driver.atry_stream(PromptStack())))
@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 import schema
@@ -9,6 +10,7 @@ from griptape.drivers import OpenAiChatPromptDriver
 from griptape.tokenizers import OpenAiTokenizer
 from tests.mocks.mock_tokenizer import MockTokenizer
 from tests.mocks.mock_tool.tool import MockTool
+from tests.utils.async_utils import to_async_iterator, to_list
 
 
 class TestOpenAiChatPromptDriverFixtureMixin:
@@ -236,6 +238,20 @@ class TestOpenAiChatPromptDriverFixtureMixin:
         )
         return mock_chat_create
 
+    @pytest.fixture()
+    def mock_async_chat_completion_create(self, mocker, mock_chat_completion_create):
+        mock_chat_create = AsyncMock(return_value=mock_chat_completion_create.return_value)
+        mocker.patch("openai.AsyncOpenAI").return_value.chat.completions.create = mock_chat_create
+
+        return mock_chat_create
+
+    @pytest.fixture()
+    def mock_async_chat_completion_stream_create(self, mocker, mock_chat_completion_stream_create):
+        mock_chat_create = AsyncMock(return_value=to_async_iterator(mock_chat_completion_stream_create.return_value))
+        mocker.patch("openai.AsyncOpenAI").return_value.chat.completions.create = mock_chat_create
+
+        return mock_chat_create
+
     @pytest.fixture()
     def prompt_stack(self):
         prompt_stack = PromptStack()
@@ -497,6 +513,31 @@ class TestOpenAiChatPromptDriver(TestOpenAiChatPromptDriverFixtureMixin):
         assert isinstance(event.content, TextDeltaMessageContent)
         assert event.content.text == ""
 
+    def test_atry_run(self, mock_async_chat_completion_create, prompt_stack, messages):
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, use_native_tools=False)
+
+        message = asyncio.run(driver.atry_run(prompt_stack))
+
+        mock_async_chat_completion_create.assert_awaited_once_with(
+            model=driver.model, temperature=driver.temperature, user=driver.user, messages=messages, seed=driver.seed
+        )
+        assert message.value[0].value == "model-output"
+        assert message.value[1].value.input == {"foo": "bar"}
+        assert message.usage.input_tokens == 5
+        assert message.usage.output_tokens == 10
+
+    def test_atry_stream(self, mock_async_chat_completion_stream_create, prompt_stack):
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, stream=True)
+
+        events = asyncio.run(to_list(driver.atry_stream(prompt_stack)))
+
+        assert mock_async_chat_completion_stream_create.await_args.kwargs["stream"] is True
+        assert events[0].content.text == "model-output"
+        assert events[1].content.tag == "mock-id"
+        assert events[2].content.partial_input == '{"foo": "bar"}'
+        assert events[3].usage.input_tokens == 5
+        assert events[3].usage.output_tokens == 10
+
     def test_try_run_with_max_tokens(self, mock_chat_completion_create, prompt_stack, messages):
         # Given
         driver = OpenAiChatPromptDriver(
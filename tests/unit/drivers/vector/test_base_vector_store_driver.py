@@ -73,3 +73,73 @@ class TestBaseVectorStoreDriver(ABC):
     def test_does_entry_exist_exception(self, driver):
         with patch.object(driver, "load_entry", side_effect=Exception):
             assert driver.does_entry_exist("does_not_exist") is False
+
+    def test_upsert_text_artifacts_batch_embeds(self, driver):
+        with patch.object(driver.embedding_driver, "embed_strings", wraps=driver.embedding_driver.embed_strings) as m:
+            result = driver.upsert_text_artifacts(
+                {"foo": [TextArtifact("foo"), TextArtifact("bar")], "bar": [TextArtifact("baz")], "baz": []}
+            )
+
+        m.assert_called_once_with(["foo", "bar", "baz"])
+        assert list(result.keys()) == ["foo", "bar"]
+        assert len(result["foo"]) == 2
+        assert len(result["bar"]) == 1
+
+    def test_upsert_text_artifacts_lazily(self, driver):
+        driver.upsert_chunk_size = 2
+        artifacts = iter([TextArtifact("foo"), TextArtifact("bar"), TextArtifact("baz")])
+
+        with patch.object(driver.embedding_driver, "embed_strings", wraps=driver.embedding_driver.embed_strings) as m:
+            result = driver.upsert_text_artifacts({"foo": artifacts, "bar": []})
+
+        assert [call.args[0] for call in m.call_args_list] == [["foo", "bar"], ["baz"]]
+        assert list(result.keys()) == ["foo"]
+        assert len(result["foo"]) == 3
+        assert len(driver.upsert_text_artifacts(a for a in [TextArtifact("qux")])) == 1
+
+    def test_query_vector(self, driver):
+        driver.upsert_text_artifact(TextArtifact("foobar"))
+
+        entries = driver.query_vector(driver.embedding_driver.embed_string("foobar"), count=1)
+
+        assert driver.supports_query_vector
+        assert [entry.id for entry in entries] == [entry.id for entry in driver.query("foobar", count=1)]
+
+    def test_upsert_vectors(self, driver):
+        entries = [
+            BaseVectorStoreDriver.Entry(id="foo", vector=[1.0, 0.0]),
+            BaseVectorStoreDriver.Entry(id="bar", vector=[0.0, 1.0], namespace="bar", meta={"bar": "baz"}),
+            BaseVectorStoreDriver.Entry(id=None, vector=[1.0, 1.0]),  # pyright: ignore[reportArgumentType]
+        ]
+
+        with patch.object(driver, "_upsert_vectors_chunk", wraps=driver._upsert_vectors_chunk) as mock_chunk:
+            vector_ids = driver.upsert_vectors(entries, chunk_size=2)
+
+        assert mock_chunk.call_count == 2
+        assert vector_ids[:2] == ["foo", "bar"]
+        assert isinstance(vector_ids[2], str)
+        assert driver.load_entry("foo").vector == [1.0, 0.0]
+        assert driver.load_entry("bar", namespace="bar").meta == {"bar": "baz"}
+        assert driver.load_entry(vector_ids[2]).vector == [1.0, 1.0]
+
+    def test_upsert_vectors_invalid(self, driver):
+        with pytest.raises(ValueError, match="chunk_size"):
+            driver.upsert_vectors([BaseVectorStoreDriver.Entry(id="foo", vector=[1.0])], chunk_size=0)
+
+        with pytest.raises(ValueError, match="vector"):
+            driver.upsert_vectors([BaseVectorStoreDriver.Entry(id="foo")])
+
+    def test_delete_namespace(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", namespace="foo")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar", namespace="bar")
+        driver.upsert_vector([1.0, 1.0], vector_id="baz", namespace="foo")
+
+        driver.delete_namespace("foo")
+        driver.delete_namespace("missing")
+
+        assert driver.load_entries(namespace="foo") == []
+        assert [entry.id for entry in driver.query_vector([1.0, 0.0])] == ["bar"]
+
+        driver.upsert_vector([1.0, 0.0], vector_id="qux", namespace="foo")
+
+        assert [entry.id for entry in driver.query_vector([1.0, 0.0])] == ["qux", "bar"]
@@ -28,3 +28,9 @@ class TestDummyVectorStoreDriver:
     def test_query(self, vector_store_driver):
         with pytest.raises(DummyError):
             vector_store_driver.query("foo bar huzzah")
+
+    def test_query_vector(self, vector_store_driver):
+        assert not vector_store_driver.supports_query_vector
+
+        with pytest.raises(NotImplementedError):
+            vector_store_driver.query_vector([0.0])
@@ -0,0 +1,121 @@
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+from griptape.drivers import LocalVectorStoreDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+from tests.unit.drivers.vector.test_base_vector_store_driver import TestBaseVectorStoreDriver
+
+
+class TestHnswLocalVectorStoreDriver(TestBaseVectorStoreDriver):
+    @pytest.fixture()
+    def driver(self):
+        return LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), index_type="hnsw")
+
+    @pytest.fixture()
+    def persist_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield os.path.join(temp_dir, "store.log")
+
+    @pytest.fixture()
+    def vectors(self):
+        rng = np.random.default_rng(42)
+        centers = rng.normal(size=(10, 16))
+
+        return (centers[rng.integers(0, 10, size=500)] + rng.normal(scale=0.3, size=(500, 16))).tolist()
+
+    def test_query_recall(self, driver, vectors):
+        exact_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+        entries = [LocalVectorStoreDriver.Entry(id=f"id-{i}", vector=vector) for i, vector in enumerate(vectors)]
+        driver.upsert_vectors(entries)
+        exact_driver.upsert_vectors(entries)
+        hits = 0
+
+        for query_vector in vectors[:20]:
+            driver.embedding_driver = MockEmbeddingDriver(mock_output=lambda _, v=query_vector: v)
+            exact_driver.embedding_driver = driver.embedding_driver
+            results = driver.query("foo", count=10)
+            expected = exact_driver.query("foo", count=10)
+
+            hits += len({r.id for r in results} & {e.id for e in expected})
+            assert [r.score for r in results] == sorted((r.score for r in results), reverse=True)
+
+        assert hits / 200 >= 0.95
+
+    def test_query_namespace(self, driver, vectors):
+        for i, vector in enumerate(vectors[:100]):
+            driver.upsert_vector(vector, vector_id=f"id-{i}", namespace="foo" if i % 2 else "bar")
+        driver.embedding_driver = MockEmbeddingDriver(mock_output=lambda _: vectors[1])
+
+        results = driver.query("foo", count=5, namespace="bar")
+
+        assert len(results) == 5
+        assert all(r.namespace == "bar" for r in results)
+        assert driver.query("foo", count=1, namespace="foo")[0].id == "id-1"
+        assert driver.query("foo", count=3, namespace="baz") == []
+
+    def test_query_overwritten_vector(self, driver, vectors):
+        for i, vector in enumerate(vectors[:100]):
+            driver.upsert_vector(vector, vector_id=f"id-{i}")
+        driver.upsert_vector(vectors[50], vector_id="id-0")
+        driver.embedding_driver = MockEmbeddingDriver(mock_output=lambda _: vectors[50])
+
+        assert {r.id for r in driver.query("foo", count=2)} == {"id-0", "id-50"}
+
+    def test_save_index(self, persist_file, vectors):
+        driver = self._create_driver(persist_file)
+        driver.upsert_vectors([LocalVectorStoreDriver.Entry(id=f"id-{i}", vector=v) for i, v in enumerate(vectors)])
+        driver.save_index()
+        driver.upsert_vector(vectors[0], vector_id="new")
+
+        new_driver = self._create_driver(persist_file)
+        new_driver.embedding_driver = MockEmbeddingDriver(mock_output=lambda _: vectors[0])
+
+        assert {r.id for r in new_driver.query("foo", count=2)} == {"id-0", "new"}
+        assert new_driver._indexes[None].links == driver._indexes[None].links
+
+    def test_save_index_with_different_parameters(self, persist_file, vectors):
+        driver = self._create_driver(persist_file)
+        driver.upsert_vectors([LocalVectorStoreDriver.Entry(id=f"id-{i}", vector=v) for i, v in enumerate(vectors)])
+        driver.save_index()
+
+        new_driver = self._create_driver(persist_file, hnsw_m=8)
+        new_driver.embedding_driver = MockEmbeddingDriver(mock_output=lambda _: vectors[0])
+
+        assert new_driver.query("foo", count=1)[0].id == "id-0"
+        assert all(len(links) <= 16 for links in new_driver._indexes[None].links[0].values())
+
+    def test_compaction_saves_index(self, persist_file, vectors):
+        driver = self._create_driver(persist_file)
+
+        driver.upsert_vectors([LocalVectorStoreDriver.Entry(id=f"id-{i}", vector=v) for i, v in enumerate(vectors)])
+        driver.compact_log()
+
+        assert os.path.isfile(str(driver.index_file))
+
+    def test_json_upsert_does_not_save_index(self, persist_file, vectors):
+        driver = self._create_driver(persist_file, persist_format="json")
+
+        for i, vector in enumerate(vectors[:10]):
+            driver.upsert_vector(vector, vector_id=f"id-{i}")
+
+        assert not os.path.isfile(str(driver.index_file))
+
+        driver.save_index()
+
+        assert os.path.isfile(str(driver.index_file))
+
+    def test_save_index_without_hnsw(self):
+        with pytest.raises(ValueError):
+            LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver()).save_index()
+
+    def _create_driver(self, persist_file, *, persist_format="log", **kwargs):
+        return LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_file=persist_file,
+            index_type="hnsw",
+            persist_format=persist_format,
+            **kwargs,
+        )
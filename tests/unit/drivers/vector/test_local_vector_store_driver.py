@@ -1,7 +1,9 @@
+import numpy as np
 import pytest
 
 from griptape.artifacts import TextArtifact
-from griptape.drivers import LocalVectorStoreDriver
+from griptape.drivers import BaseVectorStoreDriver, LocalVectorStoreDriver
+from griptape.drivers.vector.local_vector_store_driver import cosine_relatedness
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 from tests.unit.drivers.vector.test_base_vector_store_driver import TestBaseVectorStoreDriver
 
@@ -35,3 +37,96 @@ class TestLocalVectorStoreDriver(TestBaseVectorStoreDriver):
         assert len(driver.query("foo", namespace="test1")) == 1000
         assert len(driver.query("foo", namespace="test2")) == 1000
         assert len(driver.query("foo", namespace="test3")) == 1000
+
+    def test_query_matches_brute_force(self, driver):
+        rng = np.random.default_rng(42)
+        vectors = rng.normal(size=(200, 8)).tolist()
+        query_vector = rng.normal(size=8).tolist()
+        driver.embedding_driver = MockEmbeddingDriver(mock_output=lambda _: query_vector)
+
+        for i, vector in enumerate(vectors):
+            driver.upsert_vector(vector, vector_id=f"id-{i}", namespace="foo" if i % 2 else "bar")
+
+        expected = sorted(
+            ((f"id-{i}", cosine_relatedness(query_vector, vector)) for i, vector in enumerate(vectors)),
+            key=lambda pair: pair[1],
+            reverse=True,
+        )
+
+        results = driver.query("foo", count=10)
+
+        assert [r.id for r in results] == [e[0] for e in expected[:10]]
+        assert [r.score for r in results] == pytest.approx([e[1] for e in expected[:10]], rel=1e-5)
+        assert [r.id for r in driver.query("foo")] == [e[0] for e in expected]
+        assert all(r.namespace == "foo" for r in driver.query("foo", namespace="foo"))
+        assert len(driver.query("foo", namespace="foo")) == 100
+
+    def test_query_vectors(self, driver, mocker):
+        rng = np.random.default_rng(42)
+        query_vectors = rng.normal(size=(5, 8)).tolist()
+
+        for i, vector in enumerate(rng.normal(size=(50, 8)).tolist()):
+            driver.upsert_vector(vector, vector_id=f"id-{i}", namespace="foo" if i % 2 else "bar")
+
+        query_vector = mocker.spy(driver, "query_vector")
+        results = driver.query_vectors(query_vectors, count=5, namespace="foo", include_vectors=True)
+
+        query_vector.assert_not_called()
+        assert len(results) == 5
+
+        for vector, result in zip(query_vectors, results):
+            expected = driver.query_vector(vector, count=5, namespace="foo", include_vectors=True)
+
+            assert [r.id for r in result] == [e.id for e in expected]
+            assert [r.score for r in result] == pytest.approx([e.score for e in expected])
+            assert [r.vector for r in result] == [e.vector for e in expected]
+
+        assert driver.query_vectors([]) == []
+        assert driver.query_vectors(query_vectors[:2], namespace="empty") == [[], []]
+
+    def test_query_vectors_with_custom_relatedness(self, driver):
+        driver.calculate_relatedness = lambda x, y: -y[0]
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.upsert_vector([2.0, 0.0], vector_id="bar")
+
+        results = driver.query_vectors([[1.0, 0.0], [0.0, 1.0]])
+
+        assert [[r.id for r in result] for result in results] == [["foo", "bar"], ["foo", "bar"]]
+
+    def test_query_ties_keep_insertion_order(self, driver):
+        for i in range(10):
+            driver.upsert_vector([1.0, 1.0], vector_id=f"id-{i}")
+
+        assert [r.id for r in driver.query("foo", count=3)] == ["id-0", "id-1", "id-2"]
+
+    def test_query_after_overwrite(self, driver):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+        driver.upsert_vector([1.0, 0.0], vector_id="bar")
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+
+        results = driver.query("foo", include_vectors=True)
+
+        assert [r.id for r in results] == ["foo", "bar"]
+        assert results[0].vector == [1.0, 0.0]
+        assert results[0].score == pytest.approx(0.0)
+
+    def test_query_with_replaced_entries(self, driver):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+        driver.entries = {"bar": BaseVectorStoreDriver.Entry(id="bar", vector=[0.0, 1.0])}
+
+        assert [r.id for r in driver.query("foo")] == ["bar"]
+
+    def test_query_with_custom_relatedness(self, driver):
+        driver.calculate_relatedness = lambda x, y: -y[0]
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.upsert_vector([2.0, 0.0], vector_id="bar")
+
+        assert [r.id for r in driver.query("foo")] == ["foo", "bar"]
+
+    def test_upsert_vector_dimensions_mismatch(self, driver):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+
+        with pytest.raises(ValueError, match="dimensions"):
+            driver.upsert_vector([0.0, 1.0, 2.0], vector_id="bar")
+
+        driver.upsert_vector([0.0, 1.0, 2.0], vector_id="bar", namespace="baz")
@@ -0,0 +1,160 @@
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+from griptape.artifacts import TextArtifact
+from griptape.drivers import LocalVectorStoreDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+from tests.unit.drivers.vector.test_base_vector_store_driver import TestBaseVectorStoreDriver
+
+
+class TestLogPersistentLocalVectorStoreDriver(TestBaseVectorStoreDriver):
+    @pytest.fixture()
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield temp_dir
+
+    @pytest.fixture()
+    def persist_file(self, temp_dir):
+        return os.path.join(temp_dir, "store.log")
+
+    @pytest.fixture()
+    def driver(self, persist_file):
+        return self._create_driver(persist_file)
+
+    def test_persistence(self, driver, persist_file):
+        driver.upsert_text_artifact(TextArtifact("persistent foobar"), namespace="foo")
+        driver.upsert_vector([0.1, 0.2], vector_id="bar", meta={"baz": 1})
+
+        new_driver = self._create_driver(persist_file)
+
+        assert new_driver.query("persistent foobar", namespace="foo")[0].to_artifact().value == "persistent foobar"
+        assert new_driver.load_entry("bar").vector == [0.1, 0.2]
+        assert new_driver.load_entry("bar").meta == {"baz": 1}
+
+    def test_load_maps_vectors(self, driver, persist_file):
+        driver.upsert_vector([0.1, 0.2], vector_id="foo", namespace="foo")
+        driver.upsert_vector([0.3, 0.4], vector_id="bar", namespace="foo")
+
+        new_driver = self._create_driver(persist_file)
+
+        assert all(isinstance(entry.vector, np.ndarray) for entry in new_driver.entries.values())
+        assert new_driver.load_entry("foo", namespace="foo").vector == [0.1, 0.2]
+        assert [entry.vector for entry in new_driver.load_entries(namespace="foo")] == [[0.1, 0.2], [0.3, 0.4]]
+        assert new_driver.query_vector([0.3, 0.4], count=1, include_vectors=True)[0].vector == [0.3, 0.4]
+        assert new_driver.query_vector([0.3, 0.4], count=1)[0].vector == []
+
+    def test_delete_namespace_persists(self, driver, persist_file):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo", namespace="foo")
+        driver.upsert_vector([1.0, 0.0], vector_id="bar", namespace="bar")
+
+        driver.delete_namespace("foo")
+
+        assert [entry.id for entry in self._create_driver(persist_file).load_entries()] == ["bar"]
+
+    def test_upsert_appends(self, driver, persist_file):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+        log_size = os.path.getsize(persist_file)
+        vectors_size = os.path.getsize(driver._vectors_file)
+
+        driver.upsert_vector([1.0, 0.0], vector_id="bar")
+
+        with open(persist_file) as file:
+            assert len(file.readlines()) == 3
+        assert os.path.getsize(persist_file) > log_size
+        assert os.path.getsize(driver._vectors_file) == vectors_size + 16
+
+    def test_upsert_vectors_persists_partial_chunk(self, driver, persist_file):
+        entries = [
+            LocalVectorStoreDriver.Entry(id="foo", vector=[0.0, 1.0]),
+            LocalVectorStoreDriver.Entry(id="bar", vector=[0.0, 1.0, 2.0]),
+        ]
+
+        with pytest.raises(ValueError, match="dimensions"):
+            driver.upsert_vectors(entries)
+
+        new_driver = self._create_driver(persist_file)
+
+        assert [entry.id for entry in new_driver.load_entries()] == ["foo"]
+
+    def test_overwrite_replays_latest(self, driver, persist_file):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+
+        new_driver = self._create_driver(persist_file)
+
+        assert len(new_driver.entries) == 1
+        assert new_driver.load_entry("foo").vector == [1.0, 0.0]
+
+    def test_recovers_from_torn_write(self, driver, persist_file):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+        log_size = os.path.getsize(persist_file)
+        vectors_size = os.path.getsize(driver._vectors_file)
+
+        with open(driver._vectors_file, "ab") as file:
+            file.write(b"\x00" * 12)
+        with open(persist_file, "a") as file:
+            file.write('{"key": "bar", "id": "ba')
+
+        new_driver = self._create_driver(persist_file)
+
+        assert list(new_driver.entries.keys()) == ["foo"]
+        assert os.path.getsize(persist_file) == log_size
+        assert os.path.getsize(new_driver._vectors_file) == vectors_size
+
+        new_driver.upsert_vector([1.0, 0.0], vector_id="bar")
+
+        assert self._create_driver(persist_file).load_entry("bar").vector == [1.0, 0.0]
+
+    def test_compaction(self, persist_file):
+        driver = self._create_driver(persist_file, log_compaction_threshold=3)
+        old_vectors_file = driver._vectors_file
+
+        for i in range(4):
+            driver.upsert_vector([float(i), 1.0], vector_id="foo")
+        driver.upsert_vector([1.0, 0.0], vector_id="bar")
+
+        assert driver._vectors_file != old_vectors_file
+        assert not os.path.exists(old_vectors_file)
+
+        driver.upsert_vector([2.0, 0.0], vector_id="bar")
+
+        with open(persist_file) as file:
+            assert len(file.readlines()) == 4
+
+        new_driver = self._create_driver(persist_file)
+
+        assert new_driver.load_entry("foo").vector == [3.0, 1.0]
+        assert new_driver.load_entry("bar").vector == [2.0, 0.0]
+
+    def test_compact_log(self, driver, persist_file):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+
+        driver.compact_log()
+
+        with open(persist_file) as file:
+            assert len(file.readlines()) == 2
+        assert self._create_driver(persist_file).load_entry("foo").vector == [1.0, 0.0]
+
+    def test_compact_log_without_log(self):
+        with pytest.raises(ValueError):
+            LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver()).compact_log()
+
+    def test_removes_orphaned_vectors_files(self, driver, persist_file, temp_dir):
+        orphan = os.path.join(temp_dir, "store.log.7.vectors")
+
+        with open(orphan, "wb") as file:
+            file.write(b"\x00" * 8)
+
+        self._create_driver(persist_file)
+
+        assert not os.path.exists(orphan)
+        assert os.path.exists(driver._vectors_file)
+
+    def _create_driver(self, persist_file, **kwargs):
+        return LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="log", **kwargs
+        )
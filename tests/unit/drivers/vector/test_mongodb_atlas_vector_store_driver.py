@@ -1,4 +1,5 @@
 import mongomock
+import pymongo
 import pytest
 
 from griptape.artifacts import TextArtifact
@@ -26,6 +27,22 @@ class TestMongoDbAtlasVectorStoreDriver:
         test_id = driver.upsert_vector(vector, vector_id=vector_id_str)
         assert test_id == vector_id_str
 
+    def test_upsert_vectors(self, driver, mocker):
+        mock_collection = mocker.patch.object(driver, "get_collection").return_value
+
+        vector_ids = driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2], namespace="bar"),
+                BaseVectorStoreDriver.Entry(id=None, vector=[0.2, 0.3]),  # pyright: ignore[reportArgumentType]
+            ]
+        )
+
+        operations = mock_collection.bulk_write.call_args.args[0]
+        assert vector_ids[0] == "foo"
+        assert isinstance(operations[0], pymongo.ReplaceOne)
+        assert isinstance(operations[1], pymongo.InsertOne)
+        assert vector_ids[1] == str(operations[1]._doc["_id"])
+
     def test_upsert_text_artifact(self, driver):
         artifact = TextArtifact("foo")
         test_id = driver.upsert_text_artifact(artifact)
@@ -1,9 +1,10 @@
-from unittest.mock import Mock, create_autospec, patch
+from unittest.mock import MagicMock, Mock, create_autospec, patch
 
 import numpy as np
 import pytest
 
-from griptape.drivers import OpenSearchVectorStoreDriver
+from griptape.drivers import BaseVectorStoreDriver, OpenSearchVectorStoreDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
 class TestOpenSearchVectorStoreDriver:
@@ -16,6 +17,44 @@ class TestOpenSearchVectorStoreDriver:
     def test_upsert_vector(self, driver):
         assert driver.upsert_vector([0.1, 0.2, 0.3], vector_id="foo", namespace="company") == "foo"
 
+    def test_upsert_vectors(self):
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="foo", embedding_driver=MockEmbeddingDriver(), client=MagicMock()
+        )
+        driver.client.bulk.return_value = {
+            "errors": False,
+            "items": [{"index": {"_id": "foo"}}, {"index": {"_id": "bar"}}],
+        }
+
+        vector_ids = driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2], namespace="company"),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[0.3, 0.4], meta={"foo": "bar"}),
+            ]
+        )
+
+        assert vector_ids == ["foo", "bar"]
+        driver.client.bulk.assert_called_once_with(
+            body=[
+                {"index": {"_index": "foo", "_id": "foo"}},
+                {"vector": [0.1, 0.2], "namespace": "company", "metadata": None},
+                {"index": {"_index": "foo", "_id": "bar"}},
+                {"vector": [0.3, 0.4], "namespace": None, "metadata": {"foo": "bar"}},
+            ]
+        )
+
+    def test_upsert_vectors_errors(self):
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="foo", embedding_driver=MockEmbeddingDriver(), client=MagicMock()
+        )
+        driver.client.bulk.return_value = {
+            "errors": True,
+            "items": [{"index": {"_id": "foo", "error": {"type": "mapper_parsing_exception"}}}],
+        }
+
+        with pytest.raises(RuntimeError, match="1 of 1"):
+            driver.upsert_vectors([BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2])])
+
     def test_load_entry(self, driver):
         mock_entry = Mock()
         mock_entry.id = "foo2"
@@ -29,3 +29,15 @@ class TestPersistentLocalVectorStoreDriver(TestBaseVectorStoreDriver):
         new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
 
         assert new_driver.query("persistent foobar")[0].to_artifact().value == "persistent foobar"
+
+    def test_delete_namespace_persists(self, driver, temp_dir):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo", namespace="foo")
+        driver.upsert_vector([1.0, 0.0], vector_id="bar", namespace="bar")
+
+        driver.delete_namespace("foo")
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=os.path.join(temp_dir, "store.json")
+        )
+
+        assert [entry.id for entry in new_driver.load_entries()] == ["bar"]
@@ -4,8 +4,9 @@ from unittest.mock import MagicMock, Mock
 
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
 
-from griptape.drivers import PgVectorVectorStoreDriver
+from griptape.drivers import BaseVectorStoreDriver, PgVectorVectorStoreDriver
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
@@ -57,6 +58,27 @@ class TestPgVectorVectorStoreDriver:
         mock_session.merge.assert_called_once()
         mock_session.commit.assert_called_once()
 
+    def test_upsert_vectors(self, mock_session, mock_engine):
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name
+        )
+        test_id = str(uuid.uuid4())
+
+        vector_ids = driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id=test_id, vector=[1.0, 2.0, 3.0], namespace="foo"),
+                BaseVectorStoreDriver.Entry(id=None, vector=[3.0, 2.0, 1.0], meta={"foo": "bar"}),  # pyright: ignore[reportArgumentType]
+            ]
+        )
+
+        assert vector_ids[0] == test_id
+        assert uuid.UUID(vector_ids[1])
+        mock_session.execute.assert_called_once()
+        mock_session.commit.assert_called_once()
+        statement = str(mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (id) DO UPDATE" in statement
+        assert statement.count("%(id_m") == 2
+
     def test_load_entry(self, mock_session, mock_engine):
         test_id = str(uuid.uuid4())
         test_vec = [0.1, 0.2, 0.3]
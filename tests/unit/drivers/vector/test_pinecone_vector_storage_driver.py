@@ -1,7 +1,9 @@
+from unittest.mock import call
+
 import pytest
 
 from griptape.artifacts import TextArtifact
-from griptape.drivers import PineconeVectorStoreDriver
+from griptape.drivers import BaseVectorStoreDriver, PineconeVectorStoreDriver
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
@@ -44,6 +46,21 @@ class TestPineconeVectorStorageDriver:
         assert driver.upsert_vector([0, 1, 2], vector_id="foo") == "foo"
         assert isinstance(driver.upsert_vector([0, 1, 2]), str)
 
+    def test_upsert_vectors(self, driver):
+        vector_ids = driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0, 1, 2], namespace="a"),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[1, 2, 3], namespace="b", meta={"bar": "baz"}),
+                BaseVectorStoreDriver.Entry(id="baz", vector=[2, 3, 4], namespace="a"),
+            ]
+        )
+
+        assert vector_ids == ["foo", "bar", "baz"]
+        assert driver.index.upsert.call_args_list == [
+            call(vectors=[("foo", [0, 1, 2], None), ("baz", [2, 3, 4], None)], namespace="a"),
+            call(vectors=[("bar", [1, 2, 3], {"bar": "baz"})], namespace="b"),
+        ]
+
     def test_upsert_text(self, driver):
         assert driver.upsert_text("foo", vector_id="foo") == "foo"
         assert isinstance(driver.upsert_text("foo"), str)
@@ -3,7 +3,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from griptape.drivers import QdrantVectorStoreDriver
+from griptape.artifacts import TextArtifact
+from griptape.drivers import BaseVectorStoreDriver, QdrantVectorStoreDriver
 from griptape.utils import import_optional_dependency
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
@@ -103,6 +104,43 @@ class TestQdrantVectorStoreDriver:
             driver.client.upsert.assert_called_once_with(collection_name=driver.collection_name, points=mock_batch)
             assert result == vector_id
 
+    def test_upsert_vectors(self, driver):
+        entries = [
+            BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2, 0.3], meta={"meta_key": "meta_value"}),
+            BaseVectorStoreDriver.Entry(id=None, vector=[0.4, 0.5, 0.6]),  # pyright: ignore[reportArgumentType]
+        ]
+
+        with patch("griptape.drivers.vector.qdrant_vector_store_driver.import_optional_dependency") as mock_import:
+            driver.client = MagicMock()
+
+            result = driver.upsert_vectors(entries)
+
+            expected_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, str([0.4, 0.5, 0.6])))
+            mock_import.return_value.Batch.assert_called_once_with(
+                ids=["foo", expected_id],
+                vectors=[[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]],
+                payloads=[{"meta_key": "meta_value"}, {}],
+            )
+            driver.client.upsert.assert_called_once_with(
+                collection_name=driver.collection_name, points=mock_import.return_value.Batch.return_value
+            )
+            assert result == ["foo", expected_id]
+
+    def test_upsert_text_artifacts_with_content(self, driver):
+        with patch("griptape.drivers.vector.qdrant_vector_store_driver.import_optional_dependency") as mock_import:
+            driver.client = MagicMock()
+            driver.client.retrieve.return_value = []
+
+            driver.upsert_text_artifacts([TextArtifact("foo")], meta={"meta_key": "meta_value"}, content="bar")
+
+            payloads = mock_import.return_value.Batch.call_args.kwargs["payloads"]
+            assert payloads[0]["data"] == "bar"
+            assert payloads[0]["meta_key"] == "meta_value"
+
+    def test_upsert_vectors_with_unsupported_kwargs(self, driver):
+        with pytest.raises(ValueError, match="Unsupported upsert arguments"):
+            driver.upsert_vectors([BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2, 0.3])], foo="bar")
+
     def test_load_entry(self, driver):
         vector_id = str(uuid.uuid4())
         mock_entry = MagicMock()
@@ -2,7 +2,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from griptape.drivers import RedisVectorStoreDriver
+from griptape.drivers import BaseVectorStoreDriver, RedisVectorStoreDriver
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
@@ -48,6 +48,23 @@ class TestRedisVectorStorageDriver:
             == "some_vector_id"
         )
 
+    def test_upsert_vectors(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value
+
+        vector_ids = driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[1.0, 2.0, 3.0], namespace="some_namespace"),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[3.0, 2.0, 1.0], meta={"foo": "bar"}),
+            ]
+        )
+
+        assert vector_ids == ["foo", "bar"]
+        mock_client.pipeline.assert_called_once_with(transaction=False)
+        assert [c.args[0] for c in pipeline.hset.call_args_list] == ["some_namespace:foo", "bar"]
+        assert pipeline.hset.call_args_list[1].kwargs["mapping"]["metadata"] == '{"foo": "bar"}'
+        pipeline.execute.assert_called_once()
+        mock_client.hset.assert_not_called()
+
     def test_load_entry(self, driver, mock_hgetall):
         entry = driver.load_entry("some_vector_id")
         mock_hgetall.assert_called_once_with("some_vector_id")
@@ -1,7 +1,11 @@
+import re
+from unittest.mock import patch
+
 import pytest
 
 from griptape.engines import CsvExtractionEngine
 from tests.mocks.mock_prompt_driver import MockPromptDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 
 class TestCsvExtractionEngine:
@@ -24,3 +28,33 @@ class TestCsvExtractionEngine:
         assert len(result) == 2
         assert result[0].value == "foo,bar"
         assert result[1].value == "baz,maz"
+
+    def test_extract_text_parallel(self):
+        engine = CsvExtractionEngine(
+            column_names=["header"],
+            prompt_driver=MockPromptDriver(
+                tokenizer=MockTokenizer(model="test-model", max_input_tokens=1000),
+                mock_output=lambda prompt_stack: "header\n"
+                + re.findall(r"word\d+", prompt_stack.messages[1].value)[-1],
+            ),
+            parallel=True,
+        )
+        text = " ".join(f"word{i}" for i in range(500))
+
+        with patch.object(engine.futures_executor, "submit", wraps=engine.futures_executor.submit) as submit:
+            result = engine.extract_text(text)
+
+        chunks = engine.chunker.chunk(text)
+        assert submit.call_count == len(chunks) > 1
+        assert [row.value for row in result.value] == ["header", *(chunk.value.split()[-1] for chunk in chunks)]
+
+    def test_extract_text_deduplicate(self, engine):
+        engine.prompt_driver.mock_output = "header\nfoo\nbar\nfoo"
+
+        assert [row.value for row in engine.extract_text("foo").value] == ["header", "foo", "bar", "foo"]
+        assert [row.value for row in engine.extract_text("foo", deduplicate=True).value] == ["header", "foo", "bar"]
+        assert [row.value for row in engine.extract_text("foo", parallel=True, deduplicate=True).value] == [
+            "header",
+            "foo",
+            "bar",
+        ]
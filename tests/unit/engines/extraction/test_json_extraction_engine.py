@@ -45,3 +45,13 @@ class TestJsonExtractionEngine:
 
     def test_json_to_text_artifacts_no_matches(self, engine):
         assert engine.json_to_text_artifacts("asdfasdfasdf") == []
+
+    def test_extract_text_parallel_deduplicate(self, engine):
+        engine.prompt_driver.mock_output = '[{"foo": "bar"}, {"baz": "qux"}, {"foo": "bar"}]'
+        engine.parallel = True
+        engine.deduplicate = True
+
+        result = engine.extract_text("foo")
+
+        assert [artifact.value for artifact in result.value] == [{"foo": "bar"}, {"baz": "qux"}]
+        assert len(engine.extract_text("foo", deduplicate=False).value) == 3
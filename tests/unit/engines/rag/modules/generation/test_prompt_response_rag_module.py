@@ -5,6 +5,7 @@ from griptape.engines.rag import RagContext
 from griptape.engines.rag.modules import PromptResponseRagModule
 from griptape.rules import Rule, Ruleset
 from tests.mocks.mock_prompt_driver import MockPromptDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 
 class TestPromptResponseRagModule:
@@ -29,3 +30,47 @@ class TestPromptResponseRagModule:
         assert "*META*" in system_message
         assert "*TEXT SEGMENT 1*" in system_message
         assert "*TEXT SEGMENT 2*" in system_message
+
+    def test_run_packs_text_chunks(self):
+        system_prompts = []
+        renders = []
+        module = PromptResponseRagModule(
+            prompt_driver=MockPromptDriver(
+                tokenizer=MockTokenizer(model="test-model", max_input_tokens=1000),
+                mock_output=lambda prompt_stack: system_prompts.append(prompt_stack.messages[0].value) or "answer",
+            ),
+            answer_token_offset=100,
+        )
+        generate_system_template = module.generate_system_template
+        module.generate_system_template = lambda context, artifacts: renders.append(artifacts) or (
+            generate_system_template(context, artifacts)
+        )
+        chunks = [TextArtifact("a" * 200), TextArtifact("b" * 400), TextArtifact("c" * 280), TextArtifact("d" * 20)]
+
+        output = module.run(RagContext(query="test", text_chunks=chunks))
+
+        assert output.value == "answer"
+        # Lower ranked chunks that still fit are included after a chunk that doesn't.
+        assert output.meta["dropped_chunk_ids"] == [chunks[1].id]
+        assert "b" * 400 not in system_prompts[0]
+        assert all(chunk.value in system_prompts[0] for chunk in [chunks[0], chunks[2], chunks[3]])
+        # The template is rendered without chunks, once per chunk, and once with every chunk that fits.
+        assert len(renders) == len(chunks) + 2
+
+    def test_run_without_dropped_chunks(self, module):
+        output = module.run(RagContext(query="test", text_chunks=[TextArtifact("foo")]))
+
+        assert output.meta["dropped_chunk_ids"] == []
+
+    def test_run_drops_chunks_when_estimate_is_short(self):
+        module = PromptResponseRagModule(
+            prompt_driver=MockPromptDriver(tokenizer=MockTokenizer(model="test-model", max_input_tokens=1000)),
+            answer_token_offset=100,
+            # Without chunks, the prompt is longer than with one, so single chunk costs underestimate the total.
+            generate_system_template=lambda context, artifacts: "\n".join(a.value for a in artifacts) or "x" * 500,
+        )
+        chunks = [TextArtifact("a" * 400), TextArtifact("b" * 400), TextArtifact("c" * 400)]
+
+        output = module.run(RagContext(query="test", text_chunks=chunks))
+
+        assert output.meta["dropped_chunk_ids"] == [chunks[2].id]
@@ -1,19 +1,22 @@
+import threading
+
 import pytest
 
 from griptape.drivers import LocalVectorStoreDriver
 from griptape.engines.rag import RagContext
-from griptape.engines.rag.modules import TextLoaderRetrievalRagModule
-from griptape.loaders import WebLoader
+from griptape.engines.rag.modules import IngestionCacheStats, TextLoaderRetrievalRagModule
+from griptape.loaders import TextLoader, WebLoader
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 MAX_TOKENS = 50
 
 
 class TestTextLoaderRetrievalRagModule:
-    @pytest.fixture(autouse=True)
+    @pytest.fixture()
     def _mock_trafilatura_fetch_url(self, mocker):
         mocker.patch("trafilatura.fetch_url", return_value="<html>foobar</html>")
 
+    @pytest.mark.usefixtures("_mock_trafilatura_fetch_url")
     def test_run(self):
         embedding_driver = MockEmbeddingDriver()
 
@@ -24,3 +27,163 @@ class TestTextLoaderRetrievalRagModule:
         )
 
         assert module.run(RagContext(query="foo"))[0].value == "foobar"
+
+    @pytest.fixture()
+    def sources(self, tmp_path):
+        paths = []
+
+        for name in ["foo", "bar", "baz"]:
+            path = tmp_path / f"{name}.txt"
+            path.write_text(f"{name} text")
+            paths.append(str(path))
+
+        return paths
+
+    @pytest.fixture()
+    def vector_store_driver(self):
+        return LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+
+    def test_run_reuses_ingested_source(self, sources, vector_store_driver, mocker):
+        module = TextLoaderRetrievalRagModule(
+            loader=TextLoader(), vector_store_driver=vector_store_driver, source=sources[0]
+        )
+        embed_strings = mocker.spy(vector_store_driver.embedding_driver, "embed_strings")
+
+        assert module.run(RagContext(query="foo"))[0].value == "foo text"
+        assert module.run(RagContext(query="foo"))[0].value == "foo text"
+        assert module.run(RagContext(query="bar", module_configs={module.name: {"source": sources[1]}}))[0].value == (
+            "bar text"
+        )
+
+        assert embed_strings.call_count == 2
+        assert module.ingestion_stats == IngestionCacheStats(hits=1, misses=2, evictions=0, size=2)
+        assert len({entry.namespace for entry in vector_store_driver.load_entries()}) == 2
+
+    def test_run_ingests_changed_source(self, sources, vector_store_driver):
+        module = TextLoaderRetrievalRagModule(
+            loader=TextLoader(), vector_store_driver=vector_store_driver, source=sources[0]
+        )
+        first_namespace = module.ingest(sources[0])
+
+        with open(sources[0], "w") as file:
+            file.write("changed text")
+
+        assert module.ingest(sources[0]) != first_namespace
+        assert module.run(RagContext(query="foo"))[0].value == "changed text"
+        assert module.ingestion_stats.misses == 2
+
+    def test_max_ingested_sources(self, sources, vector_store_driver):
+        module = TextLoaderRetrievalRagModule(
+            loader=TextLoader(), vector_store_driver=vector_store_driver, source=None, max_ingested_sources=2
+        )
+
+        foo, bar, _ = (module.ingest(source) for source in sources)
+
+        assert module.ingestion_stats == IngestionCacheStats(hits=0, misses=3, evictions=1, size=2)
+        assert vector_store_driver.load_entries(namespace=foo) == []
+
+        module.ingest(sources[1])
+        module.ingest(sources[0])
+
+        assert module.ingestion_stats == IngestionCacheStats(hits=1, misses=4, evictions=2, size=2)
+        assert len(vector_store_driver.load_entries(namespace=bar)) == 1
+        assert len(vector_store_driver.load_entries()) == 2
+
+    def test_ingestion_ttl(self, sources, vector_store_driver, mocker):
+        monotonic = mocker.patch("time.monotonic", return_value=0.0)
+        module = TextLoaderRetrievalRagModule(
+            loader=TextLoader(), vector_store_driver=vector_store_driver, source=None, ingestion_ttl=10
+        )
+
+        foo = module.ingest(sources[0])
+        monotonic.return_value = 5.0
+        module.ingest(sources[1])
+        monotonic.return_value = 12.0
+        module.ingest(sources[1])
+
+        assert module.ingestion_stats == IngestionCacheStats(hits=1, misses=2, evictions=1, size=1)
+        assert vector_store_driver.load_entries(namespace=foo) == []
+
+        monotonic.return_value = 30.0
+        module.ingest(sources[0])
+
+        assert module.ingestion_stats == IngestionCacheStats(hits=1, misses=3, evictions=2, size=1)
+        assert len(vector_store_driver.load_entries()) == 1
+
+    def test_evict_ingested_sources(self, sources, vector_store_driver):
+        module = TextLoaderRetrievalRagModule(loader=TextLoader(), vector_store_driver=vector_store_driver, source=None)
+
+        for source in sources:
+            module.ingest(source)
+
+        module.evict_ingested_sources()
+
+        assert module.ingestion_stats.size == 0
+        assert vector_store_driver.load_entries() == []
+
+    def test_eviction_without_deletion_support(self, sources, vector_store_driver, mocker):
+        mocker.patch.object(vector_store_driver, "delete_namespace", side_effect=NotImplementedError)
+        module = TextLoaderRetrievalRagModule(
+            loader=TextLoader(), vector_store_driver=vector_store_driver, source=None, max_ingested_sources=1
+        )
+
+        module.ingest(sources[0])
+        module.ingest(sources[1])
+
+        assert module.ingestion_stats.evictions == 1
+        assert len(vector_store_driver.load_entries()) == 2
+
+    def test_run_keeps_queried_source(self, sources, vector_store_driver, mocker):
+        module = TextLoaderRetrievalRagModule(
+            loader=TextLoader(), vector_store_driver=vector_store_driver, source=sources[0], max_ingested_sources=1
+        )
+        query_vector_store = module.query_vector_store
+
+        def ingest_while_querying(*args, **kwargs) -> list:
+            module.ingest(sources[1])
+
+            return query_vector_store(*args, **kwargs)
+
+        mocker.patch.object(module, "query_vector_store", side_effect=ingest_while_querying)
+
+        assert module.run(RagContext(query="foo"))[0].value == "foo text"
+        assert module.ingestion_stats == IngestionCacheStats(hits=0, misses=2, evictions=1, size=1)
+        assert [entry.to_artifact().value for entry in vector_store_driver.load_entries()] == ["bar text"]
+
+    def test_concurrent_ingest(self, sources, vector_store_driver, mocker):
+        module = TextLoaderRetrievalRagModule(loader=TextLoader(), vector_store_driver=vector_store_driver, source=None)
+        upsert_text_artifacts = vector_store_driver.upsert_text_artifacts
+        upsert_started = threading.Event()
+        release_upsert = threading.Event()
+
+        def upsert(artifacts: dict) -> dict:
+            chunks = {namespace: list(artifact_list) for namespace, artifact_list in artifacts.items()}
+
+            if any(chunk.value == "foo text" for artifact_list in chunks.values() for chunk in artifact_list):
+                upsert_started.set()
+                release_upsert.wait(5)
+
+            return upsert_text_artifacts(chunks)
+
+        upsert_spy = mocker.patch.object(vector_store_driver, "upsert_text_artifacts", side_effect=upsert)
+        foo_threads = [threading.Thread(target=module.ingest, args=(sources[0],)) for _ in range(2)]
+
+        foo_threads[0].start()
+        upsert_started.wait(5)
+        foo_threads[1].start()
+        module.ingest(sources[1])
+        bar_upserted = module.ingestion_stats.size == 1
+        release_upsert.set()
+
+        for thread in foo_threads:
+            thread.join()
+
+        assert bar_upserted
+        assert upsert_spy.call_count == 2
+        assert module.ingestion_stats == IngestionCacheStats(hits=1, misses=2, evictions=0, size=2)
+
+    def test_max_ingested_sources_validation(self, vector_store_driver):
+        with pytest.raises(ValueError, match="max_ingested_sources"):
+            TextLoaderRetrievalRagModule(
+                loader=TextLoader(), vector_store_driver=vector_store_driver, source=None, max_ingested_sources=0
+            )
@@ -1,8 +1,9 @@
 from griptape.artifacts import TextArtifact
 from griptape.common import Reference
 from griptape.drivers import LocalVectorStoreDriver
-from griptape.engines.rag import RagContext
+from griptape.engines.rag import RagContext, RagEngine
 from griptape.engines.rag.modules import VectorStoreRetrievalRagModule
+from griptape.engines.rag.stages import RetrievalRagStage
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
@@ -56,3 +57,23 @@ class TestVectorStoreRetrievalRagModule:
 
         assert len(result1) == 0
         assert len(result2) == 2
+
+    def test_run_embeds_query_once(self, mocker):
+        embedding_driver = MockEmbeddingDriver()
+        vector_store_drivers = [LocalVectorStoreDriver(embedding_driver=embedding_driver) for _ in range(3)]
+        for i, vector_store_driver in enumerate(vector_store_drivers):
+            vector_store_driver.upsert_text_artifact(TextArtifact(f"foobar{i}"))
+        embed_string = mocker.spy(embedding_driver, "embed_string")
+        engine = RagEngine(
+            retrieval_stage=RetrievalRagStage(
+                retrieval_modules=[
+                    VectorStoreRetrievalRagModule(vector_store_driver=vector_store_driver)
+                    for vector_store_driver in vector_store_drivers
+                ]
+            )
+        )
+
+        context = engine.process_query("test")
+
+        embed_string.assert_called_once_with("test")
+        assert sorted(chunk.value for chunk in context.text_chunks) == ["foobar0", "foobar1", "foobar2"]
@@ -1,6 +1,11 @@
+import threading
+from unittest.mock import Mock
+
 from griptape.artifacts import TextArtifact
 from griptape.common import Reference
+from griptape.drivers import CohereEmbeddingDriver
 from griptape.engines.rag import RagContext
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
 class TestRagContext:
@@ -21,3 +26,83 @@ class TestRagContext:
         assert len(references) == 2
         assert references[0].id == reference1.id
         assert references[1].id == reference2.id
+
+    def test_get_query_embedding(self, mocker):
+        context = RagContext(query="foo")
+        embedding_driver = MockEmbeddingDriver()
+        embed_string = mocker.spy(embedding_driver, "embed_string")
+
+        assert context.get_query_embedding(embedding_driver) == context.get_query_embedding(embedding_driver)
+        assert context.get_query_embedding(MockEmbeddingDriver()) == context.get_query_embedding(embedding_driver)
+        embed_string.assert_called_once_with("foo")
+
+        context.query = "bar"
+        context.get_query_embedding(embedding_driver)
+        context.get_query_embedding(MockEmbeddingDriver(model="other-model"))
+
+        assert embed_string.call_count == 2
+        assert len(context.query_embeddings) == 3
+
+    def test_get_query_embedding_with_other_input_type(self, mocker):
+        mock_client = mocker.patch("cohere.Client").return_value
+        context = RagContext(query="foo")
+        document_driver = CohereEmbeddingDriver(model="embed-english-v3.0", api_key="bar", input_type="search_document")
+        query_driver = CohereEmbeddingDriver(model="embed-english-v3.0", api_key="bar", input_type="search_query")
+
+        mock_client.embed.return_value = Mock(embeddings=[[0, 1, 0]])
+        assert context.get_query_embedding(document_driver) == [0, 1, 0]
+
+        mock_client.embed.return_value = Mock(embeddings=[[1, 0, 0]])
+        assert context.get_query_embedding(query_driver) == [1, 0, 0]
+        assert RagContext.get_query_embeddings([context], document_driver) == [[0, 1, 0]]
+        assert mock_client.embed.call_count == 2
+
+    def test_get_query_embedding_with_other_model_embedding(self):
+        context = RagContext(query="foo")
+        embedding_started = threading.Event()
+        release_embedding = threading.Event()
+
+        def slow_output(_: str) -> list[float]:
+            embedding_started.set()
+            release_embedding.wait(5)
+
+            return [0.0, 1.0]
+
+        slow_thread = threading.Thread(
+            target=context.get_query_embedding, args=(MockEmbeddingDriver(model="slow", mock_output=slow_output),)
+        )
+        fast_thread = threading.Thread(target=context.get_query_embedding, args=(MockEmbeddingDriver(),))
+
+        slow_thread.start()
+        embedding_started.wait(5)
+        fast_thread.start()
+        fast_thread.join(1)
+        fast_done = not fast_thread.is_alive()
+        release_embedding.set()
+        slow_thread.join()
+        fast_thread.join()
+
+        assert fast_done
+        assert len(context.query_embeddings) == 2
+
+    def test_get_query_embeddings(self, mocker):
+        embedding_driver = MockEmbeddingDriver(mock_output=lambda chunk: [float(len(chunk)), 1.0])
+        embed_strings = mocker.spy(embedding_driver, "embed_strings")
+        embed_string = mocker.spy(embedding_driver, "embed_string")
+        cached = RagContext(query="cached")
+        cached.get_query_embedding(embedding_driver)
+        contexts = [RagContext(query="a"), RagContext(query="bb"), RagContext(query="a"), cached]
+
+        assert RagContext.get_query_embeddings(contexts, embedding_driver) == [
+            [1.0, 1.0],
+            [2.0, 1.0],
+            [1.0, 1.0],
+            [6.0, 1.0],
+        ]
+        embed_strings.assert_called_once_with(["a", "bb"])
+        embed_string.assert_called_once_with("cached")
+
+        assert RagContext.get_query_embeddings(contexts, embedding_driver) == [
+            context.get_query_embedding(embedding_driver) for context in contexts
+        ]
+        embed_strings.assert_called_once()
@@ -1,9 +1,14 @@
 import pytest
 
+from griptape.artifacts import TextArtifact
 from griptape.drivers import LocalVectorStoreDriver
 from griptape.engines.rag import RagContext, RagEngine
-from griptape.engines.rag.modules import PromptResponseRagModule, VectorStoreRetrievalRagModule
-from griptape.engines.rag.stages import ResponseRagStage, RetrievalRagStage
+from griptape.engines.rag.modules import (
+    PromptResponseRagModule,
+    TranslateQueryRagModule,
+    VectorStoreRetrievalRagModule,
+)
+from griptape.engines.rag.stages import QueryRagStage, ResponseRagStage, RetrievalRagStage
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 from tests.mocks.mock_prompt_driver import MockPromptDriver
 
@@ -49,3 +54,81 @@ class TestRagEngine:
 
     def test_process(self, engine):
         assert engine.process(RagContext(query="test")).outputs[0].value == "mock output"
+
+    def test_process_timings(self, engine):
+        context = engine.process_query("test")
+
+        assert set(context.stage_timings) == {"retrieval", "response"}
+        assert all(timing >= 0 for timing in context.stage_timings.values())
+
+    @pytest.mark.parametrize("batch_size", [1, 2, 32])
+    def test_process_batch(self, batch_size, mocker):
+        embedding_driver = MockEmbeddingDriver(mock_output=lambda chunk: [1.0, float(chunk.startswith("foo"))])
+        vector_store_driver = LocalVectorStoreDriver(embedding_driver=embedding_driver)
+        vector_store_driver.upsert_text_artifacts([TextArtifact("foo"), TextArtifact("bar")])
+        engine = RagEngine(
+            query_stage=QueryRagStage(
+                query_modules=[TranslateQueryRagModule(prompt_driver=MockPromptDriver(), language="english")]
+            ),
+            retrieval_stage=RetrievalRagStage(
+                retrieval_modules=[
+                    VectorStoreRetrievalRagModule(vector_store_driver=vector_store_driver, query_params={"count": 1})
+                ]
+            ),
+            response_stage=ResponseRagStage(
+                response_modules=[PromptResponseRagModule(prompt_driver=MockPromptDriver())]
+            ),
+        )
+        embed_strings = mocker.spy(embedding_driver, "embed_strings")
+        query_vector = mocker.spy(vector_store_driver, "query_vector")
+        queries = [f"query {i}" for i in range(5)]
+
+        contexts = engine.process_batch(queries, batch_size=batch_size)
+
+        assert [context.query for context in contexts] == ["mock output"] * 5
+        assert all(context.outputs[0].value == "mock output" for context in contexts)
+        assert all(set(context.stage_timings) == {"query", "retrieval", "response"} for context in contexts)
+        assert embed_strings.call_count == -(-5 // batch_size)
+        query_vector.assert_not_called()
+
+    def test_process_batch_matches_process(self, mocker):
+        embedding_driver = MockEmbeddingDriver(mock_output=lambda chunk: [1.0, float(chunk.startswith("foo"))])
+        vector_store_driver = LocalVectorStoreDriver(embedding_driver=embedding_driver)
+        module = VectorStoreRetrievalRagModule(name="retrieval", vector_store_driver=vector_store_driver)
+        engine = RagEngine(retrieval_stage=RetrievalRagStage(retrieval_modules=[module], max_chunks=1))
+
+        vector_store_driver.upsert_text_artifacts(
+            {"a": [TextArtifact("bar"), TextArtifact("foo")], "b": [TextArtifact("baz")]}
+        )
+
+        queries = ["foo", "bar", "foo", "baz"]
+        contexts = engine.process_batch(queries)
+        expected = [engine.process_query(query) for query in queries]
+
+        assert [[c.value for c in context.text_chunks] for context in contexts] == [
+            [c.value for c in context.text_chunks] for context in expected
+        ]
+        assert [context.text_chunks[0].value for context in contexts] == ["foo", "bar", "foo", "bar"]
+        assert all(context.outputs == [] for context in contexts)
+
+    def test_process_batch_with_module_query_params(self):
+        vector_store_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+        module = VectorStoreRetrievalRagModule(name="retrieval", vector_store_driver=vector_store_driver)
+        engine = RagEngine(retrieval_stage=RetrievalRagStage(retrieval_modules=[module]))
+
+        vector_store_driver.upsert_text_artifacts(
+            {"a": [TextArtifact("foo"), TextArtifact("bar")], "b": [TextArtifact("baz")]}
+        )
+
+        context = RagContext(query="foo", module_configs={"retrieval": {"query_params": {"namespace": "b"}}})
+        contexts = engine.retrieval_stage.run_batch([RagContext(query="foo"), context])
+
+        assert [c.value for c in contexts[0].text_chunks] == ["foo", "bar", "baz"]
+        assert [c.value for c in contexts[1].text_chunks] == ["baz"]
+
+    def test_process_batch_empty(self, engine):
+        assert engine.process_batch([]) == []
+
+    def test_process_batch_invalid_batch_size(self, engine):
+        with pytest.raises(ValueError, match="batch_size"):
+            engine.process_batch(["test"], batch_size=0)
@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -7,6 +8,7 @@ from griptape.artifacts import ListArtifact, TextArtifact
 from griptape.common import PromptStack
 from griptape.engines import PromptSummaryEngine
 from tests.mocks.mock_prompt_driver import MockPromptDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 
 class TestPromptSummaryEngine:
@@ -49,3 +51,47 @@ class TestPromptSummaryEngine:
 
         output = engine.summarize_artifacts_rec([], "summary")
         assert output.value == "summary"
+
+    def test_map_reduce_summary(self):
+        prompts = []
+
+        def summarize(prompt_stack: PromptStack) -> str:
+            prompts.append(prompt_stack.messages[1].value)
+            return "summary " * 12
+
+        engine = PromptSummaryEngine(
+            prompt_driver=MockPromptDriver(
+                tokenizer=MockTokenizer(model="test-model", max_input_tokens=1000), mock_output=summarize
+            ),
+            strategy="map_reduce",
+        )
+
+        text = " ".join(f"word{i}" for i in range(1000))
+
+        with patch.object(engine.futures_executor, "submit", wraps=engine.futures_executor.submit) as submit:
+            summary = engine.summarize_text(text)
+
+        chunk_prompts = [prompt for prompt in prompts if "word" in prompt]
+        assert summary == "summary " * 12
+        assert len(chunk_prompts) == len(engine.chunker.chunk(text))
+        # Chunks, then groups of partial summaries, are summarized concurrently, and the last groups in one prompt.
+        assert len(prompts) - len(chunk_prompts) == 4 + 1
+        assert submit.call_count == len(prompts) - 1
+
+    def test_map_reduce_summary_without_progress(self):
+        engine = PromptSummaryEngine(
+            prompt_driver=MockPromptDriver(
+                tokenizer=MockTokenizer(model="test-model", max_input_tokens=1000),
+                mock_output=lambda prompt_stack: "no progress " * 50,
+            ),
+            strategy="map_reduce",
+        )
+
+        with patch.object(engine, "summarize_artifacts_rec", wraps=engine.summarize_artifacts_rec) as rec:
+            assert engine.summarize_text(" ".join(f"word{i}" for i in range(1000))) == "no progress " * 50
+
+        rec.assert_called()
+
+    def test_summarize_artifacts_map_reduce_no_artifacts(self, engine):
+        with pytest.raises(ValueError):
+            engine.summarize_artifacts_map_reduce([])
@@ -177,3 +177,51 @@ class TestConversationMemory:
         assert prompt_stack.messages[2].content[0].artifact.value == "bar2"
         assert prompt_stack.messages[-2].content[0].artifact.value == "foo"
         assert prompt_stack.messages[-1].content[0].artifact.value == "bar"
+
+    def test_add_to_prompt_stack_autopruning_reuses_run_token_counts(self, mocker):
+        prompt_driver = MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_input_tokens=160))
+        memory = ConversationMemory(
+            autoprune=True,
+            runs=[Run(input=TextArtifact(f"foo{i}"), output=TextArtifact(f"bar{i}")) for i in range(1, 6)],
+        )
+        count_tokens = mocker.spy(MockTokenizer, "count_tokens")
+
+        memory.add_to_prompt_stack(prompt_driver, PromptStack())
+        # The fixed part of the Prompt Stack, the empty Prompt Stack, and each run.
+        assert count_tokens.call_count == 7
+
+        prompt_stack = PromptStack()
+        prompt_stack.add_system_message("fizz")
+        memory.add_to_prompt_stack(prompt_driver, prompt_stack)
+
+        assert count_tokens.call_count == 9
+        assert len(prompt_stack.messages) == 9
+        assert prompt_stack.messages[1].content[0].artifact.value == "foo2"
+
+    def test_add_to_prompt_stack_autopruning_forgets_removed_runs(self):
+        prompt_driver = MockPromptDriver()
+        memory = ConversationMemory(max_runs=1)
+
+        memory.add_run(Run(input=TextArtifact("foo1"), output=TextArtifact("bar1")))
+        memory.add_to_prompt_stack(prompt_driver, PromptStack())
+        memory.add_run(Run(input=TextArtifact("foo2"), output=TextArtifact("bar2")))
+        memory.add_to_prompt_stack(prompt_driver, PromptStack())
+
+        assert [key[0] for key in memory._run_token_counts] == [memory.runs[0].id]
+
+    def test_add_run_appends_run(self, mocker):
+        memory = ConversationMemory(autoload=False)
+        append_run = mocker.spy(memory.conversation_memory_driver, "append_run")
+        run = Run(input=TextArtifact("foo"), output=TextArtifact("bar"))
+
+        memory.add_run(run)
+
+        append_run.assert_called_once_with(run, [run], {})
+
+    def test_load_runs_with_max_runs(self, mocker):
+        memory = ConversationMemory(autoload=False, max_runs=2)
+        load = mocker.patch.object(memory.conversation_memory_driver, "load", return_value=([], {}))
+
+        memory.load_runs()
+
+        load.assert_called_once_with(last_n=2)
@@ -1,10 +1,12 @@
 import json
 
 from griptape.artifacts import TextArtifact
+from griptape.common import PromptStack
 from griptape.memory.structure import Run, SummaryConversationMemory
 from griptape.structures import Pipeline
 from griptape.tasks import PromptTask
 from tests.mocks.mock_prompt_driver import MockPromptDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 
 class TestSummaryConversationMemory:
@@ -89,3 +91,19 @@ class TestSummaryConversationMemory:
         pipeline.add_tasks(PromptTask("test"))
 
         assert isinstance(memory.prompt_driver, MockPromptDriver)
+
+    def test_add_to_prompt_stack_autopruning(self):
+        # The summary and the last run sum to 89 tokens with the MockTokenizer.
+        prompt_driver = MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_input_tokens=100))
+        memory = SummaryConversationMemory(
+            summary="foobar",
+            summary_index=1,
+            runs=[Run(input=TextArtifact(f"foo{i}"), output=TextArtifact(f"bar{i}")) for i in range(1, 4)],
+        )
+        prompt_stack = PromptStack()
+
+        memory.add_to_prompt_stack(prompt_driver, prompt_stack)
+
+        assert len(prompt_stack.messages) == 3
+        assert prompt_stack.messages[0].content[0].artifact.value == "Summary of the conversation so far: foobar"
+        assert prompt_stack.messages[1].content[0].artifact.value == "foo3"
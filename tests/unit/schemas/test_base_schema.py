@@ -5,6 +5,7 @@ from enum import Enum
 from typing import Literal, Optional, Union
 
 import pytest
+from attrs import define, field
 from marshmallow import fields
 
 from griptape.artifacts import BaseArtifact, TextArtifact
@@ -45,6 +46,36 @@ class TestBaseSchema:
         with pytest.raises(ValueError):
             BaseSchema.from_attrs_cls(TextLoader)
 
+    def test_from_attrs_cls_cache(self):
+        @define
+        class MockSerializableSubclass(MockSerializable):
+            qux: str = field(default="quux", kw_only=True, metadata={"serializable": True})
+
+        schema = BaseSchema.from_attrs_cls(MockSerializable)
+        subclass_schema = BaseSchema.from_attrs_cls(MockSerializableSubclass)
+
+        assert BaseSchema.from_attrs_cls(MockSerializable) is schema
+        assert BaseSchema.from_attrs_cls(MockSerializableSubclass) is subclass_schema
+        assert "qux" not in schema().fields
+        assert "qux" in subclass_schema().fields
+        assert MockSerializableSubclass.from_dict(MockSerializableSubclass(qux="foo").to_dict()).qux == "foo"
+        assert MockSerializable.from_dict(MockSerializable(foo="baz").to_dict()).foo == "baz"
+
+    def test_from_attrs_cls_cache_per_schema_class(self):
+        schema = BaseSchema.from_attrs_cls(TextArtifact)
+        polymorphic_schema = PolymorphicSchema.from_attrs_cls(TextArtifact)
+
+        assert schema is not polymorphic_schema
+        assert issubclass(polymorphic_schema, PolymorphicSchema)
+        assert PolymorphicSchema.from_attrs_cls(TextArtifact) is polymorphic_schema
+
+    def test_clear_schema_cache(self):
+        schema = BaseSchema.from_attrs_cls(MockSerializable)
+
+        BaseSchema.clear_schema_cache()
+
+        assert BaseSchema.from_attrs_cls(MockSerializable) is not schema
+
     def test_get_field_for_type(self):
         assert isinstance(BaseSchema._get_field_for_type(BaseArtifact), fields.Nested)
 
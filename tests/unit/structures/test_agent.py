@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import Mock
 
 import pytest
@@ -195,6 +196,14 @@ class TestAgent:
         assert "mock output" in result.output_task.output.to_text()
         assert task.state == BaseTask.State.FINISHED
 
+    def test_arun(self):
+        agent = Agent(prompt_driver=MockPromptDriver())
+
+        result = asyncio.run(agent.arun("test"))
+
+        assert result.output.value == "mock output"
+        assert agent.task.is_finished()
+
     def test_run_with_args(self):
         task = PromptTask("{{ args[0] }}-{{ args[1] }}")
         agent = Agent(prompt_driver=MockPromptDriver())
@@ -1,3 +1,4 @@
+import asyncio
 import time
 
 import pytest
@@ -331,6 +332,25 @@ class TestPipeline:
         assert "mock output" in result.output_task.output.to_text()
         assert task.state == BaseTask.State.FINISHED
 
+    def test_arun(self):
+        first_task = PromptTask("first")
+        second_task = PromptTask("second")
+        pipeline = Pipeline(tasks=[first_task, second_task])
+
+        result = asyncio.run(pipeline.arun())
+
+        assert result.output.value == "mock output"
+        assert first_task.is_finished()
+        assert second_task.is_finished()
+
+    def test_arun_with_error_artifact(self, error_artifact_task):
+        end_task = PromptTask("end")
+        pipeline = Pipeline(tasks=[error_artifact_task, end_task])
+
+        asyncio.run(pipeline.arun())
+
+        assert end_task.is_pending()
+
     def test_run_with_args(self):
         task = PromptTask("{{ args[0] }}-{{ args[1] }}")
         pipeline = Pipeline()
@@ -1,6 +1,7 @@
 import pytest
 
-from griptape.structures import Agent, Pipeline
+from griptape.structures import Agent, Pipeline, Workflow
+from griptape.tasks import PromptTask
 
 
 class TestStructure:
@@ -16,3 +17,67 @@ class TestStructure:
             ValueError, match="Structure's output Task has no output. Run the Structure to generate output."
         ):
             assert agent.output
+
+    def test_find_task(self):
+        task1 = PromptTask("test1", id="task1")
+        task2 = PromptTask("test2", id="task2")
+        workflow = Workflow(tasks=[task1])
+
+        workflow.insert_task([task1], task2, [])
+
+        assert workflow.find_task("task1") is task1
+        assert workflow.find_task("task2") is task2
+        assert workflow.tasks == [task1, task2]
+        with pytest.raises(ValueError, match="Task with id task3 doesn't exist."):
+            workflow.find_task("task3")
+
+    def test_find_task_after_modifying_tasks_directly(self):
+        task1 = PromptTask("test1", id="task1")
+        task2 = PromptTask("test2", id="task2")
+        task3 = PromptTask("test3", id="task3")
+        pipeline = Pipeline(tasks=[task1])
+
+        pipeline._tasks.append(task2)
+
+        assert pipeline.find_task("task2") is task2
+
+        pipeline._tasks = [[task1, task3]]
+
+        assert pipeline.try_find_task("task2") is None
+        assert pipeline.find_task("task3") is task3
+        assert pipeline.tasks == [task1, task3]
+
+    def test_find_task_after_changing_task_id(self):
+        task = PromptTask("test", id="task1")
+        pipeline = Pipeline(tasks=[task])
+
+        task.id = "task2"
+        pipeline.resolve_relationships()
+
+        assert pipeline.try_find_task("task1") is None
+        assert pipeline.find_task("task2") is task
+
+    def test_tasks_returns_copy(self):
+        task = PromptTask("test")
+        pipeline = Pipeline(tasks=[task])
+
+        pipeline.tasks.clear()
+
+        assert pipeline.tasks == [task]
+        assert pipeline.output_task is task
+
+    def test_task_outputs_view(self):
+        task1 = PromptTask("test1", id="task1")
+        task2 = PromptTask("test2", id="task2")
+        pipeline = Pipeline(tasks=[task1, task2])
+        task_outputs = pipeline.task_outputs_view
+
+        assert task_outputs == {"task1": None, "task2": None}
+
+        pipeline.run()
+
+        assert task_outputs["task2"].value == "mock output"
+        assert task_outputs == pipeline.task_outputs
+        assert list(task_outputs) == ["task1", "task2"]
+        with pytest.raises(KeyError):
+            task_outputs["task3"]
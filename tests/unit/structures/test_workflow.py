@@ -1,3 +1,5 @@
+import asyncio
+import threading
 import time
 
 import pytest
@@ -767,6 +769,133 @@ class TestWorkflow:
 
         assert workflow.output is not None
 
+    def test_run_dispatches_children_when_parents_finish(self):
+        chain_finished = threading.Event()
+
+        def slow_fn(task):
+            # Only finishes once the chain of fast Tasks has run, so it fails if the chain waits on this Task
+            return TextArtifact("slow") if chain_finished.wait(timeout=5) else ErrorArtifact("chain blocked")
+
+        def finish_chain(task):
+            chain_finished.set()
+
+            return TextArtifact("fast")
+
+        slow_task = CodeExecutionTask(on_run=slow_fn, id="slow")
+        fast_tasks = [CodeExecutionTask(on_run=lambda _: TextArtifact("fast"), id=f"fast_{i}") for i in range(3)]
+        fast_tasks.append(CodeExecutionTask(on_run=finish_chain, id="fast_3"))
+        for parent, child in zip(fast_tasks, fast_tasks[1:]):
+            child.add_parent(parent)
+        end_task = CodeExecutionTask(on_run=lambda _: TextArtifact("end"), id="end")
+        end_task.add_parents([slow_task, fast_tasks[-1]])
+        workflow = Workflow(tasks=[slow_task, *fast_tasks, end_task])
+
+        workflow.run()
+
+        assert slow_task.output.value == "slow"
+        assert workflow.output.value == "end"
+
+    def test_run_with_max_concurrency(self):
+        lock = threading.Lock()
+        running = []
+        max_running = []
+
+        def fn(task):
+            with lock:
+                running.append(task.id)
+                max_running.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(task.id)
+
+            return TextArtifact(task.id)
+
+        tasks = [CodeExecutionTask(on_run=fn, id=f"task_{i}") for i in range(6)]
+        workflow = Workflow(tasks=tasks, max_concurrency=2)
+
+        workflow.run()
+
+        assert max(max_running) == 2
+        assert all(task.output.value == task.id for task in tasks)
+
+    def test_arun(self, mocker):
+        running = []
+        max_running = []
+
+        async def atry_run(task):
+            running.append(task.id)
+            max_running.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(task.id)
+
+            return TextArtifact(task.id)
+
+        mocker.patch.object(PromptTask, "atry_run", new=atry_run)
+        parent = PromptTask("parent", id="parent")
+        children = [PromptTask(f"child_{i}", id=f"child_{i}", parent_ids=["parent"]) for i in range(3)]
+        end_task = PromptTask("end", id="end", parent_ids=[child.id for child in children])
+        workflow = Workflow(tasks=[parent, *children, end_task])
+
+        asyncio.run(workflow.arun())
+
+        assert max(max_running) == 3
+        assert workflow.output.value == "end"
+        assert all(task.is_finished() for task in workflow.tasks)
+
+    def test_arun_with_max_concurrency(self, mocker):
+        running = []
+        max_running = []
+
+        async def atry_run(task):
+            running.append(task.id)
+            max_running.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(task.id)
+
+            return TextArtifact(task.id)
+
+        mocker.patch.object(PromptTask, "atry_run", new=atry_run)
+        tasks = [PromptTask(id=f"task_{i}") for i in range(6)]
+        workflow = Workflow(tasks=tasks, max_concurrency=2)
+
+        asyncio.run(workflow.arun())
+
+        assert max(max_running) == 2
+        assert all(task.output.value == task.id for task in tasks)
+
+    def test_arun_with_error_artifact(self, error_artifact_task):
+        end_task = PromptTask("end")
+        end_task.add_parents([error_artifact_task])
+        workflow = Workflow(tasks=[error_artifact_task, end_task])
+
+        asyncio.run(workflow.arun())
+
+        assert end_task.is_pending()
+
+    def test_arun_with_error_artifact_no_fail_fast(self, error_artifact_task):
+        end_task = PromptTask("end")
+        end_task.add_parents([error_artifact_task])
+        workflow = Workflow(tasks=[error_artifact_task, end_task], fail_fast=False)
+
+        asyncio.run(workflow.arun())
+
+        assert workflow.output.value == "mock output"
+
+    def test_max_concurrency_validation(self):
+        with pytest.raises(ValueError, match="max_concurrency must be at least 1."):
+            Workflow(max_concurrency=0)
+
+    def test_run_with_finished_tasks(self):
+        parent = PromptTask("parent")
+        child = PromptTask("child", parent_ids=[parent.id])
+        workflow = Workflow(tasks=[parent, child])
+        parent.state = BaseTask.State.FINISHED
+
+        workflow.try_run()
+
+        assert parent.output is None
+        assert child.output.value == "mock output"
+
     def test_nested_tasks(self):
         workflow = Workflow(
             tasks=[
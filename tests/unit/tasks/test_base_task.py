@@ -1,8 +1,9 @@
+import asyncio
 from unittest.mock import Mock
 
 import pytest
 
-from griptape.artifacts import TextArtifact
+from griptape.artifacts import ErrorArtifact, TextArtifact
 from griptape.events import EventBus
 from griptape.events.event_listener import EventListener
 from griptape.structures import Agent, Workflow
@@ -116,6 +117,17 @@ class TestBaseTask:
 
         assert EventBus.event_listeners[0].on_event.call_count == 2
 
+    def test_arun(self, task):
+        assert asyncio.run(task.arun()).value == "foobar"
+        assert task.is_finished()
+        assert EventBus.event_listeners[0].on_event.call_count == 2
+
+    def test_arun_error(self, task, mocker):
+        mocker.patch.object(MockTask, "try_run", side_effect=Exception("error"))
+
+        assert isinstance(asyncio.run(task.arun()), ErrorArtifact)
+        assert task.is_finished()
+
     def test_add_parent(self, task):
         agent = Agent()
         parent = MockTask("parent foobar", id="parent_foobar", structure=agent)
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from griptape.engines import CsvExtractionEngine
@@ -25,3 +27,15 @@ class TestExtractionTask:
         assert len(result.value) == 2
         assert result.value[0].value == "test1"
         assert result.value[1].value == "mock output"
+
+    def test_run_parallel(self, task):
+        task.args = {"parallel": True}
+        Agent().add_task(task)
+
+        with patch.object(
+            task.extraction_engine, "_extract_parallel", wraps=task.extraction_engine._extract_parallel
+        ) as extract_parallel:
+            result = task.run()
+
+        extract_parallel.assert_called_once()
+        assert [row.value for row in result.value] == ["test1", "mock output"]
@@ -1,3 +1,5 @@
+import asyncio
+
 from griptape.artifacts.image_artifact import ImageArtifact
 from griptape.artifacts.list_artifact import ListArtifact
 from griptape.artifacts.text_artifact import TextArtifact
@@ -19,6 +21,16 @@ class TestPromptTask:
 
         assert task.run().to_text() == "mock output"
 
+    def test_arun(self, mocker):
+        prompt_driver = MockPromptDriver()
+        arun_spy = mocker.spy(prompt_driver, "arun")
+        task = PromptTask("test", prompt_driver=prompt_driver)
+
+        Pipeline().add_task(task)
+
+        assert asyncio.run(task.arun()).to_text() == "mock output"
+        assert arun_spy.call_count == 1
+
     def test_to_text(self):
         task = PromptTask("{{ test }}", context={"test": "test value"})
 
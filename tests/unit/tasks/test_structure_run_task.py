@@ -1,3 +1,5 @@
+import asyncio
+
 from griptape.drivers import LocalStructureRunDriver
 from griptape.structures import Agent, Pipeline
 from griptape.tasks import StructureRunTask
@@ -30,3 +32,16 @@ class TestStructureRunTask:
         pipeline.add_task(task)
 
         assert task.run().to_text() == "agent mock output"
+
+    def test_arun(self, mock_config):
+        mock_config.drivers_config.prompt_driver = MockPromptDriver(mock_output="agent mock output")
+        agent = Agent()
+        mock_config.drivers_config.prompt_driver = MockPromptDriver(mock_output="pipeline mock output")
+        pipeline = Pipeline()
+        driver = LocalStructureRunDriver(create_structure=lambda: agent)
+
+        task = StructureRunTask(structure_run_driver=driver)
+
+        pipeline.add_task(task)
+
+        assert asyncio.run(task.arun()).to_text() == "agent mock output"
@@ -13,6 +13,13 @@ class TestTextSummaryTask:
 
         assert task.run().to_text() == "mock output"
 
+    def test_run_map_reduce(self):
+        task = TextSummaryTask("test", summary_engine=PromptSummaryEngine(strategy="map_reduce"))
+
+        Agent().add_task(task)
+
+        assert task.run().to_text() == "mock output"
+
     def test_context_propagation(self):
         task = TextSummaryTask("{{ test }}", context={"test": "test value"})
 
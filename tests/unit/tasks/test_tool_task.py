@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 import pytest
@@ -206,6 +207,13 @@ class TestToolTask:
         assert task.run().name == "MockTool output"
         assert task.run().value == "ack foobar"
 
+    def test_arun(self, agent):
+        task = ToolTask(tool=MockTool())
+
+        agent.add_task(task)
+
+        assert asyncio.run(task.arun()).value == "ack foobar"
+
     def test_run_with_memory(self, agent):
         task = ToolTask(tool=MockTool(off_prompt=True))
 
@@ -1,3 +1,5 @@
+import asyncio
+
 from griptape.artifacts import ErrorArtifact, TextArtifact
 from griptape.common import ToolAction
 from griptape.structures import Agent
@@ -208,6 +210,27 @@ class TestToolkitSubtask:
         assert len(task.subtasks) == 1
         assert result.output_task.output.to_text() == "done"
 
+    def test_arun(self, mock_config):
+        mock_config.drivers_config.prompt_driver.mock_output = """Answer: done"""
+        task = ToolkitTask("test", tools=[MockTool(name="Tool1")])
+
+        Agent().add_task(task)
+
+        assert asyncio.run(task.arun()).to_text() == "done"
+        assert len(task.subtasks) == 1
+
+    def test_arun_max_subtasks(self, mock_config):
+        output = 'Actions: [{"tag": "foo", "name": "Tool1", "path": "test", "input": {"values": {"test": "value"}}}]'
+        mock_config.drivers_config.prompt_driver.mock_output = output
+        task = ToolkitTask("test", tools=[MockTool(name="Tool1")], max_subtasks=3)
+
+        Agent().add_task(task)
+
+        asyncio.run(task.arun())
+
+        assert len(task.subtasks) == 3
+        assert isinstance(task.output, ErrorArtifact)
+
     def test_run_max_subtasks(self, mock_config):
         output = 'Actions: [{"tag": "foo", "name": "Tool1", "path": "test", "input": {"values": {"test": "value"}}}]'
         mock_config.drivers_config.prompt_driver.mock_output = output
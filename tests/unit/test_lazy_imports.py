@@ -0,0 +1,42 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+LAZY_PACKAGES = ["griptape.drivers", "griptape.tools", "griptape.loaders", "griptape.tasks"]
+
+
+class TestLazyImports:
+    @pytest.mark.parametrize("package_name", LAZY_PACKAGES)
+    def test_all(self, package_name):
+        package = importlib.import_module(package_name)
+
+        assert set(package.__all__) == set(package._LAZY_IMPORTS)
+
+        for name in package.__all__:
+            value = getattr(package, name)
+
+            assert value.__name__ == name
+            assert name in dir(package)
+
+    @pytest.mark.parametrize("package_name", LAZY_PACKAGES)
+    def test_unknown_attribute(self, package_name):
+        package = importlib.import_module(package_name)
+
+        with pytest.raises(AttributeError, match="has no attribute 'Foo'"):
+            package.Foo  # noqa: B018
+
+        with pytest.raises(ImportError):
+            exec(f"from {package_name} import Foo")
+
+    @pytest.mark.parametrize("package_name", LAZY_PACKAGES)
+    def test_import_is_lazy(self, package_name):
+        code = (
+            f"import sys; import {package_name}; "
+            f"print(sorted(m for m in sys.modules if m.startswith('{package_name}.')))"
+        )
+
+        output = subprocess.check_output([sys.executable, "-c", code], text=True)
+
+        assert output.strip() == "[]"
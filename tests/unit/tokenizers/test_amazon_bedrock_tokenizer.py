@@ -1,5 +1,6 @@
 import pytest
 
+from griptape.drivers import LocalCacheDriver
 from griptape.tokenizers import AmazonBedrockTokenizer
 
 
@@ -49,3 +50,15 @@ class TestAmazonBedrockTokenizer:
     )
     def test_output_tokens_left(self, tokenizer, expected):
         assert tokenizer.count_output_tokens_left("foo bar huzzah") == expected
+
+    def test_token_count_with_shared_cache_driver(self):
+        cache_driver = LocalCacheDriver()
+        model = "anthropic.claude-3-haiku-20240307-v1:0"
+
+        assert AmazonBedrockTokenizer(model=model, cache_driver=cache_driver).count_tokens("hello world!") == 3
+        assert (
+            AmazonBedrockTokenizer(model=model, characters_per_token=1, cache_driver=cache_driver).count_tokens(
+                "hello world!"
+            )
+            == 12
+        )
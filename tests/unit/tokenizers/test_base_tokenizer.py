@@ -1,5 +1,6 @@
 import logging
 
+from griptape.drivers import LocalCacheDriver
 from tests.mocks.mock_tokenizer import MockTokenizer
 
 
@@ -12,3 +13,43 @@ class TestBaseTokenizer:
             assert tokenizer.max_output_tokens == 1000
 
             assert "gpt2 not found" in caplog.text
+
+    def test_count_tokens_with_cache_driver(self, mocker):
+        cache_driver = LocalCacheDriver()
+        tokenizer = MockTokenizer(model="foo", cache_driver=cache_driver)
+        try_count_tokens = mocker.spy(MockTokenizer, "try_count_tokens")
+
+        assert tokenizer.count_tokens("foo") == 3
+        assert tokenizer.count_tokens("foo") == 3
+        assert MockTokenizer(model="bar", cache_driver=cache_driver).count_tokens("foo") == 3
+        assert try_count_tokens.call_count == 2
+        assert cache_driver.hits == 1
+
+    def test_count_tokens_batch(self, mocker):
+        tokenizer = MockTokenizer(model="foo")
+        try_count_tokens_batch = mocker.spy(MockTokenizer, "try_count_tokens_batch")
+
+        assert tokenizer.count_tokens_batch(["foo", "fizzbuzz"]) == [3, 8]
+        assert try_count_tokens_batch.call_count == 1
+
+    def test_count_tokens_batch_with_cache_driver(self, mocker):
+        tokenizer = MockTokenizer(model="foo", cache_driver=LocalCacheDriver())
+        tokenizer.count_tokens("foo")
+        try_count_tokens_batch = mocker.spy(MockTokenizer, "try_count_tokens_batch")
+
+        assert tokenizer.count_tokens_batch(["foo", "fizzbuzz", "", "fizzbuzz"]) == [3, 8, 0, 8]
+        try_count_tokens_batch.assert_called_once_with(tokenizer, ["fizzbuzz", ""])
+        assert tokenizer.count_tokens_batch(["", "fizzbuzz"]) == [0, 8]
+        assert try_count_tokens_batch.call_count == 1
+
+    def test_count_tokens_with_cache_driver_keys_stop_sequences(self, mocker):
+        cache_driver = LocalCacheDriver()
+        try_count_tokens = mocker.spy(MockTokenizer, "try_count_tokens")
+
+        MockTokenizer(model="foo", cache_driver=cache_driver).count_tokens("foo<|Response|>")
+        MockTokenizer(model="foo", stop_sequences=["<|Response|>"], cache_driver=cache_driver).count_tokens(
+            "foo<|Response|>"
+        )
+
+        assert try_count_tokens.call_count == 2
+        assert cache_driver.hits == 0
@@ -1,5 +1,7 @@
 import pytest
+import tiktoken
 
+from griptape.drivers import LocalCacheDriver
 from griptape.tokenizers import OpenAiTokenizer
 
 
@@ -105,3 +107,20 @@ class TestOpenAiTokenizer:
     )
     def test_output_tokens_left(self, tokenizer, expected):
         assert tokenizer.count_output_tokens_left("foo bar huzzah") == expected
+
+    def test_encoding_resolved_once(self, mocker):
+        encoding_for_model = mocker.spy(tiktoken, "encoding_for_model")
+        tokenizer = OpenAiTokenizer(model="gpt-4-0613")
+
+        tokenizer.count_tokens("foo bar huzzah")
+        tokenizer.count_tokens("foo bar")
+        tokenizer.count_tokens([{"role": "user", "content": "foo bar huzzah"}])
+
+        assert encoding_for_model.call_count == 1
+
+    def test_count_tokens_batch(self):
+        tokenizer = OpenAiTokenizer(model="gpt-4", cache_driver=LocalCacheDriver())
+        texts = ["foo bar huzzah", "foo", "foo bar huzzah", ""]
+
+        assert tokenizer.count_tokens_batch(texts) == [tokenizer.count_tokens(text) for text in texts]
+        assert tokenizer.count_tokens_batch(texts) == [5, 1, 5, 0]
@@ -1,5 +1,6 @@
 import pytest
 
+from griptape.drivers import LocalCacheDriver
 from griptape.tokenizers import SimpleTokenizer
 
 
@@ -16,3 +17,11 @@ class TestSimpleTokenizer:
 
     def test_output_tokens_left(self, tokenizer):
         assert tokenizer.count_output_tokens_left("foo bar huzzah") == 4093
+
+    def test_token_count_with_cache_driver(self):
+        cache_driver = LocalCacheDriver()
+
+        assert SimpleTokenizer(characters_per_token=4, cache_driver=cache_driver).count_tokens("hello world") == 3
+        assert SimpleTokenizer(characters_per_token=4, cache_driver=cache_driver).count_tokens("hello world") == 3
+        assert SimpleTokenizer(characters_per_token=1, cache_driver=cache_driver).count_tokens("hello world") == 11
+        assert cache_driver.hits == 1
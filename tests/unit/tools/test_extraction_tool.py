@@ -67,3 +67,11 @@ class TestExtractionTool:
         assert len(result.value) == 2
         assert result.value[0].value == "test1"
         assert result.value[1].value == "mock output"
+
+    def test_csv_extract_content_with_args(self, csv_tool):
+        csv_tool.extraction_engine.prompt_driver.mock_output = "header\nmock output\nmock output"
+        csv_tool.args = {"deduplicate": True}
+
+        result = csv_tool.extract({"values": {"data": "foo"}})
+
+        assert [row.value for row in result.value] == ["test1", "mock output"]
@@ -0,0 +1,99 @@
+import threading
+from concurrent import futures
+
+import pytest
+
+from griptape.utils import ExecutorRegistry, SharedExecutor
+from tests.mocks.mock_event_listener_driver import MockEventListenerDriver
+from tests.mocks.mock_futures_executor import MockFuturesExecutor
+
+
+class TestExecutorRegistry:
+    @pytest.fixture(autouse=True)
+    def registry(self):
+        max_workers = ExecutorRegistry.max_workers.copy()
+        ExecutorRegistry.max_workers["test"] = 2
+
+        yield ExecutorRegistry
+
+        ExecutorRegistry.shutdown()
+        ExecutorRegistry.max_workers = max_workers
+
+    def test_get_executor(self, registry):
+        executor = registry.get_executor("test")
+
+        assert isinstance(executor, SharedExecutor)
+        assert executor.max_workers == 2
+        assert registry.get_executor("test") is executor
+        assert registry.get_executor().name == "io"
+
+    def test_get_executor_not_registered(self, registry):
+        with pytest.raises(ValueError, match="Executor foo is not registered."):
+            registry.get_executor("foo")
+
+    def test_metrics(self, registry):
+        executor = registry.get_executor("test")
+        release = threading.Event()
+        blocked = [executor.submit(release.wait) for _ in range(3)]
+
+        while executor.metrics.active_count < 2:
+            threading.Event().wait(0.01)
+        metrics = registry.metrics()["test"]
+
+        assert metrics.max_workers == 2
+        assert metrics.thread_count == 2
+        assert metrics.active_count == 2
+        assert metrics.queue_depth == 1
+        assert metrics.completed_count == 0
+
+        release.set()
+        futures.wait(blocked)
+
+        assert executor.metrics.completed_count == 3
+        assert executor.metrics.active_count == 0
+        assert executor.metrics.queue_depth == 0
+
+    def test_nested_submit_when_saturated(self, registry):
+        executor = registry.get_executor("test")
+
+        def outer(i):
+            # Every thread is taken by an outer callable, so inner callables can only run inline
+            return [executor.submit(lambda j=j: i * j).result(timeout=5) for j in range(3)]
+
+        results = [executor.submit(outer, i) for i in range(2)]
+
+        assert [future.result(timeout=5) for future in results] == [[0, 0, 0], [0, 1, 2]]
+
+    def test_submit_exception(self, registry):
+        def fail():
+            raise ValueError("foo")
+
+        with pytest.raises(ValueError, match="foo"):
+            registry.get_executor("test").submit(fail).result()
+
+    def test_executor_shutdown_is_noop(self, registry):
+        executor = registry.get_executor("test")
+
+        with executor:
+            pass
+
+        assert executor.submit(lambda: "foo").result() == "foo"
+
+    def test_shutdown(self, registry, mocker):
+        io_executor = registry.get_executor("io")
+        events_executor = registry.get_executor("events")
+        test_executor = registry.get_executor("test")
+        shutdowns = []
+        for executor in (events_executor, io_executor, test_executor):
+            mocker.patch.object(executor, "_shutdown", side_effect=lambda e=executor, **_: shutdowns.append(e.name))
+
+        registry.shutdown()
+
+        assert shutdowns[-1] == "events"
+        assert set(shutdowns) == {"io", "events", "test"}
+        assert registry.metrics() == {}
+        assert registry.get_executor("test") is not test_executor
+
+    def test_default_executors(self, registry):
+        assert MockFuturesExecutor().futures_executor is registry.get_executor("io")
+        assert MockEventListenerDriver().futures_executor is registry.get_executor("events")